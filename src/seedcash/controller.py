@@ -176,6 +176,7 @@ class Controller(Singleton):
 
         # Other behavior constants
         controller.screensaver_activation_ms = 3 * 60 * 1000  # three mintues
+        controller.screensaver_sleep_ms = 10 * 60 * 1000  # in screensaver until display sleeps
 
         background_import_thread = BackgroundImportThread()
         background_import_thread.start()
@@ -0,0 +1,546 @@
+#!/usr/bin/env python
+"""
+Benchmarks of the display pipeline, run headless against the virtual display:
+
+    python -m seedcash.gui.benchmark --save-baseline baseline.json
+    python -m seedcash.gui.benchmark --baseline baseline.json
+
+Each benchmark reports, per frame, the time spent rendering (drawing, diffing and
+queueing on the CPU), converting to RGB565 and transferring over SPI (simulated
+at --spi-hz), the resulting frames/sec if those steps ran back to back, and the
+bytes sent per interaction.
+
+With --baseline, any metric that got worse than the stored value by more than
+--tolerance is reported and the exit code is 1. Byte counts and transfer times
+are deterministic; timings are only comparable on the same machine.
+
+Without --baseline, the default display and SPI clock are compared against
+benchmark_baseline.json next to this module. It only holds the deterministic
+metrics, so it applies on any machine; after a change that is meant to alter
+them, regenerate it with:
+
+    python -m seedcash.gui.benchmark --portable --save-baseline \
+        src/seedcash/gui/benchmark_baseline.json
+
+After each benchmark the virtual display must show exactly what is on the
+Renderer's canvas; any that doesn't is reported as a MISMATCH and the exit code
+is 1.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from seedcash.hardware.displays.virtual import install_mock_hardware
+
+# Must precede any import of the display drivers or buttons
+install_mock_hardware()
+
+from PIL import Image, ImageDraw
+
+from seedcash.gui.renderer import Renderer
+from seedcash.hardware.buttons import HardwareButtons, HardwareButtonsConstants
+from seedcash.hardware.displays.framebuffer import RGB565Framebuffer
+from seedcash.models.settings import Settings
+from seedcash.models.settings_definition import SettingsConstants
+
+logger = logging.getLogger(__name__)
+
+
+# Metrics compared against the baseline; higher is worse for all of them
+COMPARED_METRICS = ["render_ms", "convert_ms", "transfer_ms", "bytes_per_interaction"]
+
+# The ones that don't depend on the machine running the benchmarks
+PORTABLE_METRICS = ["transfer_ms", "bytes_per_interaction"]
+
+# Baseline of the portable metrics for the default --display and --spi-hz
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    frames: int
+    interactions: int
+    render_ms: float
+    convert_ms: float
+    transfer_ms: float
+    bytes_per_interaction: int
+
+    @property
+    def fps(self) -> float:
+        frame_ms = self.render_ms + self.convert_ms + self.transfer_ms
+        return 1000 / frame_ms if frame_ms else 0.0
+
+    def to_dict(self) -> dict:
+        return {metric: getattr(self, metric) for metric in COMPARED_METRICS}
+
+
+class ScriptExhausted(Exception):
+    pass
+
+
+class ScriptedButtons(HardwareButtons):
+    """
+    Replays a fixed sequence of key presses instead of reading the GPIO pins.
+
+    Keys the current screen isn't waiting for are skipped; once the script runs
+    out, `wait_for()` raises ScriptExhausted to end the screen.
+    """
+
+    def __init__(self):
+        self.script = deque()
+        self.override_ind = False
+        self.cur_input = None
+        self.last_input_time = int(time.time() * 1000)
+
+    def wait_for(self, keys=[]) -> int:
+        while self.script:
+            key = self.script.popleft()
+            if key in keys:
+                self.update_last_input_time()
+                return key
+        raise ScriptExhausted()
+
+    def check_for_low(self, key: int = None, keys: List[int] = None) -> bool:
+        return False
+
+    def has_any_input(self) -> bool:
+        return False
+
+
+class TimedFramebuffer(RGB565Framebuffer):
+    """
+    RGB565Framebuffer that accumulates the time spent converting.
+    """
+
+    convert_time = 0.0
+
+    def update(self, image, region=None, rotation=0):
+        start = time.perf_counter()
+        try:
+            return super().update(image, region, rotation)
+        finally:
+            TimedFramebuffer.convert_time += time.perf_counter() - start
+
+
+class DisplayBenchmark:
+    def __init__(self, display_config: str, spi_speed_hz: int):
+        Settings.get_instance().set_value(
+            SettingsConstants.SETTING__DISPLAY_CONFIGURATION, display_config
+        )
+        Renderer.configure_instance()
+        self.renderer: Renderer = Renderer.get_instance()
+
+        self.display = self.renderer.disp.display
+        self.display.spi.max_speed_hz = spi_speed_hz
+        self.display.framebuffer.__class__ = TimedFramebuffer
+        self.spi_speed_hz = spi_speed_hz
+
+        # Benchmarks whose last frame didn't match the canvas
+        self.mismatches: List[str] = []
+
+        self.buttons = ScriptedButtons()
+        HardwareButtons._instance = self.buttons
+
+        # Count the frames the Renderer is asked to show. Each one is flushed before
+        # the next, so the writer thread never coalesces them and the bytes sent
+        # don't depend on timing.
+        self.frames = 0
+        show_image = self.renderer.show_image
+
+        def counting_show_image(*args, **kwargs):
+            self.frames += 1
+            show_image(*args, **kwargs)
+            self.renderer.writer.flush()
+
+        self.renderer.show_image = counting_show_image
+
+        # A blit is a display update of its own
+        blit = self.renderer.blit
+
+        def counting_blit(*args, **kwargs):
+            self.frames += 1
+            blit(*args, **kwargs)
+
+        self.renderer.blit = counting_blit
+
+        show_image_pan = self.renderer.show_image_pan
+
+        def counting_show_image_pan(image, start_x, start_y, end_x, end_y, rate, *args):
+            steps = max(abs(end_x - start_x), abs(end_y - start_y)) // rate
+            frames = self.frames
+            try:
+                return show_image_pan(
+                    image, start_x, start_y, end_x, end_y, rate, *args
+                )
+            finally:
+                # A hardware-scrolled pan goes through show_image(); don't count
+                # its steps twice.
+                self.frames = frames + steps
+
+        self.renderer.show_image_pan = counting_show_image_pan
+
+    def measure(
+        self, name: str, scenario: Callable[[], int], repeat: int = 1
+    ) -> BenchmarkResult:
+        """
+        Run `scenario` (which returns its number of interactions) `repeat` times.
+        """
+        self.renderer.writer.flush()
+        self.renderer.invalidate_frame()
+        self.frames = 0
+        TimedFramebuffer.convert_time = 0.0
+        self.display.spi.reset_stats()
+
+        interactions = 0
+        start = time.perf_counter()
+        for _ in range(repeat):
+            interactions += scenario()
+            self.renderer.writer.flush()
+        wall = time.perf_counter() - start
+
+        if not self.display_matches_canvas():
+            self.mismatches.append(name)
+
+        frames = max(self.frames, 1)
+        convert = TimedFramebuffer.convert_time
+        return BenchmarkResult(
+            name=name,
+            frames=self.frames,
+            interactions=interactions,
+            render_ms=round((wall - convert) / frames * 1000, 3),
+            convert_ms=round(convert / frames * 1000, 3),
+            transfer_ms=round(self.display.spi.bus_time / frames * 1000, 3),
+            bytes_per_interaction=self.display.spi.bytes_written
+            // max(interactions, 1),
+        )
+
+    def display_matches_canvas(self) -> bool:
+        """
+        Whether the virtual display shows the Renderer's canvas, at RGB565 color
+        depth. Catches partial updates, e.g. after a hardware scroll, that leave
+        stale pixels behind.
+        """
+        expected = RGB565Framebuffer(self.display.width, self.display.height)
+        expected.update(self.renderer.canvas)
+        return expected.buffer == self.display.shown_framebuffer().buffer
+
+    def run_screen(self, screen_cls, keys: List[int], **kwargs) -> int:
+        """
+        Display a screen and play `keys` on it. The initial render counts as one
+        interaction.
+        """
+        self.buttons.script = deque(keys)
+        try:
+            screen_cls(**kwargs).display()
+        except ScriptExhausted:
+            pass
+        return len(keys) + 1
+
+    def benchmarks(self) -> Dict[str, Callable[[], BenchmarkResult]]:
+        from seedcash.gui.components import SeedCashIconsConstants
+        from seedcash.gui.screens.load_seed_screens import QRCodeScreen
+        from seedcash.gui.screens.screen import (
+            ButtonListScreen,
+            ButtonOption,
+            KeyboardScreen,
+            MainMenuScreen,
+        )
+
+        renderer = self.renderer
+        width, height = renderer.canvas_width, renderer.canvas_height
+
+        def full_frames():
+            for i in range(10):
+                renderer.draw.rectangle((0, 0, width, height), fill=(i * 20, 40, 80))
+                renderer.show_image()
+            return 10
+
+        def partial_frames():
+            for i in range(20):
+                renderer.draw.rectangle((10, 10, 60, 30), fill=(0, 0, 0))
+                renderer.draw.text((10, 10), f"{i:04d}", fill=(255, 255, 255))
+                renderer.show_image()
+            return 20
+
+        pan_image = Image.new("RGB", (width * 2, height))
+        ImageDraw.Draw(pan_image).ellipse((0, 0, width * 2, height), fill="orange")
+
+        def pan():
+            renderer.show_image_pan(pan_image, 0, 0, width, 0, rate=8)
+            return 1
+
+        vertical_pan_image = Image.new("RGB", (width, height * 2))
+        ImageDraw.Draw(vertical_pan_image).ellipse(
+            (0, 0, width, height * 2), fill="orange"
+        )
+
+        def vertical_pan():
+            renderer.show_image_pan(vertical_pan_image, 0, 0, 0, height, rate=8)
+            return 1
+
+        up, down = HardwareButtonsConstants.KEY_UP, HardwareButtonsConstants.KEY_DOWN
+        right = HardwareButtonsConstants.KEY_RIGHT
+        press = HardwareButtonsConstants.KEY_PRESS
+
+        return {
+            "show_image_full": lambda: self.measure("show_image_full", full_frames),
+            "show_image_partial": lambda: self.measure(
+                "show_image_partial", partial_frames
+            ),
+            "show_image_pan": lambda: self.measure("show_image_pan", pan),
+            "show_image_pan_vertical": lambda: self.measure(
+                "show_image_pan_vertical", vertical_pan
+            ),
+            "main_menu": lambda: self.measure(
+                "main_menu",
+                lambda: self.run_screen(
+                    MainMenuScreen,
+                    [right, down, up, right, down],
+                    button_data=[
+                        ButtonOption("Load seed", SeedCashIconsConstants.LOAD_SEED),
+                        ButtonOption(
+                            "Generate seed", SeedCashIconsConstants.GENERATE_SEED
+                        ),
+                    ],
+                ),
+            ),
+            "button_list": lambda: self.measure(
+                "button_list",
+                lambda: self.run_screen(
+                    ButtonListScreen,
+                    [down] * 11 + [up] * 11,
+                    button_data=[ButtonOption(f"Option {i}") for i in range(12)],
+                ),
+            ),
+            "button_list_scrolled": lambda: self.measure(
+                "button_list_scrolled",
+                lambda: self.run_screen(
+                    ButtonListScreen,
+                    [down] * 11,
+                    # Labels that differ enough for the hardware scroll to pay off
+                    button_data=[
+                        ButtonOption(f"{'Option ' * (i % 3 + 1)}{i}") for i in range(12)
+                    ],
+                ),
+            ),
+            "keyboard_entry": lambda: self.measure(
+                "keyboard_entry",
+                lambda: self.run_screen(
+                    KeyboardScreen,
+                    [right, right, press, down, press, right, right, press] * 2,
+                    title="Passphrase",
+                    rows=4,
+                    cols=7,
+                    keys_charset="abcdefghijklmnopqrstuvwxyz",
+                    show_save_button=True,
+                ),
+            ),
+            "qr_code": lambda: self.measure(
+                "qr_code",
+                lambda: self.run_screen(
+                    QRCodeScreen,
+                    [HardwareButtonsConstants.KEY_LEFT, right] * 2,
+                    qr_data="bitcoincash:qr95sy3j9xwd2ap32xkykttr4cvcu7as4y0qverfuy",
+                ),
+                repeat=3,
+            ),
+        }
+
+
+def convert_benchmarks(repeat: int = 20) -> List[BenchmarkResult]:
+    """
+    Full-frame writes through each panel driver, on mock SPI.
+    """
+    from seedcash.hardware.displays.ili9341 import ILI9341
+    from seedcash.hardware.displays.ili9486 import ILI9486
+    from seedcash.hardware.displays.st7789_mpy import ST7789 as ST7789_mpy
+    from seedcash.hardware.displays.ST7789 import ST7789
+
+    drivers = {
+        "convert_st7789_240x240": lambda: ST7789(),
+        "convert_st7789_320x240": lambda: ST7789_mpy(width=240, height=320),
+        "convert_ili9341": lambda: ILI9341(),
+        "convert_ili9486": lambda: ILI9486(),
+        "convert_ili9486_18bit": lambda: ILI9486(shift_register=False),
+    }
+
+    results = []
+    for name, make_driver in drivers.items():
+        display = make_driver()
+        spi = getattr(display, "_spi", None) or display.spi
+        if getattr(display, "framebuffer", None):
+            display.framebuffer.__class__ = TimedFramebuffer
+        image = Image.new(
+            "RGB",
+            getattr(display, "_window_size", None) or (display.width, display.height),
+        )
+        ImageDraw.Draw(image).ellipse((0, 0) + image.size, fill="purple")
+
+        TimedFramebuffer.convert_time = 0.0
+        spi.reset_stats()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            display.show_image(image, 0, 0)
+        wall = time.perf_counter() - start
+
+        # Drivers without a framebuffer convert inline
+        convert = TimedFramebuffer.convert_time or wall
+        results.append(
+            BenchmarkResult(
+                name=name,
+                frames=repeat,
+                interactions=repeat,
+                render_ms=round((wall - convert) / repeat * 1000, 3),
+                convert_ms=round(convert / repeat * 1000, 3),
+                transfer_ms=round(spi.bus_time / repeat * 1000, 3),
+                bytes_per_interaction=spi.bytes_written // repeat,
+            )
+        )
+    return results
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: dict,
+    tolerance: float,
+    min_delta_ms: float = 0.0,
+):
+    """
+    Return a description of each metric that regressed against `baseline`.
+    """
+    regressions = []
+    for result in results:
+        if result.name not in baseline:
+            continue
+        for metric, value in result.to_dict().items():
+            previous = baseline[result.name].get(metric)
+            if previous is None:
+                continue
+            # Tiny timings are mostly noise; give them an absolute allowance too
+            allowance = previous * tolerance
+            if metric.endswith("_ms"):
+                allowance += min_delta_ms
+            if value > previous + allowance:
+                regressions.append(
+                    f"{result.name}.{metric}: {value} (baseline {previous})"
+                )
+    return regressions
+
+
+def main(sys_argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the display pipeline on the virtual display"
+    )
+    parser.add_argument(
+        "--display",
+        default="virtual_240x240",
+        help="Virtual display configuration, e.g. virtual_320x240 (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--spi-hz",
+        type=int,
+        default=40_000_000,
+        help="Simulated SPI clock (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-b", "--benchmark", action="append", help="Only run the named benchmark(s)"
+    )
+    parser.add_argument(
+        "--baseline",
+        help="JSON file of results to compare against (default: the committed "
+        "baseline, for the default --display and --spi-hz); '' to compare nothing",
+    )
+    parser.add_argument("--save-baseline", help="Write the results to this JSON file")
+    parser.add_argument(
+        "--portable",
+        action="store_true",
+        help="Only save the metrics that don't depend on the machine",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.5,
+        help="Timing changes below this are never regressions (default: %(default)s)",
+    )
+
+    args = parser.parse_args(sys_argv)
+    if args.baseline is None and (
+        args.display == parser.get_default("display")
+        and args.spi_hz == parser.get_default("spi_hz")
+    ):
+        args.baseline = DEFAULT_BASELINE
+    logging.basicConfig(level=logging.WARNING)
+
+    benchmark = DisplayBenchmark(args.display, args.spi_hz)
+    results = []
+    for name, run in benchmark.benchmarks().items():
+        if not args.benchmark or name in args.benchmark:
+            results.append(run())
+    for result in convert_benchmarks():
+        if not args.benchmark or result.name in args.benchmark:
+            results.append(result)
+    benchmark.renderer.writer.stop()
+
+    print(
+        f"{'benchmark':<24}{'frames':>7}{'fps':>8}{'render':>9}{'convert':>9}"
+        f"{'transfer':>10}{'bytes/int':>11}"
+    )
+    for result in results:
+        print(
+            f"{result.name:<24}{result.frames:>7}{result.fps:>8.1f}"
+            f"{result.render_ms:>9.2f}{result.convert_ms:>9.2f}"
+            f"{result.transfer_ms:>10.2f}{result.bytes_per_interaction:>11}"
+        )
+
+    for name in benchmark.mismatches:
+        print(f"MISMATCH {name}: the display doesn't show the canvas")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as baseline_file:
+            metrics = PORTABLE_METRICS if args.portable else COMPARED_METRICS
+            json.dump(
+                {
+                    result.name: {
+                        metric: value
+                        for metric, value in result.to_dict().items()
+                        if metric in metrics
+                    }
+                    for result in results
+                },
+                baseline_file,
+                indent=4,
+            )
+            baseline_file.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(
+                results, json.load(baseline_file), args.tolerance, args.min_delta_ms
+            )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+
+    if benchmark.mismatches:
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
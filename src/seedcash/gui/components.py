@@ -1,16 +1,22 @@
+import bisect
 import logging
 import math
 import os
 import pathlib
+import string
+import threading
 import time
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from gettext import gettext as _
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
-from seedcash.gui.renderer import Renderer
+from seedcash.gui.renderer import Animation, Renderer
 
+from seedcash.models.settings import Settings
+from seedcash.models.settings_definition import SettingsConstants
 from seedcash.models.singleton import Singleton
 from seedcash.models.threads import BaseThread
 
@@ -224,6 +230,227 @@ class Fonts(Singleton):
         return cls.fonts[font_name][size]
 
 
+class TextRasterCache:
+    """
+    Bounded LRU cache of laid out and rendered TextAreas, so that the same label
+    (e.g. "Back", a title or a button label) is only reflowed and rasterized once
+    rather than on every screen visit. Entries are accounted by the size of their
+    rendered image, up to `max_bytes` in total.
+
+    Rendered text depends on the locale and the display, so the cache empties
+    itself whenever either changes.
+    """
+
+    max_bytes = 2 * 1024 * 1024
+
+    _entries: "OrderedDict[tuple, Tuple[dict, int]]" = OrderedDict()
+    _size = 0
+    _context = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _check_context(cls):
+        renderer = Renderer.get_instance()
+        context = (
+            Settings.get_instance().get_value(
+                SettingsConstants.SETTING__LOCALE, default_if_none=True
+            ),
+            renderer.display_type,
+            renderer.canvas_width,
+            renderer.canvas_height,
+        )
+        if context != cls._context:
+            cls._entries.clear()
+            cls._size = 0
+            cls._context = context
+
+    @classmethod
+    def get(cls, key: tuple) -> Optional[dict]:
+        with cls._lock:
+            cls._check_context()
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            cls._entries.move_to_end(key)
+            return entry[0]
+
+    @classmethod
+    def put(cls, key: tuple, layout: dict, image: Image.Image):
+        size = image.width * image.height * len(image.getbands())
+        if size > cls.max_bytes:
+            return
+
+        with cls._lock:
+            cls._check_context()
+            if key in cls._entries:
+                cls._size -= cls._entries.pop(key)[1]
+            cls._entries[key] = (layout, size)
+            cls._size += size
+            while cls._size > cls.max_bytes:
+                cls._size -= cls._entries.popitem(last=False)[1][1]
+
+
+class WordWidths:
+    """
+    Advance widths of words, measured once per font and size, for estimating where
+    to break lines without laying out every candidate line.
+    """
+
+    # Words to remember per font and size before starting over
+    MAX_WORDS = 4096
+
+    _widths = {}
+
+    @classmethod
+    def get(cls, font_name: str, font_size: int, word: str) -> float:
+        widths = cls._widths.setdefault((font_name, font_size), {})
+        width = widths.get(word)
+        if width is None:
+            if len(widths) >= cls.MAX_WORDS:
+                widths.clear()
+            width = Fonts.get_font(font_name, font_size).getlength(word)
+            if not ImageFont.core.HAVE_RAQM:
+                # Fudge factor for imprecise width calcs w/out libraqm
+                width *= 1.05
+            widths[word] = width
+        return width
+
+
+class GlyphAtlas:
+    """
+    Glyphs of the fixed-width fonts, rasterized once per font and size, so that
+    addresses, keyboard keys and bit strings are composited from plain bitmap
+    pastes instead of being laid out and rendered by FreeType on every render.
+
+    Every glyph in the atlas sits inside its own fixed advance, so glyphs pasted
+    side by side at integer coordinates give exactly what `ImageDraw.text()`
+    draws. Anything the atlas can't reproduce (other fonts, characters outside
+    `CHARSET`, fractional coordinates or other anchors) is drawn the usual way.
+    """
+
+    FONT_NAMES = (
+        GUIConstants.FIXED_WIDTH_FONT_NAME,
+        GUIConstants.FIXED_WIDTH_EMPHASIS_FONT_NAME,
+    )
+
+    # Covers the base32 cashaddr, base58 and hex alphabets, digits and a-z
+    CHARSET = string.digits + string.ascii_lowercase + string.ascii_uppercase + ":."
+
+    # Composited lines to remember per font and size before starting over
+    MAX_LINES = 256
+
+    # (font_name, size): (advance, ascent, {char: (mask, (x, y))}, {text: line})
+    _atlases = {}
+
+    @classmethod
+    def _get_atlas(cls, font_name: str, font_size: int) -> tuple:
+        atlas = cls._atlases.get((font_name, font_size))
+        if atlas is None:
+            font = Fonts.get_font(font_name, font_size)
+            advance = font.getlength("0")
+            glyphs = {}
+            if advance == int(advance):
+                advance = int(advance)
+                for char in cls.CHARSET:
+                    left, top, right, bottom = font.getbbox(char, anchor="ls")
+                    if font.getlength(char) != advance or left < 0 or right > advance:
+                        # Not strictly monospaced; leave it to FreeType
+                        continue
+                    mask = Image.new("L", (right - left, bottom - top))
+                    ImageDraw.Draw(mask).text(
+                        (-left, -top), char, fill=255, font=font, anchor="ls"
+                    )
+                    glyphs[char] = (mask, (left, top))
+            atlas = (advance, font.getmetrics()[0], glyphs, {})
+            cls._atlases[(font_name, font_size)] = atlas
+        return atlas
+
+    @classmethod
+    def _get_line(cls, atlas: tuple, text: str):
+        """
+        Composite `text` into a single mask. Returns the mask and its offset from
+        the "ls" anchor point, None if there is nothing to draw, or False if the
+        atlas doesn't have all of its glyphs.
+        """
+        advance, ascent, glyphs, lines = atlas
+        line = lines.get(text, False)
+        if line is not False:
+            return line
+
+        placed = []
+        for i, char in enumerate(text):
+            if char == " ":
+                continue
+            glyph = glyphs.get(char)
+            if glyph is None:
+                return False
+            mask, (x, y) = glyph
+            placed.append((mask, i * advance + x, y))
+
+        line = None
+        if placed:
+            x0 = min(x for mask, x, y in placed)
+            y0 = min(y for mask, x, y in placed)
+            x1 = max(x + mask.width for mask, x, y in placed)
+            y1 = max(y + mask.height for mask, x, y in placed)
+            line_mask = Image.new("L", (x1 - x0, y1 - y0))
+            for mask, x, y in placed:
+                line_mask.paste(mask, (x - x0, y - y0))
+            line = (line_mask, (x0, y0))
+
+        if len(lines) >= cls.MAX_LINES:
+            lines.clear()
+        lines[text] = line
+        return line
+
+    @classmethod
+    def draw_text(
+        cls,
+        image_draw: ImageDraw.ImageDraw,
+        xy: Tuple[int, int],
+        text: str,
+        fill,
+        font_name: str,
+        font_size: int,
+        anchor: str = "la",
+    ):
+        """
+        Drop-in for `image_draw.text(xy, text, fill=fill, font=..., anchor=anchor)`
+        that pastes the text from the atlas whenever it can.
+        """
+        x, y = xy
+        line = False
+        if (
+            font_name in cls.FONT_NAMES
+            and anchor in ("la", "ls", "ma", "ms")
+            and x == int(x)
+            and y == int(y)
+        ):
+            atlas = cls._get_atlas(font_name, font_size)
+            line = cls._get_line(atlas, text)
+
+        if line is False:
+            image_draw.text(
+                xy,
+                text,
+                fill=fill,
+                font=Fonts.get_font(font_name, font_size),
+                anchor=anchor,
+            )
+            return
+
+        if line is None:
+            return
+
+        advance, ascent, glyphs, lines = atlas
+        mask, (offset_x, offset_y) = line
+        if anchor[0] == "m":
+            x = math.floor(x - advance * len(text) / 2)
+        if anchor[1] == "a":
+            y += ascent
+        image_draw.bitmap((int(x) + offset_x, int(y) + offset_y), mask, fill=fill)
+
+
 class TextDoesNotFitException(Exception):
     pass
 
@@ -240,8 +467,9 @@ class BaseComponent:
         self.canvas_width = self.renderer.canvas_width
         self.canvas_height = self.renderer.canvas_height
 
-        # Component threads will be managed in their parent's `Screen.display()`
-        self.threads: list[BaseThread] = []
+        # Component threads and Animations will be managed in their parent's
+        # `Screen.display()`
+        self.threads: list[Union[BaseThread, Animation]] = []
 
         if not self.image_draw:
             self.set_image_draw(self.renderer.draw)
@@ -303,6 +531,23 @@ class TextArea(BaseComponent):
         False  # If True, characters that render below the baseline (e.g. "pqgy") will not affect the final height calculation
     )
 
+    # Everything `_layout_text()` works out; shared through the TextRasterCache
+    LAYOUT_ATTRS = (
+        "line_spacing",
+        "text_height_above_baseline",
+        "text_height_below_baseline",
+        "text_y",
+        "text_offset_y",
+        "text_lines",
+        "text_width",
+        "visible_width",
+        "height",
+        "is_text_centered",
+        "is_horizontal_scrolling_enabled",
+        "supersampling_factor",
+        "rendered_text_img",
+    )
+
     def __post_init__(self):
         if self.is_horizontal_scrolling_enabled and self.auto_line_break:
             raise Exception(
@@ -328,6 +573,50 @@ class TextArea(BaseComponent):
         if self.screen_x + self.width > self.canvas_width:
             self.width = self.canvas_width - self.screen_x
 
+        # Identical labels are laid out and rasterized only once
+        layout_key = (
+            self.text,
+            self.width,
+            self.height,
+            self.font_name,
+            self.font_size,
+            self.font_color,
+            self.background_color,
+            self.edge_padding,
+            self.min_text_x,
+            self.is_text_centered,
+            self.supersampling_factor,
+            self.auto_line_break,
+            self.allow_text_overflow,
+            self.treat_chars_as_words,
+            self.is_horizontal_scrolling_enabled,
+            self.height_ignores_below_baseline,
+        )
+        layout = TextRasterCache.get(layout_key)
+        if layout is None:
+            self._layout_text()
+            layout = {attr: getattr(self, attr) for attr in TextArea.LAYOUT_ATTRS}
+            TextRasterCache.put(layout_key, layout, self.rendered_text_img)
+        else:
+            self.__dict__.update(layout)
+
+        self.horizontal_scroll_animation: TextArea.HorizontalTextScrollAnimation = None
+        if self.is_horizontal_scrolling_enabled:
+            self.horizontal_scroll_animation = TextArea.HorizontalTextScrollAnimation(
+                rendered_text_img=self.rendered_text_img,
+                screen_x=self.screen_x + self.min_text_x,
+                screen_y=self.screen_y + self.text_y - self.text_height_above_baseline,
+                visible_width=self.visible_width,
+                horizontal_scroll_speed=self.horizontal_scroll_speed,
+                begin_hold_secs=self.horizontal_scroll_begin_hold_secs,
+                end_hold_secs=self.horizontal_scroll_end_hold_secs,
+            )
+
+    def _layout_text(self):
+        """
+        Break the text into lines, size the TextArea to them and render the text
+        into `rendered_text_img`.
+        """
         self.line_spacing = GUIConstants.BODY_LINE_SPACING
 
         # Calculate the actual font height from the "baseline" anchor ("_s")
@@ -533,24 +822,16 @@ class TextArea(BaseComponent):
             # At this point we need the visible_width to be the "actual" (yet still incorrect) width
             self.visible_width = int(self.visible_width * 0.95)
 
-        self.horizontal_text_scroll_thread: TextArea.HorizontalTextScrollThread = None
-        if self.is_horizontal_scrolling_enabled:
-            self.horizontal_text_scroll_thread = TextArea.HorizontalTextScrollThread(
-                rendered_text_img=self.rendered_text_img,
-                screen_x=self.screen_x + self.min_text_x,
-                screen_y=self.screen_y + self.text_y - self.text_height_above_baseline,
-                visible_width=self.visible_width,
-                horizontal_scroll_speed=self.horizontal_scroll_speed,
-                begin_hold_secs=self.horizontal_scroll_begin_hold_secs,
-                end_hold_secs=self.horizontal_scroll_end_hold_secs,
-            )
 
-    class HorizontalTextScrollThread(BaseThread):
+    class HorizontalTextScrollAnimation(Animation):
         """
-        Note that Components in general should not try to manage the Renderer.lock; we
-        leave that up to the calling Screen to manage. HOWEVER, since this renders in its
-        own thread, we lose all normal timing guarantees and therefore this thread must
-        manage the lock itself.
+        Scrolls text that doesn't fit back and forth, pausing at either end. Driven by
+        the Renderer's AnimationScheduler, which holds the Renderer.lock around each
+        tick, so the calling Screen doesn't need to coordinate with it.
+
+        Subjective opinion: on a Pi Zero, scrolling at 40px/sec looks smooth but
+        50px/sec creates a slight ghosting / doubling effect that impedes
+        readability. 45px/sec is better but still perceptually a bit stuttery.
         """
 
         def __init__(
@@ -563,7 +844,6 @@ class TextArea(BaseComponent):
             begin_hold_secs: float,
             end_hold_secs: float,
         ):
-            super().__init__()
             self.rendered_text_img = rendered_text_img
             self.screen_x = screen_x
             self.screen_y = screen_y
@@ -571,6 +851,7 @@ class TextArea(BaseComponent):
             self.horizontal_scroll_speed = horizontal_scroll_speed
             self.begin_hold_secs = begin_hold_secs
             self.end_hold_secs = end_hold_secs
+            self.max_scroll = rendered_text_img.width - visible_width
 
             self.scroll_y = 0
             self.scrolling_active = True
@@ -579,6 +860,13 @@ class TextArea(BaseComponent):
                 1  # flip to negative to scroll text to the right
             )
 
+            # The current position still has to be drawn
+            self.needs_render = True
+
+            # No movement until this time.monotonic() while paused at either end
+            self.hold_until = 0
+            self.last_render_time = None
+
             self.renderer = Renderer.get_instance()
 
         def stop_scrolling(self):
@@ -589,85 +877,76 @@ class TextArea(BaseComponent):
             self.horizontal_scroll_position = 0
             self.scroll_increment_sign = 1
             self.scrolling_active = True
+            self.needs_render = True
+            self.hold_until = 0
 
-        def run(self):
-            """
-            Subjective opinion: on a Pi Zero, scrolling at 40px/sec looks smooth but
-            50px/sec creates a slight ghosting / doubling effect that impedes
-            readability. 45px/sec is better but still perceptually a bit stuttery.
-            """
-            max_scroll = self.rendered_text_img.width - self.visible_width
-
-            while self.keep_running:
-                if not self.scrolling_active:
-                    time.sleep(0.1)
-                    continue
-
-                with self.renderer.lock:
-                    if not self.scrolling_active:
-                        # We were stopped while waiting for the lock
-                        continue
+        def tick(self, now: float) -> Optional[List[Tuple[int, int, int, int]]]:
+            if not self.scrolling_active or now < self.hold_until:
+                return None
 
-                    img = self.rendered_text_img.crop(
-                        (
-                            self.horizontal_scroll_position,
-                            0,
-                            self.horizontal_scroll_position + self.visible_width,
-                            self.rendered_text_img.height,
-                        )
-                    )
-                    self.renderer.canvas.paste(
-                        img, (self.screen_x, self.screen_y - self.scroll_y)
+            if not self.needs_render:
+                if not self.last_render_time:
+                    # First frame when pulling off either end will move 1 pixel; have to
+                    # "get off zero" for the real increment calc logic to kick in.
+                    scroll_position_increment = 1 * self.scroll_increment_sign
+                else:
+                    scroll_position_increment = int(
+                        self.horizontal_scroll_speed
+                        * (now - self.last_render_time)
+                        * self.scroll_increment_sign
                     )
-                    self.renderer.show_image()
 
-                if self.horizontal_scroll_position == 0:
-                    # Pause on initial (left-justified) position...
-                    time.sleep(self.begin_hold_secs)
-
-                    # Don't count those pause seconds
-                    last_render_time = None
+                if abs(scroll_position_increment) == 0:
+                    # Wait to accumulate more time before scrolling
+                    return None
 
-                    # Scroll the text left
-                    self.scroll_increment_sign = 1
+                self.horizontal_scroll_position += scroll_position_increment
+                self.horizontal_scroll_position = max(
+                    0, min(self.horizontal_scroll_position, self.max_scroll)
+                )
+                self.last_render_time = now
 
-                elif self.horizontal_scroll_position == max_scroll:
-                    # ...and slight pause at end of scroll
-                    time.sleep(self.end_hold_secs)
+            img = self.rendered_text_img.crop(
+                (
+                    self.horizontal_scroll_position,
+                    0,
+                    self.horizontal_scroll_position + self.visible_width,
+                    self.rendered_text_img.height,
+                )
+            )
+            self.renderer.canvas.paste(
+                img, (self.screen_x, self.screen_y - self.scroll_y)
+            )
+            self.needs_render = False
 
-                    # Don't count those pause seconds
-                    last_render_time = None
+            if self.horizontal_scroll_position == 0:
+                # Pause on initial (left-justified) position...
+                self.hold_until = now + self.begin_hold_secs
 
-                    # Scroll the text right
-                    self.scroll_increment_sign = -1
+                # Don't count those pause seconds
+                self.last_render_time = None
 
-                else:
-                    # No need to CPU limit when running in its own thread?
-                    time.sleep(0.02)
+                # Scroll the text left
+                self.scroll_increment_sign = 1
 
-                next_render_time = time.time()
+            elif self.horizontal_scroll_position == self.max_scroll:
+                # ...and slight pause at end of scroll
+                self.hold_until = now + self.end_hold_secs
 
-                if not last_render_time:
-                    # First frame when pulling off either end will move 1 pixel; have to
-                    # "get off zero" for the real increment calc logic to kick in.
-                    scroll_position_increment = 1 * self.scroll_increment_sign
-                else:
-                    scroll_position_increment = int(
-                        self.horizontal_scroll_speed
-                        * (next_render_time - last_render_time)
-                        * self.scroll_increment_sign
-                    )
+                # Don't count those pause seconds
+                self.last_render_time = None
 
-                if abs(scroll_position_increment) > 0:
-                    self.horizontal_scroll_position += scroll_position_increment
-                    self.horizontal_scroll_position = max(
-                        0, min(self.horizontal_scroll_position, max_scroll)
-                    )
+                # Scroll the text right
+                self.scroll_increment_sign = -1
 
-                    last_render_time = next_render_time
-                else:
-                    # Wait to accumulate more time before scrolling
-                    pass
+            return [
+                (
+                    self.screen_x,
+                    self.screen_y - self.scroll_y,
+                    self.screen_x + img.width,
+                    self.screen_y - self.scroll_y + img.height,
+                )
+            ]
 
     def render(self):
         """
@@ -700,8 +979,8 @@ class TextArea(BaseComponent):
     def set_scroll_y(self, scroll_y: int):
         """Used by ButtonListScreen"""
         self.scroll_y = scroll_y
-        if self.horizontal_text_scroll_thread:
-            self.horizontal_text_scroll_thread.scroll_y = scroll_y
+        if self.horizontal_scroll_animation:
+            self.horizontal_scroll_animation.scroll_y = scroll_y
 
 
 @dataclass
@@ -721,11 +1000,11 @@ class ScrollableTextLine(TextArea):
 
     @property
     def needs_scroll(self) -> bool:
-        return self.horizontal_text_scroll_thread is not None
+        return self.horizontal_scroll_animation is not None
 
     @property
-    def scroll_thread(self) -> TextArea.HorizontalTextScrollThread:
-        return self.horizontal_text_scroll_thread
+    def scroll_animation(self) -> TextArea.HorizontalTextScrollAnimation:
+        return self.horizontal_scroll_animation
 
 
 @dataclass
@@ -941,9 +1220,8 @@ class FormattedAddress(BaseComponent):
             self.width = self.renderer.canvas_width
 
         self.font = Fonts.get_font(self.font_name, self.font_size)
-        self.accent_font = Fonts.get_font(
-            GUIConstants.FIXED_WIDTH_EMPHASIS_FONT_NAME, self.font_size
-        )
+        self.accent_font_name = GUIConstants.FIXED_WIDTH_EMPHASIS_FONT_NAME
+        self.accent_font = Fonts.get_font(self.accent_font_name, self.font_size)
 
         # Fixed width font means we only have to measure one max-height character
         left, top, right, bottom = self.font.getbbox("Q")
@@ -962,7 +1240,7 @@ class FormattedAddress(BaseComponent):
                     (addr_lines_x, cur_y),
                     display_str.split()[0],
                     self.font_accent_color,
-                    self.accent_font,
+                    self.accent_font_name,
                 )
             )
             self.text_params.append(
@@ -970,7 +1248,7 @@ class FormattedAddress(BaseComponent):
                     (addr_lines_x + char_width * n, cur_y),
                     "...",
                     self.font_base_color,
-                    self.font,
+                    self.font_name,
                 )
             )
             self.text_params.append(
@@ -978,7 +1256,7 @@ class FormattedAddress(BaseComponent):
                     (addr_lines_x + char_width * (n + 3), cur_y),
                     display_str.split()[2],
                     self.font_accent_color,
-                    self.accent_font,
+                    self.accent_font_name,
                 )
             )
             cur_y += char_height
@@ -1003,7 +1281,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x, cur_y),
                             cur_str.split()[0],
                             self.font_accent_color,
-                            self.accent_font,
+                            self.accent_font_name,
                         )
                     )
                     self.text_params.append(
@@ -1011,7 +1289,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x + char_width * (n + 1), cur_y),
                             cur_str.split()[1],
                             self.font_base_color,
-                            self.font,
+                            self.font_name,
                         )
                     )
 
@@ -1022,7 +1300,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x, cur_y),
                             cur_str.split()[0],
                             self.font_base_color,
-                            self.font,
+                            self.font_name,
                         )
                     )
                     self.text_params.append(
@@ -1030,7 +1308,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x + char_width * (len(cur_str) - (n)), cur_y),
                             cur_str.split()[1],
                             self.font_accent_color,
-                            self.accent_font,
+                            self.accent_font_name,
                         )
                     )
 
@@ -1042,7 +1320,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x, cur_y),
                             cur_str[: -1 * n - 3] + "...",
                             self.font_base_color,
-                            self.font,
+                            self.font_name,
                         )
                     )
                     self.text_params.append(
@@ -1050,7 +1328,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x + char_width * (len(cur_str) - (n)), cur_y),
                             self.address[-1 * n :],
                             self.font_accent_color,
-                            self.accent_font,
+                            self.accent_font_name,
                         )
                     )
                     cur_y += char_height
@@ -1063,7 +1341,7 @@ class FormattedAddress(BaseComponent):
                             (addr_lines_x, cur_y),
                             cur_str,
                             self.font_base_color,
-                            self.font,
+                            self.font_name,
                         )
                     )
 
@@ -1073,9 +1351,15 @@ class FormattedAddress(BaseComponent):
         self.height = cur_y
 
     def render(self):
+        # Composited from pre-rasterized glyphs rather than laid out every time
         for p in self.text_params:
-            self.image_draw.text(
-                (p[0][0], p[0][1] + self.screen_y), text=p[1], fill=p[2], font=p[3]
+            GlyphAtlas.draw_text(
+                self.image_draw,
+                (p[0][0], p[0][1] + self.screen_y),
+                text=p[1],
+                fill=p[2],
+                font_name=p[3],
+                font_size=self.font_size,
             )
 
 
@@ -1334,6 +1618,16 @@ class Button(BaseComponent):
             self.inactive_button_label = None
             self.inactive_button_label_kwargs = button_kwargs.copy()
 
+    @property
+    def region(self) -> Tuple[int, int, int, int]:
+        """The (x0, y0, x1, y1) area of the canvas that `render()` draws over"""
+        return (
+            self.screen_x,
+            self.screen_y - self.scroll_y,
+            self.screen_x + self.width + 1,
+            self.screen_y + self.height - self.scroll_y + 1,
+        )
+
     def render(self):
         if self.is_selected:
             background_color = self.selected_color
@@ -1360,14 +1654,16 @@ class Button(BaseComponent):
         if self.text is not None:
             if not self.is_scrollable_text:
                 # Just directly render the text for the current active/inactive state
-                self.image_draw.text(
+                GlyphAtlas.draw_text(
+                    self.image_draw,
                     (
                         self.screen_x + self.text_x,
                         self.screen_y + self.text_y - self.scroll_y,
                     ),
                     self.text,
                     fill=font_color,
-                    font=self.font,
+                    font_name=self.font_name,
+                    font_size=self.font_size,
                     anchor=self.text_anchor,
                 )
 
@@ -1381,22 +1677,24 @@ class Button(BaseComponent):
                         )
 
                         if self.active_button_label.needs_scroll:
-                            self.threads.append(self.active_button_label.scroll_thread)
-                            self.active_button_label.scroll_thread.start()
+                            self.threads.append(
+                                self.active_button_label.scroll_animation
+                            )
+                            self.active_button_label.scroll_animation.start()
 
                     self.active_button_label.set_scroll_y(self.scroll_y)
                     self.active_button_label.render()
 
                     if self.active_button_label.needs_scroll:
                         # Activate the scrollable text line
-                        self.active_button_label.scroll_thread.start_scrolling()
+                        self.active_button_label.scroll_animation.start_scrolling()
 
                 else:
                     if (
                         self.active_button_label
                         and self.active_button_label.needs_scroll
                     ):
-                        self.active_button_label.scroll_thread.stop_scrolling()
+                        self.active_button_label.scroll_animation.stop_scrolling()
 
                     if not self.inactive_button_label:
                         # Just-in-time create the inactive button label
@@ -1573,7 +1871,7 @@ class TopNav(BaseComponent):
             if self.title.needs_scroll:
                 # Add the scroll thread to TopNav's self.threads so it automatically runs
                 # for the life of the Component.
-                self.threads.append(self.title.scroll_thread)
+                self.threads.append(self.title.scroll_animation)
 
     @property
     def selected_button(self):
@@ -1675,47 +1973,6 @@ def reflow_text_for_width(
 
     else:
         # Have to calc how to break text into multiple lines
-        def _binary_len_search(min_index, max_index, word_spacer):
-            # Try the middle of the range
-            index = math.ceil((max_index + min_index) / 2)
-            if index == 0:
-                # Handle edge case where there's only one word in the last line
-                index = 1
-
-            # Measure rendered width from "left" anchor (anchor="l_")
-            (left, top, right, px_below_baseline) = font.getbbox(
-                word_spacer.join(words[0:index]), anchor="ls"
-            )
-            line_width = right - left
-
-            if not ImageFont.core.HAVE_RAQM:
-                # Fudge factor for imprecise width calcs w/out libraqm
-                line_width = int(line_width * 1.05)
-
-            if line_width >= width:
-                # Candidate line is still too long. Restrict search range down.
-                if min_index + 1 == index:
-                    if index == 1:
-                        # It's just one long, unbreakable word. There's no good
-                        # solution here. Just accept it as is and let it render off
-                        # the edges.
-                        return (index, line_width, px_below_baseline)
-                    else:
-                        # There's still room to back down the min_index in the next
-                        # round.
-                        index -= 1
-                return _binary_len_search(
-                    min_index=min_index, max_index=index, word_spacer=word_spacer
-                )
-            elif index == max_index:
-                # We have converged
-                return (index, line_width, px_below_baseline)
-            else:
-                # Candidate line is possibly shorter than necessary.
-                return _binary_len_search(
-                    min_index=index, max_index=max_index, word_spacer=word_spacer
-                )
-
         if (
             len(text.split()) == 1
             and not allow_text_overflow
@@ -1726,7 +1983,20 @@ def reflow_text_for_width(
                 "Text cannot fit in target rect with this font+size"
             )
 
-        # Now we're ready to go line-by-line into our line break binary search!
+        def _measure(line_text):
+            # Measure rendered width from "left" anchor (anchor="l_")
+            (left, top, right, px_below_baseline) = font.getbbox(line_text, anchor="ls")
+            line_width = right - left
+
+            if not ImageFont.core.HAVE_RAQM:
+                # Fudge factor for imprecise width calcs w/out libraqm
+                line_width = int(line_width * 1.05)
+            return line_width, px_below_baseline
+
+        # An estimate can be off from the rendered width by the side bearings of the
+        # line's first and last glyphs; never rule out a break closer than this.
+        tolerance = font_size / 2
+
         for line in text.split("\n"):
             if treat_chars_as_words:
                 # Each char in `line` will be considered a word; lets us make line breaks
@@ -1749,15 +2019,34 @@ def reflow_text_for_width(
             if not words:
                 # It's a blank line
                 _add_text_line("", 0, 0)
-            else:
-                while words:
-                    (index, tw, px_below_baseline) = _binary_len_search(
-                        0, len(words), word_spacer=word_spacer
-                    )
-                    _add_text_line(
-                        word_spacer.join(words[0:index]), tw, px_below_baseline
-                    )
-                    words = words[index:]
+                continue
+
+            # ends[i] - ends[j] - spacer_width estimates the width of words[j:i]
+            spacer_width = WordWidths.get(font_name, font_size, word_spacer)
+            ends = [0.0]
+            for word in words:
+                ends.append(
+                    ends[-1] + WordWidths.get(font_name, font_size, word) + spacer_width
+                )
+
+            start = 0
+            while start < len(words):
+                # The most words whose estimated width fits...
+                limit = width + tolerance + ends[start] + spacer_width
+                end = max(start + 1, bisect.bisect_left(ends, limit) - 1)
+
+                # ...then back off while the rendered line doesn't. The longest line
+                # that fits wins; a single word that doesn't is accepted as is and
+                # will render off the edges.
+                line_text = word_spacer.join(words[start:end])
+                line_width, px_below_baseline = _measure(line_text)
+                while line_width >= width and end > start + 1:
+                    end -= 1
+                    line_text = word_spacer.join(words[start:end])
+                    line_width, px_below_baseline = _measure(line_text)
+
+                _add_text_line(line_text, line_width, px_below_baseline)
+                start = end
 
     return text_lines
 
@@ -1,9 +1,15 @@
 from dataclasses import dataclass
 from PIL import Image, ImageDraw
-from typing import Tuple
+from typing import List, Optional, Tuple
 from gettext import gettext as _
 
-from seedcash.gui.components import Fonts, GUIConstants, SeedCashIconsConstants
+from seedcash.gui.components import (
+    Fonts,
+    GlyphAtlas,
+    GUIConstants,
+    SeedCashIconsConstants,
+)
+from seedcash.gui.renderer import Renderer
 from seedcash.hardware.buttons import HardwareButtonsConstants
 
 
@@ -29,6 +35,10 @@ class Keyboard:
     ENTER_LEFT = "enter_left"
     ENTER_RIGHT = "enter_right"
 
+    # Rendered key images per keyboard look; see `get_key_sprite()`
+    MAX_SPRITE_LAYOUTS = 8
+    _key_sprites = {}
+
     REGULAR_KEY_FONT = "regular"
     ICON_KEY_FONT = GUIConstants.ICON_FONT_NAME__SEEDCASH
 
@@ -121,15 +131,59 @@ class Keyboard:
                 self.code = self.letter
 
         def render_key(self):
-            font = self.keyboard.font
-            text_height = self.keyboard.text_height
+            """
+            Returns the (x0, y0, x1, y1) box of the canvas the key was drawn in, or
+            None if its label may extend past it.
+            """
+            sprite = self.keyboard.get_key_sprite(self)
+            if sprite is not None:
+                self.keyboard.canvas.paste(sprite, (self.screen_x, self.screen_y))
+                return (
+                    self.screen_x,
+                    self.screen_y,
+                    self.screen_x + sprite.width,
+                    self.screen_y + sprite.height,
+                )
+            else:
+                self.draw_key(self.keyboard.draw, self.screen_x, self.screen_y)
+                return None
+
+        def get_font(self) -> Tuple[str, int, int]:
+            """
+            Returns the font name, font size and text height of the key's label.
+            """
             if self.is_additional_key:
                 if (
                     Keyboard.ADDITIONAL_KEYS[self.code]["font"]
                     == Keyboard.ICON_KEY_FONT
                 ):
-                    font = self.keyboard.icon_key_font
-                    text_height = self.keyboard.icon_key_height
+                    return (
+                        Keyboard.ICON_KEY_FONT,
+                        self.keyboard.icon_key_font_size,
+                        self.keyboard.icon_key_height,
+                    )
+            return (
+                self.keyboard.font_name,
+                self.keyboard.font_size,
+                self.keyboard.text_height,
+            )
+
+        def get_text_xy(self, x: int, y: int, text_height: int) -> Tuple[int, int]:
+            """
+            Returns the "ms" anchor point of the label for a key drawn at (x, y).
+            """
+            return (
+                x + int(self.keyboard.key_width * self.size / 2),
+                y
+                + self.keyboard.key_height
+                - int((self.keyboard.key_height - text_height) / 2),
+            )
+
+        def draw_key(self, draw: ImageDraw, x: int, y: int):
+            """
+            Draws the key in its current state with its top left corner at (x, y).
+            """
+            font_name, font_size, text_height = self.get_font()
 
             outline_color = "#333"
             if not self.is_active:
@@ -153,28 +207,25 @@ class Keyboard:
                     rect_color = self.keyboard.background_color
                     font_color = "#e8e8e8"
 
-            self.keyboard.draw.rounded_rectangle(
+            draw.rounded_rectangle(
                 (
-                    self.screen_x,
-                    self.screen_y,
-                    self.screen_x + self.keyboard.key_width * self.size - 1,
-                    self.screen_y + self.keyboard.key_height,
+                    x,
+                    y,
+                    x + self.keyboard.key_width * self.size - 1,
+                    y + self.keyboard.key_height,
                 ),
                 outline=outline_color,
                 fill=rect_color,
                 radius=4,
             )
 
-            self.keyboard.draw.text(
-                (
-                    self.screen_x + int(self.keyboard.key_width * self.size / 2),
-                    self.screen_y
-                    + self.keyboard.key_height
-                    - int((self.keyboard.key_height - text_height) / 2),
-                ),
+            GlyphAtlas.draw_text(
+                draw,
+                self.get_text_xy(x, y, text_height),
                 self.letter,
                 fill=font_color,
-                font=font,
+                font_name=font_name,
+                font_size=font_size,
                 anchor="ms",
             )
 
@@ -192,16 +243,29 @@ class Keyboard:
         auto_wrap=[WRAP_TOP, WRAP_BOTTOM, WRAP_LEFT, WRAP_RIGHT],
         render_now=True,
         highlight_color: str = GUIConstants.ACCENT_COLOR,
+        canvas: Image = None,
     ):
         """
         `auto_wrap` specifies which edges the keyboard is allowed to loop back when
         navigating past the end.
+
+        `canvas` is the Image behind `draw`; defaults to the Renderer's canvas.
         """
         self.draw = draw
+        if canvas is None:
+            canvas = Renderer.get_instance().canvas
+        self.canvas = canvas
+
+        # Canvas boxes of the keys redrawn by the last `update_from_input()`; None if
+        # a key's label may extend past its box.
+        self.rendered_key_regions: Optional[List[Tuple[int, int, int, int]]] = None
+
         self.charset = charset
         self.rows = rows
         self.cols = cols
         self.rect = rect
+        self.font_name = font_name
+        self.font_size = font_size
         self.font = Fonts.get_font(font_name, font_size)
 
         self.auto_wrap = auto_wrap
@@ -226,7 +290,10 @@ class Keyboard:
 
         # Set up the rendering and state params
         self.active_keys = list(self.charset)
-        self.icon_key_font = Fonts.get_font(GUIConstants.ICON_FONT_NAME__SEEDCASH, 26)
+        self.icon_key_font_size = 26
+        self.icon_key_font = Fonts.get_font(
+            GUIConstants.ICON_FONT_NAME__SEEDCASH, self.icon_key_font_size
+        )
 
         # Fixed-width fonts will all have same height, ignoring below baseline (e.g. "Q" or "q")
         (left, top, right, bottom) = self.font.getbbox("X", anchor="ls")
@@ -247,6 +314,22 @@ class Keyboard:
         self.height = rows * (self.key_height) + (rows - 1) * self.y_gap
         self.additional_key_entered_from_x = None
 
+        # Keyboards with the same look share their key sprites
+        layout = (
+            font_name,
+            font_size,
+            self.key_width,
+            self.key_height,
+            self.background_color,
+            self.deactivated_background_color,
+            self.highlight_color,
+        )
+        if layout not in Keyboard._key_sprites:
+            if len(Keyboard._key_sprites) >= Keyboard.MAX_SPRITE_LAYOUTS:
+                Keyboard._key_sprites.clear()
+            Keyboard._key_sprites[layout] = {}
+        self.key_sprites = Keyboard._key_sprites[layout]
+
         # Two-dimensional list of Key obj row data
         self.keys = []
         self.selected_key = {"x": 0, "y": 0}  # Indices in the `keys` 2D list
@@ -304,6 +387,44 @@ class Keyboard:
             # Render the initial highlighted character
             self.update_from_input(input=None)
 
+    def get_key_sprite(self, key: Key) -> Image:
+        """
+        Returns the pre-rendered image of `key` in its current state, rendering it
+        on first use. Returns None if the key's label doesn't fit within the key,
+        in which case the key has to be drawn directly.
+        """
+        sprite_key = (
+            key.code,
+            key.letter,
+            key.size,
+            key.is_additional_key,
+            key.is_active,
+            key.is_selected,
+        )
+        if sprite_key in self.key_sprites:
+            return self.key_sprites[sprite_key]
+
+        # Keys are drawn over the keyboard's cleared (black) background
+        sprite = Image.new("RGB", (self.key_width * key.size, self.key_height + 1))
+
+        font_name, font_size, text_height = key.get_font()
+        x, y = key.get_text_xy(0, 0, text_height)
+        left, top, right, bottom = Fonts.get_font(font_name, font_size).getbbox(
+            key.letter, anchor="ms"
+        )
+        if (
+            x + left < 0
+            or y + top < 0
+            or x + right > sprite.width
+            or y + bottom > sprite.height
+        ):
+            sprite = None
+        else:
+            key.draw_key(ImageDraw.Draw(sprite), 0, 0)
+
+        self.key_sprites[sprite_key] = sprite
+        return sprite
+
     def update_active_keys(self, active_keys):
         self.active_keys = active_keys
         for i, row_keys in enumerate(self.keys):
@@ -416,7 +537,7 @@ class Keyboard:
 
         # Before we update, undo our previously self.selected_key key
         key.is_selected = False
-        key.render_key()
+        self.rendered_key_regions = [key.render_key()]
 
         if input == HardwareButtonsConstants.KEY_RIGHT:
             self.selected_key["x"] = key.index_x + key.size
@@ -494,10 +615,28 @@ class Keyboard:
         # Render the newly self.selected_key letter
         key = self.get_key_at(self.selected_key["x"], self.selected_key["y"])
         key.is_selected = True
-        key.render_key()
+        self.rendered_key_regions.append(key.render_key())
+        if None in self.rendered_key_regions:
+            self.rendered_key_regions = None
 
         return key.code
 
+    def blit_rendered_keys(self) -> bool:
+        """
+        Puts just the keys redrawn by the last `update_from_input()` on the display
+        with `Renderer.blit()`, skipping the full-canvas frame diff; for a selection
+        move that changed nothing else. The caller must hold the Renderer.lock.
+
+        Returns False if that isn't possible, in which case the caller has to
+        `show_image()` as usual.
+        """
+        renderer = Renderer.get_instance()
+        if not self.rendered_key_regions or self.canvas is not renderer.canvas:
+            return False
+
+        renderer.blit(self.rendered_key_regions)
+        return True
+
     def set_selected_key(self, selected_letter):
         # De-select the current selected_key
         self.get_selected_key().is_selected = False
@@ -606,11 +745,13 @@ class TextEntryDisplay(TextEntryDisplayConstants):
                 cursor_block_offset -= end_pos_x - self.width + 1
                 self.text_offset -= end_pos_x - self.width + 1
 
-            draw.text(
+            GlyphAtlas.draw_text(
+                draw,
                 (self.text_offset, self.height - int(text_height / 2)),
                 self.cur_text[:-1],
                 fill=GUIConstants.ACCENT_COLOR,
-                font=self.font,
+                font_name=self.font_name,
+                font_size=self.font_size,
                 anchor="ls",
             )
 
@@ -625,11 +766,13 @@ class TextEntryDisplay(TextEntryDisplayConstants):
                 ),
                 fill=cursor_color,
             )
-            draw.text(
+            GlyphAtlas.draw_text(
+                draw,
                 (cursor_block_offset + 1, self.height - int(text_height / 2)),
                 self.cur_text[-1],
                 fill=GUIConstants.ACCENT_COLOR,
-                font=self.font,
+                font_name=self.font_name,
+                font_size=self.font_size,
                 anchor="ls",
             )
 
@@ -680,11 +823,13 @@ class TextEntryDisplay(TextEntryDisplayConstants):
 
                 cursor_bar_x = self.text_offset + tw_left
 
-            draw.text(
+            GlyphAtlas.draw_text(
+                draw,
                 (self.text_offset, self.height - int((self.height - text_height) / 2)),
                 self.cur_text,
                 fill=self.accent_color,
-                font=self.font,
+                font_name=self.font_name,
+                font_size=self.font_size,
                 anchor="ls",
             )
 
@@ -1,5 +1,10 @@
-from PIL import Image, ImageDraw
-from threading import Lock
+import logging
+import time
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+from threading import Condition, Lock
+from typing import List, Optional, Tuple, Union
 
 # from seedcash.hardware.st7789_mpy import ST7789
 from seedcash.hardware.displays.display_driver import (
@@ -7,25 +12,43 @@ from seedcash.hardware.displays.display_driver import (
     DISPLAY_TYPE__ILI9341,
     DISPLAY_TYPE__ILI9486,
     DISPLAY_TYPE__ST7789,
+    DISPLAY_TYPE__VIRTUAL,
     DisplayDriver,
 )
-from seedcash.hardware.displays.ili9341 import (
-    ILI9341,
-    ILI9341_TFTWIDTH,
-    ILI9341_TFTHEIGHT,
-)
+from seedcash.hardware.displays.framebuffer import region_area
 from seedcash.models.settings import Settings
 from seedcash.models.settings_definition import SettingsConstants
 from seedcash.models.singleton import ConfigurableSingleton
+from seedcash.models.threads import BaseThread
+
+logger = logging.getLogger(__name__)
+
+# (x0, y0, x1, y1) in canvas pixels, exclusive end like PIL boxes
+Region = Tuple[int, int, int, int]
+
+# A region to fill with a solid (r, g, b) color
+Fill = Tuple[Region, Tuple[int, int, int]]
 
 
 class Renderer(ConfigurableSingleton):
+    # Each partial window costs a few command bytes and a DC toggle; regions closer
+    # than this many wasted pixels are sent as one window instead.
+    REGION_MERGE_SLACK = 1024
+
+    # Past this fraction of the canvas a single full-frame write is cheaper
+    FULL_FRAME_THRESHOLD = 0.6
+
+    # Granularity of the frame diff; a changed pixel sends its whole tile
+    DIFF_TILE_SIZE = 16
+
     buttons = None
     canvas_width = 0
     canvas_height = 0
     canvas: Image.Image = None
     draw: ImageDraw.ImageDraw = None
     disp = None
+    writer: "DisplayWriterThread" = None
+    animations: "AnimationScheduler" = None
     lock = Lock()
 
     @classmethod
@@ -41,6 +64,14 @@ class Renderer(ConfigurableSingleton):
         # prevent any other screen writes while we're changing the display driver.
         self.lock.acquire()
 
+        if self.writer:
+            # Let the previous display driver finish its last frame
+            self.writer.flush()
+            self.writer.stop()
+
+        if self.animations:
+            self.animations.stop()
+
         display_config = Settings.get_instance().get_value(
             SettingsConstants.SETTING__DISPLAY_CONFIGURATION, default_if_none=True
         )
@@ -61,7 +92,7 @@ class Renderer(ConfigurableSingleton):
         ):
             self.disp.invert()
 
-        if self.display_type == DISPLAY_TYPE__ST7789:
+        if self.display_type in [DISPLAY_TYPE__ST7789, DISPLAY_TYPE__VIRTUAL]:
             self.canvas_width = self.disp.width
             self.canvas_height = self.disp.height
 
@@ -72,15 +103,218 @@ class Renderer(ConfigurableSingleton):
 
         self.canvas = Image.new("RGB", (self.canvas_width, self.canvas_height))
         self.draw = ImageDraw.Draw(self.canvas)
+        self.dirty_regions: List[Region] = []
+
+        # Copy of what the display currently shows; None when unknown
+        self._last_frame: Optional[np.ndarray] = None
+
+        # (axis, start, end, delta) hinted by scroll() for the next frame
+        self._pending_scroll = None
+
+        self.writer = DisplayWriterThread(
+            self.disp, self.canvas.size, merge_regions=self._merge_regions
+        )
+        self.writer.start()
+
+        self.animations = AnimationScheduler(self)
+        self.animations.start()
 
         self.lock.release()
 
-    def show_image(self, image=None, alpha_overlay=None, show_direct=False):
+    def invalidate_frame(self):
+        """
+        Forget what the display shows, e.g. after writing to `disp` directly, so that
+        the next `show_image()` sends the full frame.
+        """
+        self._last_frame = None
+
+    def mark_dirty(self, region: Region):
+        """
+        Record a damaged area of the canvas to send with the next `show_image()`.
+
+        Once any region is marked, only the marked regions are sent, so callers must
+        mark everything they changed on the canvas.
+        """
+        self.dirty_regions.append(region)
+
+    def _clip(self, region: Region) -> Optional[Region]:
+        """
+        Clip `region` to the canvas; None if nothing of it is left.
+        """
+        x0, y0, x1, y1 = region
+        box = (
+            max(0, x0),
+            max(0, y0),
+            min(self.canvas_width, x1),
+            min(self.canvas_height, y1),
+        )
+        if box[0] >= box[2] or box[1] >= box[3]:
+            return None
+        return box
+
+    def _merge_regions(self, regions: List[Region]) -> Optional[List[Region]]:
+        """
+        Clip `regions` to the canvas and merge the ones that overlap or are close
+        enough that one window is cheaper than two. Returns None if a full-frame
+        write is the better choice.
+        """
+        merged: List[Region] = []
+        for region in regions:
+            box = self._clip(region)
+            if box is None:
+                continue
+
+            # Keep folding the box into any neighbor it is cheaper to merge with
+            i = 0
+            while i < len(merged):
+                other = merged[i]
+                union = (
+                    min(box[0], other[0]),
+                    min(box[1], other[1]),
+                    max(box[2], other[2]),
+                    max(box[3], other[3]),
+                )
+                if (
+                    region_area(union) - region_area(box) - region_area(other)
+                    <= self.REGION_MERGE_SLACK
+                ):
+                    box = union
+                    del merged[i]
+                    i = 0
+                else:
+                    i += 1
+            merged.append(box)
+
+        total_area = sum(region_area(box) for box in merged)
+        if (
+            total_area
+            > self.FULL_FRAME_THRESHOLD * self.canvas_width * self.canvas_height
+        ):
+            return None
+        return merged
+
+    def _diff_regions(
+        self, frame: np.ndarray, last: Optional[np.ndarray]
+    ) -> Optional[List[Region]]:
+        """
+        Compare `frame` to `last`, what the display shows, tile by tile and return
+        the changed areas as a few rectangles. Returns None if a full-frame write is
+        the better choice.
+        """
+        if last is None or last.shape != frame.shape:
+            return None
+
+        height, width, depth = frame.shape
+        tile = self.DIFF_TILE_SIZE
+        rows = -(-height // tile)
+        cols = -(-width // tile)
+
+        # Compare raw bytes per row so the channel axis needs no separate reduction
+        changed = frame.reshape(height, width * depth) != last.reshape(
+            height, width * depth
+        )
+        if rows * tile != height or cols * tile != width:
+            padded = np.zeros((rows * tile, cols * tile * depth), dtype=bool)
+            padded[:height, : width * depth] = changed
+            changed = padded
+        tiles = changed.reshape(rows, tile, cols, tile * depth).any(axis=(1, 3))
+
+        changed_tiles = int(np.count_nonzero(tiles))
+        if not changed_tiles:
+            return []
+        if changed_tiles >= self.FULL_FRAME_THRESHOLD * rows * cols:
+            return None
+
+        # Runs of changed tiles in each tile row; identical runs in consecutive rows
+        # grow into one rectangle.
+        regions: List[Region] = []
+        open_runs = {}
+        for row in range(rows + 1):
+            runs = set()
+            if row < rows:
+                edges = np.flatnonzero(
+                    np.diff(np.concatenate(([0], tiles[row].view(np.int8), [0])))
+                )
+                runs = set(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+            for run in list(open_runs):
+                if run not in runs:
+                    start_row = open_runs.pop(run)
+                    regions.append(
+                        (
+                            run[0] * tile,
+                            start_row * tile,
+                            run[1] * tile,
+                            row * tile,
+                        )
+                    )
+            for run in runs:
+                open_runs.setdefault(run, row)
+
+        return self._merge_regions(regions)
+
+    def _diff_scrolled(
+        self, frame: np.ndarray, regions: Optional[List[Region]], scroll
+    ) -> Optional[List[Region]]:
+        """
+        Diff `frame` against the display contents moved by the pending `scroll`. If
+        that leaves less to send than the plain diff `regions`, scroll the display in
+        hardware and return what is left to send; otherwise return `regions`.
+        """
+        axis, start, end, delta = scroll
+        moved = self._last_frame.copy()
+        if axis == "y":
+            moved[start:end] = np.roll(moved[start:end], -delta, axis=0)
+        else:
+            moved[:, start:end] = np.roll(moved[:, start:end], -delta, axis=1)
+
+        scrolled_regions = self._diff_regions(frame, moved)
+        if self._send_area(scrolled_regions) >= self._send_area(regions):
+            return regions
+
+        if not self.writer.scroll(delta, start, end):
+            # An earlier scroll had to be undone; the display needs a full frame
+            return None
+        return scrolled_regions
+
+    def _send_area(self, regions: Optional[List[Region]]) -> int:
+        if regions is None:
+            return self.canvas_width * self.canvas_height
+        return sum(region_area(box) for box in regions)
+
+    def show_image(
+        self,
+        image=None,
+        alpha_overlay=None,
+        show_direct=False,
+        region: Union[Region, List[Region]] = None,
+    ):
+        """
+        Send the canvas (after pasting `image` and/or `alpha_overlay` onto it) to the
+        display.
+
+        If `region` is given or regions were marked via `mark_dirty()`, only those
+        areas are sent. Otherwise the canvas is diffed against the last transmitted
+        frame and only the changed areas are sent.
+
+        The frame is handed to the display writer thread; this returns before it is
+        on the display.
+        """
         if show_direct:
             # Use the incoming image as the canvas and immediately render
-            self.disp.show_image(image, 0, 0)
+            self.dirty_regions = []
+            self.invalidate_frame()
+            self.writer.submit(image)
             return
 
+        regions = self.dirty_regions or None
+        self.dirty_regions = []
+        scroll, self._pending_scroll = self._pending_scroll, None
+        if region is not None:
+            if region and isinstance(region[0], int):
+                region = [region]
+            regions = (regions or []) + list(region)
+
         if alpha_overlay:
             if image == None:
                 image = self.canvas
@@ -89,8 +323,133 @@ class Renderer(ConfigurableSingleton):
         if image:
             # Always write to the current canvas, rather than trying to replace it
             self.canvas.paste(image)
+            if image.size == self.canvas.size:
+                regions = None
+
+        frame = None
+        if regions is not None:
+            regions = self._merge_regions(regions)
+        else:
+            frame = np.array(self.canvas)
+            regions = self._diff_regions(frame, self._last_frame)
+            if scroll and regions != [] and self._last_frame is not None:
+                regions = self._diff_scrolled(frame, regions, scroll)
+
+        if regions is None:
+            self.writer.submit(self.canvas)
+            self._last_frame = frame if frame is not None else np.array(self.canvas)
+            return
+
+        if regions:
+            self.writer.submit(self.canvas, regions)
+
+        if frame is not None:
+            self._last_frame = frame
+        elif self._last_frame is not None:
+            for x0, y0, x1, y1 in regions:
+                self._last_frame[y0:y1, x0:x1] = np.asarray(
+                    self.canvas.crop((x0, y0, x1, y1))
+                )
+
+    def fill_rect(self, region: Region, color):
+        """
+        Fill `region` of the canvas with a solid `color` and put it on the display
+        right away, bypassing the frame diff: the display fills the window with one
+        repeated pixel, so nothing is converted. For small, simple updates such as
+        cursors, highlight boxes and borders.
+
+        Nothing is sent if the display already shows that color there. Other canvas
+        changes are left for the next `show_image()`.
+        """
+        self.fill_rects([(region, color)])
+
+    def fill_rects(self, fills: List[Fill]):
+        """
+        `fill_rect()` several (region, color) fills as one display update.
+        """
+        todo = []
+        for region, color in fills:
+            box = self._clip(region)
+            if box is None:
+                continue
+            x0, y0, x1, y1 = box
+            if isinstance(color, str):
+                color = ImageColor.getrgb(color)
+            color = tuple(color[:3])
+
+            self.draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=color)
+            if self._last_frame is not None:
+                shown = self._last_frame[y0:y1, x0:x1]
+                if (shown == color).all():
+                    continue
+                shown[...] = color
+            todo.append((box, color))
 
-        self.disp.show_image(self.canvas, 0, 0)
+        if todo:
+            self.writer.run_when_idle(self._fill_regions, todo)
+
+    def _fill_regions(self, fills: List[Fill]):
+        for box, color in fills:
+            self.disp.fill_region(box, color)
+        self.disp.end_frame()
+
+    def blit(self, region: Union[Region, List[Region]]):
+        """
+        Put `region` (or each of a list of regions) of the canvas on the display
+        right away, bypassing the frame diff and the writer thread's copy of the
+        canvas. Blocks until it is sent; for animating a small part of the screen,
+        e.g. a progress indicator or a moved highlight.
+        """
+        if region and isinstance(region[0], int):
+            region = [region]
+        boxes = [box for box in map(self._clip, region) if box is not None]
+        if not boxes:
+            return
+
+        self.writer.run_when_idle(self._show_regions, boxes)
+        if self._last_frame is not None:
+            for x0, y0, x1, y1 in boxes:
+                self._last_frame[y0:y1, x0:x1] = np.asarray(
+                    self.canvas.crop((x0, y0, x1, y1))
+                )
+
+    def _show_regions(self, boxes: List[Region]):
+        for box in boxes:
+            self.disp.show_image(self.canvas, 0, 0, region=box)
+        self.disp.end_frame()
+
+    def scroll(self, dx: int = 0, dy: int = 0, start: int = 0, end: int = None):
+        """
+        Hint that the canvas between `start` and `end` (columns for `dx`, rows for
+        `dy`) is being redrawn moved left/up by `dx`/`dy` pixels.
+
+        The next `show_image()` then also diffs the canvas against the display
+        contents moved that way and, if that leaves less to send, moves them with
+        the display's hardware scrolling so that mostly the newly exposed lines are
+        sent. Regions passed to or marked for it bypass the diff and drop the hint.
+
+        Returns False if the display can't scroll along that axis.
+        """
+        if bool(dx) == bool(dy):
+            return False
+        if dy:
+            axis, delta, extent = "y", dy, self.canvas_height
+        else:
+            axis, delta, extent = "x", dx, self.canvas_width
+        if end is None:
+            end = extent
+        if (
+            self.disp.scroll_axis != axis
+            or not 0 <= start < end <= extent
+            or abs(delta) >= end - start
+        ):
+            return False
+
+        # Consecutive hints for the same band add up
+        if self._pending_scroll and self._pending_scroll[:3] == (axis, start, end):
+            delta += self._pending_scroll[3]
+        self._pending_scroll = (axis, start, end, delta)
+        return True
 
     def show_image_pan(
         self, image, start_x, start_y, end_x, end_y, rate, alpha_overlay=None
@@ -105,6 +464,7 @@ class Renderer(ConfigurableSingleton):
             rate_y = rate_y * -1
 
         while (cur_x != end_x or cur_y != end_y) and (rate_x != 0 or rate_y != 0):
+            prev_x, prev_y = cur_x, cur_y
             cur_x += rate_x
             if (rate_x > 0 and cur_x > end_x) or (rate_x < 0 and cur_x < end_x):
                 # We've moved too far; back up and undo that last move.
@@ -127,10 +487,255 @@ class Renderer(ConfigurableSingleton):
             # Always keep a copy of the current display in the canvas
             self.canvas.paste(crop)
 
-            self.disp.show_image(crop, 0, 0)
+            if self.scroll(dx=cur_x - prev_x, dy=cur_y - prev_y):
+                # Let the display scroll in hardware; mostly the exposed lines are
+                # sent then.
+                self.show_image()
+            else:
+                # Pace the pan by the display rather than dropping frames
+                self.writer.submit(crop, block=True)
+
+        self._last_frame = np.array(self.canvas)
 
     def display_blank_screen(self):
         self.draw.rectangle(
             (0, 0, self.canvas_width, self.canvas_height), outline=0, fill=0
         )
         self.show_image()
+
+
+class DisplayWriterThread(BaseThread):
+    """
+    Sends the frames submitted by the Renderer to the display in the background, so
+    the next frame can be rendered while the current one is still on the SPI bus.
+
+    Frames are double-buffered: a submitted frame is copied into whichever buffer is
+    not being sent. A frame still waiting when the next one arrives is replaced by
+    it (latest frame wins) and the damaged regions of both are combined, so stale
+    intermediate frames are dropped rather than queued.
+    """
+
+    def __init__(self, disp, size: Tuple[int, int], merge_regions=None):
+        super().__init__()
+        self.disp = disp
+        self.merge_regions = merge_regions
+        self._buffers = [Image.new("RGB", size), Image.new("RGB", size)]
+        self._condition = Condition()
+
+        # Indices into _buffers; None when no frame is waiting / being sent
+        self._pending: Optional[int] = None
+        self._sending: Optional[int] = None
+
+        # Regions of the pending frame to send; None for the full frame
+        self._pending_regions: Optional[List[Region]] = None
+
+    def submit(self, image: Image.Image, regions: List[Region] = None, block=False):
+        """
+        Queue `image` (only its `regions`, if given) for the display.
+
+        If `block`, first wait for the previous frame to be picked up instead of
+        replacing it; for producers that pace an animation by the display.
+        """
+        with self._condition:
+            while block and self._pending is not None:
+                self._condition.wait()
+
+            if self._pending is None:
+                self._pending = 1 if self._sending == 0 else 0
+                self._pending_regions = regions
+            elif self._pending_regions is None or regions is None:
+                self._pending_regions = None
+            else:
+                # The buffer always holds the whole latest frame, so any region
+                # that covers both sets is safe to send.
+                self._pending_regions = self._pending_regions + regions
+                if self.merge_regions:
+                    self._pending_regions = self.merge_regions(self._pending_regions)
+
+            self._buffers[self._pending].paste(image)
+            self._condition.notify_all()
+
+    def flush(self):
+        """
+        Block until every submitted frame is on the display.
+        """
+        with self._condition:
+            while self.is_alive() and (
+                self._pending is not None or self._sending is not None
+            ):
+                self._condition.wait()
+
+    def run_when_idle(self, func, *args, **kwargs):
+        """
+        Call `func` once every frame submitted so far is on the display, and hold
+        back any frame submitted meanwhile until it returns; for writing to the
+        display directly, in between frames.
+        """
+        with self._condition:
+            while self.is_alive() and (
+                self._pending is not None or self._sending is not None
+            ):
+                self._condition.wait()
+            return func(*args, **kwargs)
+
+    def scroll(self, delta: int, start: int, end: int) -> bool:
+        """
+        Scroll the display in hardware (see `DisplayDriver.scroll()`) once every
+        frame submitted so far is on it, so frames submitted afterwards are sent
+        to the scrolled display.
+        """
+        return self.run_when_idle(self.disp.scroll, delta, start, end)
+
+    def stop(self):
+        super().stop()
+        with self._condition:
+            self._condition.notify_all()
+
+    def run(self):
+        while self.keep_running:
+            with self._condition:
+                while self.keep_running and self._pending is None:
+                    self._condition.wait()
+                if self._pending is None:
+                    break
+
+                self._sending, self._pending = self._pending, None
+                regions, self._pending_regions = self._pending_regions, None
+                # Wake any producer blocked on the pending slot
+                self._condition.notify_all()
+
+            frame = self._buffers[self._sending]
+            try:
+                if regions is None:
+                    self.disp.show_image(frame, 0, 0)
+                else:
+                    for box in regions:
+                        self.disp.show_image(frame, 0, 0, region=box)
+                self.disp.end_frame()
+            except Exception as e:
+                logger.exception(e)
+            finally:
+                with self._condition:
+                    self._sending = None
+                    self._condition.notify_all()
+
+
+class Animation:
+    """
+    Part of the screen that changes over time, e.g. a scrolling label or a
+    spinner. Rather than running in its own thread, it is driven by the
+    Renderer's `AnimationScheduler`: `start()` registers it and its `tick()` is
+    called on every scheduler tick until `stop()`.
+
+    Has the `start()`, `stop()` and `is_alive()` of a BaseThread, so Screens and
+    components manage it alongside their threads.
+    """
+
+    def start(self):
+        Renderer.get_instance().animations.add(self)
+
+    def stop(self):
+        Renderer.get_instance().animations.remove(self)
+
+    def is_alive(self) -> bool:
+        return self in Renderer.get_instance().animations
+
+    def tick(self, now: float) -> Optional[List[Union[Region, Fill]]]:
+        """
+        Draw the next frame onto the canvas if one is due at `now` (in
+        `time.monotonic()` seconds) and return the regions that changed. Solid
+        rectangles can instead be returned as (region, color) fills, left for the
+        scheduler to draw with `Renderer.fill_rects()`. Called with the
+        Renderer.lock held; must not send anything to the display itself.
+        """
+        raise Exception("Must implement in a child class")
+
+
+class AnimationScheduler(BaseThread):
+    """
+    Drives every started Animation from a single thread at up to `fps` ticks per
+    second. Each tick takes the Renderer.lock once, lets every animation that is
+    due draw onto the canvas, and sends all the regions they changed in one
+    `show_image()`. Solid fills they ask for are sent with `fill_rects()`, which
+    converts nothing. Several animations on a screen therefore cost one display
+    update per tick instead of one each.
+
+    Sleeps while no animation is running.
+    """
+
+    def __init__(self, renderer: Renderer, fps: int = 30):
+        super().__init__()
+        self.renderer = renderer
+        self.interval = 1 / fps
+        self._animations: List[Animation] = []
+        self._condition = Condition()
+
+    def __contains__(self, animation: Animation) -> bool:
+        with self._condition:
+            return animation in self._animations
+
+    def add(self, animation: Animation):
+        with self._condition:
+            if animation not in self._animations:
+                self._animations.append(animation)
+                self._condition.notify_all()
+
+    def remove(self, animation: Animation):
+        """
+        Stop ticking `animation`. Doesn't wait for a tick in progress, so it's safe
+        to call while holding the Renderer.lock (which every tick holds).
+        """
+        with self._condition:
+            if animation in self._animations:
+                self._animations.remove(animation)
+
+    def stop(self):
+        super().stop()
+        with self._condition:
+            self._condition.notify_all()
+
+    def tick(self):
+        with self.renderer.lock:
+            now = time.monotonic()
+            regions: List[Region] = []
+            fills: List[Fill] = []
+            with self._condition:
+                animations = list(self._animations)
+            for animation in animations:
+                if animation not in self:
+                    # Stopped by another thread while waiting for the lock
+                    continue
+                try:
+                    for entry in animation.tick(now) or []:
+                        if isinstance(entry[0], int):
+                            regions.append(entry)
+                        else:
+                            fills.append(entry)
+                except Exception as e:
+                    logger.exception(e)
+                    self.remove(animation)
+
+            if fills:
+                self.renderer.fill_rects(fills)
+            if regions:
+                self.renderer.show_image(region=regions)
+
+    def run(self):
+        next_tick = time.monotonic()
+        while self.keep_running:
+            with self._condition:
+                while self.keep_running and not self._animations:
+                    self._condition.wait()
+                    next_tick = time.monotonic()
+            if not self.keep_running:
+                break
+
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            self.tick()
+
+            # Skip the ticks a slow frame (or waiting for the lock) made us miss
+            # rather than rushing to catch up.
+            next_tick = max(next_tick + self.interval, time.monotonic())
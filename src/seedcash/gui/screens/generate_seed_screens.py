@@ -96,8 +96,10 @@ class SeedCashGenerateSeedScreen(ButtonListScreen, BaseTopNavScreen):
                                 cur_selected_button.screen_y
                                 - next_selected_button.screen_y
                             )
-                            for button in self.buttons:
-                                button.scroll_y -= frame_scroll
+                            self.buttons.scroll(-frame_scroll)
+                            self.renderer.scroll(
+                                dy=-frame_scroll, start=GUIConstants.TOP_NAV_HEIGHT
+                            )
                             self._render_visible_buttons()
                         else:
                             cur_selected_button.render()
@@ -141,8 +143,10 @@ class SeedCashGenerateSeedScreen(ButtonListScreen, BaseTopNavScreen):
                         frame_scroll = (
                             next_selected_button.screen_y - cur_selected_button.screen_y
                         )
-                        for button in self.buttons:
-                            button.scroll_y += frame_scroll
+                        self.buttons.scroll(frame_scroll)
+                        self.renderer.scroll(
+                            dy=frame_scroll, start=GUIConstants.TOP_NAV_HEIGHT
+                        )
                         self._render_visible_buttons()
                     else:
                         if cur_selected_button:
@@ -5,7 +5,7 @@ import time
 from dataclasses import dataclass, field
 from gettext import gettext as _
 from PIL import Image, ImageDraw, ImageColor
-from typing import Any, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from seedcash.gui.components import (
     GUIConstants,
@@ -20,6 +20,7 @@ from seedcash.gui.components import (
     load_image,
 )
 from seedcash.gui.keyboard import Keyboard, TextEntryDisplay
+from seedcash.gui.renderer import Animation, Fill
 from seedcash.hardware.buttons import HardwareButtonsConstants, HardwareButtons
 from seedcash.models.threads import BaseThread
 
@@ -40,8 +41,9 @@ class BaseScreen(BaseComponent):
         self.hw_inputs = HardwareButtons.get_instance()
 
         # Implementation classes can add their own BaseThread to run in parallel with the
-        # main execution thread.
-        self.threads: List[BaseThread] = []
+        # main execution thread, or an Animation for the Renderer's AnimationScheduler
+        # to drive.
+        self.threads: List[Union[BaseThread, Animation]] = []
 
         # Implementation classes can add additional BaseComponent-derived objects to the
         # list. They'll be called to `render()` themselves in BaseScreen._render().
@@ -54,7 +56,7 @@ class BaseScreen(BaseComponent):
         # Tracks position on scrollable pages, determines which elements are visible.
         self.scroll_y = 0
 
-    def get_threads(self) -> List[BaseThread]:
+    def get_threads(self) -> List[Union[BaseThread, Animation]]:
         threads = self.threads.copy()
         for component in self.components:
             threads += component.threads
@@ -133,31 +135,41 @@ class BaseScreen(BaseComponent):
         raise Exception("Must implement in a child class")
 
 
-class LoadingScreenThread(BaseThread):
-    def __init__(self, text: str = None):
-        super().__init__()
-        self.text = text
+class LoadingScreenAnimation(Animation):
+    """
+    Spinner of an orange arc orbiting the logo, advancing one `arc_sweep` every
+    `STEP_SECS`. Clears the screen to draw the logo and `text` on its first tick.
+    """
 
-    def run(self):
-        from seedcash.gui.renderer import Renderer
+    STEP_SECS = 0.05
 
-        renderer: Renderer = Renderer.get_instance()
+    def __init__(self, text: str = None):
+        from seedcash.gui.renderer import Renderer
 
-        center_image = load_image("img/btc_logo_60x60.png")
-        orbit_gap = 2 * GUIConstants.COMPONENT_PADDING
-        bounding_box = (
-            int((renderer.canvas_width - center_image.width) / 2 - orbit_gap),
-            int((renderer.canvas_height - center_image.height) / 2 - orbit_gap),
-            int((renderer.canvas_width + center_image.width) / 2 + orbit_gap),
-            int((renderer.canvas_height + center_image.height) / 2 + orbit_gap),
-        )
-        position = 0
-        arc_sweep = 45
-        arc_color = "#ff9416"
-        arc_trailing_color = "#80490b"
+        self.text = text
+        self.renderer: Renderer = Renderer.get_instance()
+
+        self.bounding_box = None
+        self.position = 0
+        self.arc_sweep = 45
+        self.arc_color = "#ff9416"
+        self.arc_trailing_color = "#80490b"
+        self.next_step_time = None
+
+    def tick(self, now: float) -> Optional[List[Tuple[int, int, int, int]]]:
+        renderer = self.renderer
+
+        if self.bounding_box is None:
+            center_image = load_image("img/btc_logo_60x60.png")
+            orbit_gap = 2 * GUIConstants.COMPONENT_PADDING
+            bounding_box = (
+                int((renderer.canvas_width - center_image.width) / 2 - orbit_gap),
+                int((renderer.canvas_height - center_image.height) / 2 - orbit_gap),
+                int((renderer.canvas_width + center_image.width) / 2 + orbit_gap),
+                int((renderer.canvas_height + center_image.height) / 2 + orbit_gap),
+            )
 
-        # Need to flush the screen
-        with renderer.lock:
+            # Need to flush the screen
             renderer.draw.rectangle(
                 (0, 0, renderer.canvas_width, renderer.canvas_height),
                 fill=GUIConstants.BACKGROUND_COLOR,
@@ -173,37 +185,86 @@ class LoadingScreenThread(BaseThread):
                     screen_y=int((renderer.canvas_height - bounding_box[3]) / 2),
                 ).render()
 
-        while self.keep_running:
-            with renderer.lock:
-                # Render leading arc
-                renderer.draw.arc(
-                    bounding_box,
-                    start=position,
-                    end=position + arc_sweep,
-                    fill=arc_color,
-                    width=GUIConstants.COMPONENT_PADDING,
-                )
+            self.bounding_box = bounding_box
+            self.next_step_time = now
+            return [(0, 0, renderer.canvas_width, renderer.canvas_height)]
+
+        if now < self.next_step_time:
+            return None
+        self.next_step_time = max(self.next_step_time + self.STEP_SECS, now)
+
+        bounding_box = self.bounding_box
+        position = self.position
+        arc_sweep = self.arc_sweep
+
+        # Render leading arc
+        renderer.draw.arc(
+            bounding_box,
+            start=position,
+            end=position + arc_sweep,
+            fill=self.arc_color,
+            width=GUIConstants.COMPONENT_PADDING,
+        )
 
-                # Render trailing arc
-                renderer.draw.arc(
-                    bounding_box,
-                    start=position - arc_sweep,
-                    end=position,
-                    fill=arc_trailing_color,
-                    width=GUIConstants.COMPONENT_PADDING,
-                )
+        # Render trailing arc
+        renderer.draw.arc(
+            bounding_box,
+            start=position - arc_sweep,
+            end=position,
+            fill=self.arc_trailing_color,
+            width=GUIConstants.COMPONENT_PADDING,
+        )
+
+        # Erase previous trailing arc leading arc
+        renderer.draw.arc(
+            bounding_box,
+            start=position - 2 * arc_sweep,
+            end=position - arc_sweep,
+            fill=GUIConstants.BACKGROUND_COLOR,
+            width=GUIConstants.COMPONENT_PADDING,
+        )
+        self.position += arc_sweep
+
+        # Only these three arcs changed
+        return [
+            _arc_region(
+                bounding_box, start, start + arc_sweep, GUIConstants.COMPONENT_PADDING
+            )
+            for start in range(position - 2 * arc_sweep, position + 1, arc_sweep)
+        ]
 
-                # Erase previous trailing arc leading arc
-                renderer.draw.arc(
-                    bounding_box,
-                    start=position - 2 * arc_sweep,
-                    end=position - arc_sweep,
-                    fill=GUIConstants.BACKGROUND_COLOR,
-                    width=GUIConstants.COMPONENT_PADDING,
-                )
 
-                renderer.show_image()
-            position += arc_sweep
+def _arc_region(bounding_box, start: int, end: int, width: int):
+    """
+    Return an (x0, y0, x1, y1) box, exclusive of x1 and y1, that covers what
+    `ImageDraw.arc()` draws for an arc of the given `width` from `start` to `end`
+    degrees in the (inclusive) `bounding_box`.
+    """
+    x0, y0, x1, y1 = bounding_box
+    center_x, center_y = (x0 + x1) / 2, (y0 + y1) / 2
+
+    # The arc's ends and whichever of its extremes it passes through, on both
+    # the outer and the inner edge of its stroke
+    turns = start // 360 * 360
+    start, end = start - turns, end - turns
+    angles = [start, end] + [
+        angle for angle in range(90, 720, 90) if start < angle < end
+    ]
+    xs, ys = [], []
+    for inset in (0, width):
+        radius_x = (x1 - x0) / 2 - inset
+        radius_y = (y1 - y0) / 2 - inset
+        for angle in angles:
+            xs.append(center_x + radius_x * math.cos(math.radians(angle)))
+            ys.append(center_y + radius_y * math.sin(math.radians(angle)))
+
+    # Pad for how PIL rounds the stroke to pixels
+    return (
+        max(x0, math.floor(min(xs)) - 1),
+        max(y0, math.floor(min(ys)) - 1),
+        min(x1 + 1, math.ceil(max(xs)) + 2),
+        min(y1 + 1, math.ceil(max(ys)) + 2),
+    )
 
 
 @dataclass
@@ -288,6 +349,72 @@ class ButtonOption:
     font_size: int = None  # Optional override
 
 
+class LazyButtonList:
+    """
+    The Buttons of a ButtonListScreen, each constructed the first time it's
+    accessed rather than all up front, so that a list opens in the same time no
+    matter how many options it has.
+
+    Buttons that are scrolled far enough off screen are released again with
+    `keep_range()` and rebuilt if they come back into view. `scroll()` keeps the
+    scroll position of the constructed Buttons, and of the ones built later, in
+    step.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        build_button: Callable[[int, int], Button],
+        scroll_y: int = 0,
+    ):
+        # `build_button(index, scroll_y)` constructs the Button at `index`
+        self._count = count
+        self._build_button = build_button
+        self._buttons: Dict[int, Button] = {}
+        self.scroll_y = scroll_y
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Button:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Button index out of range")
+
+        button = self._buttons.get(index)
+        if button is None:
+            button = self._build_button(index, self.scroll_y)
+            self._buttons[index] = button
+        return button
+
+    def __iter__(self):
+        # Note: iterating constructs every Button; prefer `constructed`
+        for index in range(self._count):
+            yield self[index]
+
+    @property
+    def constructed(self) -> List[Button]:
+        """The Buttons that currently exist"""
+        return list(self._buttons.values())
+
+    def scroll(self, dy: int):
+        """Scroll every Button, constructed or not, by `dy` pixels"""
+        self.scroll_y += dy
+        for button in self._buttons.values():
+            button.scroll_y += dy
+
+    def keep_range(self, first: int, last: int):
+        """
+        Release the constructed Buttons outside of indices `first` to `last`
+        (inclusive), stopping any threads they started.
+        """
+        for index in list(self._buttons):
+            if not first <= index <= last:
+                for thread in self._buttons.pop(index).threads:
+                    thread.stop()
+
+
 @dataclass
 class ButtonListScreen(BaseScreen):
     # Class attributes with default values
@@ -373,44 +500,13 @@ class ButtonListScreen(BaseScreen):
                     button_height + GUIConstants.LIST_ITEM_PADDING
                 ) * (self.selected_button - num_buttons_pre_scroll + 1)
 
-        # Create button instances
-        self.buttons: List[Button] = []
-        for i, button_option in enumerate(self.button_data):
-            if type(button_option) != ButtonOption:
-                raise Exception("Button data must use ButtonOption class")
-
-            # Configure button properties
-            button_kwargs = dict(
-                text=_(button_option.button_label),  # Localized button text
-                active_text=_(
-                    button_option.active_button_label
-                ),  # Localized active state text
-                icon_name=button_option.icon_name,  # Optional left icon
-                icon_color=button_option.icon_color or GUIConstants.BUTTON_FONT_COLOR,
-                is_icon_inline=True,
-                right_icon_name=button_option.right_icon_name,  # Optional right icon
-                screen_x=GUIConstants.EDGE_PADDING,  # X position (fixed to left edge)
-                screen_y=button_list_y
-                + i * (button_height + GUIConstants.LIST_ITEM_PADDING),
-                scroll_y=self.scroll_y_initial_offset or 0,  # Initial scroll position
-                width=self.canvas_width - (2 * GUIConstants.EDGE_PADDING),  # Full width
-                height=button_height,
-                is_text_centered=self.is_button_text_centered,
-                font_name=button_option.font_name or self.button_font_name,
-                font_size=button_option.font_size or self.button_font_size,
-                font_color=button_option.button_label_color
-                or GUIConstants.BUTTON_FONT_COLOR,
-                selected_color=self.button_selected_color,
-                is_scrollable_text=True,  # Enables text scrolling for long labels
-            )
-
-            # Add checkmark if this is a checked button
-            if self.checked_buttons and i in self.checked_buttons:
-                button_kwargs["is_checked"] = True
-
-            # Create and store button instance
-            button = self.Button_cls(**button_kwargs)
-            self.buttons.append(button)
+        # Buttons are only constructed once they're needed (see _build_button)
+        self.button_list_y = button_list_y
+        self.buttons = LazyButtonList(
+            len(self.button_data),
+            self._build_button,
+            scroll_y=self.scroll_y_initial_offset or 0,
+        )
 
         # Create scroll arrows if needed
         if self.has_scroll_arrows:
@@ -457,10 +553,50 @@ class ButtonListScreen(BaseScreen):
         cur_selected_button = self.buttons[self.selected_button]
         cur_selected_button.is_selected = True
 
-    def get_threads(self) -> List[BaseThread]:
+    def _build_button(self, i: int, scroll_y: int) -> Button:
+        """Construct the Button for `button_data[i]`"""
+        button_option = self.button_data[i]
+        if type(button_option) != ButtonOption:
+            raise Exception("Button data must use ButtonOption class")
+
+        # Configure button properties
+        button_kwargs = dict(
+            text=_(button_option.button_label),  # Localized button text
+            active_text=_(
+                button_option.active_button_label
+            ),  # Localized active state text
+            icon_name=button_option.icon_name,  # Optional left icon
+            icon_color=button_option.icon_color or GUIConstants.BUTTON_FONT_COLOR,
+            is_icon_inline=True,
+            right_icon_name=button_option.right_icon_name,  # Optional right icon
+            screen_x=GUIConstants.EDGE_PADDING,  # X position (fixed to left edge)
+            screen_y=self.button_list_y
+            + i * (GUIConstants.BUTTON_HEIGHT + GUIConstants.LIST_ITEM_PADDING),
+            scroll_y=scroll_y,  # Current scroll position of the list
+            width=self.canvas_width - (2 * GUIConstants.EDGE_PADDING),  # Full width
+            height=GUIConstants.BUTTON_HEIGHT,
+            is_text_centered=self.is_button_text_centered,
+            font_name=button_option.font_name or self.button_font_name,
+            font_size=button_option.font_size or self.button_font_size,
+            font_color=button_option.button_label_color
+            or GUIConstants.BUTTON_FONT_COLOR,
+            selected_color=self.button_selected_color,
+            is_scrollable_text=True,  # Enables text scrolling for long labels
+        )
+
+        # Add checkmark if this is a checked button
+        if self.checked_buttons and i in self.checked_buttons:
+            button_kwargs["is_checked"] = True
+
+        # Create the button instance; only the current selection is highlighted
+        button = self.Button_cls(**button_kwargs)
+        button.is_selected = i == self.selected_button
+        return button
+
+    def get_threads(self) -> List[Union[BaseThread, Animation]]:
         """Get all active threads including button animation threads"""
         threads = super().get_threads()
-        for button in self.buttons:
+        for button in self.buttons.constructed:
             if button.is_scrollable_text:
                 threads += button.threads
         return threads
@@ -477,27 +613,37 @@ class ButtonListScreen(BaseScreen):
             self._render_up_arrow()
             self._render_down_arrow()
 
-        for i, button in enumerate(self.buttons):
-            # Skip rendering if no scrolling needed
-            if not self.has_scroll_arrows:
+        # Skip the visibility math if no scrolling needed
+        if not self.has_scroll_arrows:
+            for button in self.buttons:
                 button.render()
-                continue
+            return
+
+        # Find the buttons whose visible position is within the visible area
+        pitch = GUIConstants.BUTTON_HEIGHT + GUIConstants.LIST_ITEM_PADDING
+        offset_y = self.buttons.scroll_y - self.button_list_y
+        first = max(0, math.ceil((GUIConstants.TOP_NAV_HEIGHT + offset_y) / pitch))
+        last = min(
+            len(self.buttons) - 1,
+            math.ceil((self.down_arrow_img_y + offset_y) / pitch) - 1,
+        )
 
-            # Calculate button's visible position
-            button_position_y = button.screen_y - button.scroll_y
+        for i in range(first, last + 1):
+            # Hide arrows when reaching list boundaries
+            if i == 0:
+                self._hide_up_arrow()
+            if i == len(self.buttons) - 1:
+                self._hide_down_arrow()
 
-            # Only render if button is within visible area
-            if (
-                button_position_y >= GUIConstants.TOP_NAV_HEIGHT
-                and button_position_y < self.down_arrow_img_y
-            ):
-                # Hide arrows when reaching list boundaries
-                if i == 0:
-                    self._hide_up_arrow()
-                if i == len(self.buttons) - 1:
-                    self._hide_down_arrow()
+            self.buttons[i].render()  # Render visible button
 
-                button.render()  # Render visible button
+        # Keep one row of lookahead on either side ready for the next scroll and
+        # release everything further away.
+        self.buttons.keep_range(first - 1, last + 1)
+        if first > 0:
+            self.buttons[first - 1]
+        if last < len(self.buttons) - 1:
+            self.buttons[last + 1]
 
     def _render_up_arrow(self):
         """Render the scroll up indicator arrow"""
@@ -581,13 +727,17 @@ class ButtonListScreen(BaseScreen):
                         frame_scroll = (
                             cur_selected_button.screen_y - next_selected_button.screen_y
                         )
-                        for button in self.buttons:
-                            button.scroll_y -= frame_scroll
+                        self.buttons.scroll(-frame_scroll)
+                        self.renderer.scroll(
+                            dy=-frame_scroll, start=GUIConstants.TOP_NAV_HEIGHT
+                        )
                         self._render_visible_buttons()
                     else:
                         # Just update the two changed buttons
                         cur_selected_button.render()
                         next_selected_button.render()
+                        self.renderer.mark_dirty(cur_selected_button.region)
+                        self.renderer.mark_dirty(next_selected_button.region)
 
                 elif user_input == HardwareButtonsConstants.KEY_DOWN:
                     # Move selection down
@@ -612,13 +762,17 @@ class ButtonListScreen(BaseScreen):
                         frame_scroll = (
                             next_selected_button.screen_y - cur_selected_button.screen_y
                         )
-                        for button in self.buttons:
-                            button.scroll_y += frame_scroll
+                        self.buttons.scroll(frame_scroll)
+                        self.renderer.scroll(
+                            dy=frame_scroll, start=GUIConstants.TOP_NAV_HEIGHT
+                        )
                         self._render_visible_buttons()
                     else:
                         # Just update the two changed buttons
                         cur_selected_button.render()
                         next_selected_button.render()
+                        self.renderer.mark_dirty(cur_selected_button.region)
+                        self.renderer.mark_dirty(next_selected_button.region)
 
                 elif user_input in HardwareButtonsConstants.KEYS__ANYCLICK:
                     # Return selected button index on click
@@ -848,66 +1002,77 @@ class LargeIconStatusScreen(ButtonListScreen):
             )
 
 
-class WarningEdgesThread(BaseThread):
-    def __init__(self, args):
-        super().__init__()
-        self.args = args
-
-    def run(self):
-        screen = self.args[0]
-        inhale_step = 1
-        inhale_max = 10
-        inhale_hold = 8
-        cur_inhale_hold = 0
-        inhale_factor = 0
-        rgb = ImageColor.getrgb(screen.status_color)
-
-        def render_border(color, width):
-            screen.image_draw.rectangle(
-                (0, 0, screen.canvas_width, screen.canvas_height),
-                fill=None,
-                outline=color,
-                width=width,
-                # radius=5
-            )
+class WarningEdgesAnimation(Animation):
+    """
+    Pulses the edges of `screen` in its `status_color`, "inhaling" from a darker
+    version out to full color, holding, and back again, at ~20 steps per second.
+    """
 
-        try:
-            while self.keep_running:
-                with screen.renderer.lock:
-                    # Ramp the edges from a darker version out to full color
-                    inhale_scalar = inhale_factor * int(255 / inhale_max)
-                    for index, n in enumerate(range(4, -1, -1)):
-                        # Reverse range steadily increases rgb in brightness until reaching full.
-                        # 34 == 0x22; just eyeballed a good step size
-
-                        r = max(0, rgb[0] - 34 * n - inhale_scalar)
-                        g = max(0, rgb[1] - 34 * n - inhale_scalar)
-                        b = max(0, rgb[2] - 34 * n - inhale_scalar)
-
-                        # `index` shrinks the border at each step
-                        render_border((r, g, b), GUIConstants.EDGE_PADDING - 2 - index)
-
-                    # Write the screen updates
-                    screen.renderer.show_image()
-
-                if inhale_factor == inhale_max:
-                    inhale_step = -1
-                elif inhale_factor == 0 and inhale_step == -1:
-                    cur_inhale_hold += 1
-                    if cur_inhale_hold > inhale_hold:
-                        inhale_step = 1
-                        cur_inhale_hold = 0
-                    else:
-                        # It's about to be decremented below zero
-                        inhale_factor = 1
-                inhale_factor += inhale_step
+    STEP_SECS = 0.05
 
-                # Target ~10fps
-                time.sleep(0.05)
+    def __init__(self, screen: "WarningEdgesMixin"):
+        self.screen = screen
+        self.rgb = ImageColor.getrgb(screen.status_color)
+        self.inhale_step = 1
+        self.inhale_max = 10
+        self.inhale_hold = 8
+        self.cur_inhale_hold = 0
+        self.inhale_factor = 0
+        self.next_step_time = 0
 
-        except KeyboardInterrupt as e:
-            self.stop()
-            raise e
+    def band_boxes(self, outer: int, inner: int) -> List[Tuple[int, int, int, int]]:
+        """
+        The edges are nested bands of solid color, laid out as an outline of
+        (0, 0, canvas_width, canvas_height) whose right and bottom edges are just off
+        the canvas. Returns the four boxes of the band from `outer` to `inner`.
+        """
+        right = self.screen.canvas_width + 1
+        bottom = self.screen.canvas_height + 1
+        return [
+            (outer, outer, right - outer, inner),
+            (outer, bottom - inner, right - outer, bottom - outer),
+            (outer, inner, inner, bottom - inner),
+            (right - inner, inner, right - outer, bottom - inner),
+        ]
+
+    def tick(self, now: float) -> Optional[List[Fill]]:
+        if now < self.next_step_time:
+            return None
+        self.next_step_time = now + self.STEP_SECS
+
+        rgb = self.rgb
+        fills = []
+
+        # Ramp the edges from a darker version out to full color
+        inhale_scalar = self.inhale_factor * int(255 / self.inhale_max)
+        for index, n in enumerate(range(4, -1, -1)):
+            # Reverse range steadily increases rgb in brightness until reaching full.
+            # 34 == 0x22; just eyeballed a good step size
+
+            r = max(0, rgb[0] - 34 * n - inhale_scalar)
+            g = max(0, rgb[1] - 34 * n - inhale_scalar)
+            b = max(0, rgb[2] - 34 * n - inhale_scalar)
+
+            # `index` shrinks the border at each step; each band shows out to where
+            # the next, brighter one starts. Solid fills go straight to the display,
+            # and not at all for bands that already show their color.
+            width = GUIConstants.EDGE_PADDING - 2 - index
+            for box in self.band_boxes(width - 1 if n else 0, width):
+                fills.append((box, (r, g, b)))
+
+        if self.inhale_factor == self.inhale_max:
+            self.inhale_step = -1
+        elif self.inhale_factor == 0 and self.inhale_step == -1:
+            self.cur_inhale_hold += 1
+            if self.cur_inhale_hold > self.inhale_hold:
+                self.inhale_step = 1
+                self.cur_inhale_hold = 0
+            else:
+                # It's about to be decremented below zero
+                self.inhale_factor = 1
+        self.inhale_factor += self.inhale_step
+
+        return fills
 
 
 @dataclass
@@ -919,7 +1084,7 @@ class WarningEdgesMixin:
     def __post_init__(self):
         super().__post_init__()
 
-        self.threads.append(WarningEdgesThread(args=(self,)))
+        self.threads.append(WarningEdgesAnimation(self))
 
 
 @dataclass
@@ -1213,8 +1378,10 @@ class KeyboardScreen(BaseTopNavScreen):
 
                 elif input in HardwareButtonsConstants.KEYS__LEFT_RIGHT_UP_DOWN:
                     # Live joystick movement; haven't locked this new letter in yet.
-                    # Leave current spot blank for now.
-                    pass
+                    # Leave current spot blank for now. Only the two keys changed, so
+                    # send just those.
+                    if self.keyboard.blit_rendered_keys():
+                        continue
 
                 # Render the text entry display and cursor block
                 self.text_entry_display.render(self.user_input)
@@ -1309,8 +1476,10 @@ class SeedCashButtonListWithNav(BaseTopNavScreen, ButtonListScreen):
                                 cur_selected_button.screen_y
                                 - next_selected_button.screen_y
                             )
-                            for button in self.buttons:
-                                button.scroll_y -= frame_scroll
+                            self.buttons.scroll(-frame_scroll)
+                            self.renderer.scroll(
+                                dy=-frame_scroll, start=GUIConstants.TOP_NAV_HEIGHT
+                            )
                             self._render_visible_buttons()
                         else:
                             cur_selected_button.render()
@@ -1354,8 +1523,10 @@ class SeedCashButtonListWithNav(BaseTopNavScreen, ButtonListScreen):
                         frame_scroll = (
                             next_selected_button.screen_y - cur_selected_button.screen_y
                         )
-                        for button in self.buttons:
-                            button.scroll_y += frame_scroll
+                        self.buttons.scroll(frame_scroll)
+                        self.renderer.scroll(
+                            dy=frame_scroll, start=GUIConstants.TOP_NAV_HEIGHT
+                        )
                         self._render_visible_buttons()
                     else:
                         if cur_selected_button:
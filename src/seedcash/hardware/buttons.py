@@ -1,4 +1,5 @@
 import logging
+import threading
 from typing import List
 import RPi.GPIO as GPIO
 import time
@@ -173,6 +174,46 @@ class HardwareButtons(Singleton):
         return False
 
 
+    def wait_for_any_input(self, event: threading.Event) -> bool:
+        """
+        Block until any key is pressed, sleeping on GPIO edge interrupts rather than
+        polling. `event` is set on the first press; other threads can set it to end
+        the wait early. Returns True if a key was pressed.
+        """
+        pressed = threading.Event()
+
+        def on_press(channel):
+            pressed.set()
+            event.set()
+
+        watched = []
+        try:
+            for key in HardwareButtonsConstants.ALL_KEYS:
+                self.GPIO.add_event_detect(key, GPIO.FALLING, callback=on_press)
+                watched.append(key)
+        except RuntimeError as e:
+            # Edge detection isn't available on every kernel; poll slowly instead
+            logger.warning(f"Falling back to polling the buttons: {e}")
+            for key in watched:
+                self.GPIO.remove_event_detect(key)
+            watched = []
+
+        try:
+            # A key may already have been down before its edge detection was set up
+            while not event.is_set():
+                if self.has_any_input():
+                    pressed.set()
+                    break
+                event.wait(None if watched else 0.1)
+        finally:
+            for key in watched:
+                self.GPIO.remove_event_detect(key)
+
+        if pressed.is_set():
+            self.update_last_input_time()
+        return pressed.is_set()
+
+
 # class used as short hand for static button/channel lookup values
 class HardwareButtonsConstants:
     if GPIO.RPI_INFO['P1_REVISION'] == 3: #This indicates that we have revision 3 GPIO
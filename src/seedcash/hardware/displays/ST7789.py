@@ -1,13 +1,17 @@
 import spidev
 import RPi.GPIO as GPIO
 import time
-import array
 
+from seedcash.hardware.displays.base import BaseSPIDisplay
+from seedcash.hardware.displays.framebuffer import RGB565Framebuffer
 
 
-class ST7789(object):
+class ST7789(BaseSPIDisplay):
     """class for ST7789  240*240 1.3inch OLED displays."""
 
+    # The controller has 320 lines of memory; the panel shows 240 of them
+    MEMORY_ROWS = 320
+
     def __init__(self):
         self.width = 240
         self.height = 240
@@ -25,27 +29,29 @@ class ST7789(object):
         GPIO.output(self._bl, GPIO.HIGH)
 
         #Initialize SPI
-        self._spi = spidev.SpiDev(0, 0)
+        super().__init__(spidev.SpiDev(0, 0), self._dc, GPIO)
         self._spi.max_speed_hz = 40000000
+        self._madctl = 0x70
+        self._backlight = self._bl
+
+        self.framebuffer = RGB565Framebuffer(self.width, self.height)
 
         self.init()
 
 
     """    Write register address and data     """
     def command(self, cmd):
-        GPIO.output(self._dc, GPIO.LOW)
-        self._spi.writebytes([cmd])
+        self.write_command(cmd)
 
     def data(self, val):
-        GPIO.output(self._dc, GPIO.HIGH)
-        self._spi.writebytes([val])
+        self.write_data([val])
 
     def init(self):
         """Initialize dispaly"""    
         self.reset()
 
         self.command(0x36)
-        self.data(0x70)                 #self.data(0x00)
+        self.data(self._madctl)                 #self.data(0x00)
 
         self.command(0x3A) 
         self.data(0x05)
@@ -128,45 +134,32 @@ class ST7789(object):
         time.sleep(0.01)
         GPIO.output(self._rst,GPIO.HIGH)
         time.sleep(0.01)
+        self.invalidate_window()
+        self.reset_scroll()
         
     def SetWindows(self, Xstart, Ystart, Xend, Yend):
-        #set the X coordinates
-        self.command(0x2A)
-        self.data(0x00)               #Set the horizontal starting point to the high octet
-        self.data(Xstart & 0xff)      #Set the horizontal starting point to the low octet
-        self.data(0x00)               #Set the horizontal end to the high octet
-        self.data((Xend - 1) & 0xff) #Set the horizontal end to the low octet 
-        
-        #set the Y coordinates
-        self.command(0x2B)
-        self.data(0x00)
-        self.data((Ystart & 0xff))
-        self.data(0x00)
-        self.data((Yend - 1) & 0xff )
+        # Xend and Yend are exclusive
+        self.start_write(Xstart, Ystart, Xend - 1, Yend - 1)
 
-        self.command(0x2C)    
-    
-    def show_image(self,Image,Xstart,Ystart):
+    def show_image(self,Image,Xstart,Ystart,region=None):
         """Set buffer to value of Python Imaging Library image."""
         """Write display buffer to physical display"""
         imwidth, imheight = Image.size
         if imwidth != self.width or imheight != self.height:
             raise ValueError('Image must be same dimensions as display \
                 ({0}x{1}).' .format(self.width, self.height))
-        # convert 24-bit RGB-8:8:8 to gBRG-3:5:5:3; then per-pixel byteswap to 16-bit RGB-5:6:5
-        arr = array.array("H", Image.convert("BGR;16").tobytes())
-        arr.byteswap()
-        pix = arr.tobytes()
-        self.SetWindows ( 0, 0, self.width, self.height)
-        GPIO.output(self._dc,GPIO.HIGH)
-        self._spi.writebytes2(pix)	
-        
+
+        # Only convert and send the (x0, y0, x1, y1) region, if one was given
+        x0, y0, x1, y1 = self.framebuffer.update(Image, region)
+        for box, (x, y) in self._scroll_windows((x0, y0, x1, y1)):
+            self.SetWindows ( x, y, x + box[2] - box[0], y + box[3] - box[1])
+            self.write_data(self.framebuffer.window_data(box))
+
     def clear(self):
         """Clear contents of image buffer"""
-        _buffer = [0xff]*(self.width * self.height * 2)
+        _buffer = bytes([0xff]) * (self.width * self.height * 2)
         self.SetWindows ( 0, 0, self.width, self.height)
-        GPIO.output(self._dc,GPIO.HIGH)
-        self._spi.writebytes2(_buffer)
+        self.write_data(_buffer)
 
     def invert(self, enabled: bool = True):
         """Invert how the display interprets colors"""
@@ -0,0 +1,291 @@
+import struct
+import time
+
+from seedcash.hardware.displays.framebuffer import rgb565
+
+# MIPI DCS commands shared by the supported controllers
+MIPI_DCS_SLPIN = 0x10  # Sleep in
+MIPI_DCS_SLPOUT = 0x11  # Sleep out
+MIPI_DCS_DISPOFF = 0x28  # Display off
+MIPI_DCS_DISPON = 0x29  # Display on
+MIPI_DCS_CASET = 0x2A  # Column address set
+MIPI_DCS_RASET = 0x2B  # Row (page) address set
+MIPI_DCS_RAMWR = 0x2C  # Memory write
+MIPI_DCS_VSCRDEF = 0x33  # Vertical scrolling definition
+MIPI_DCS_VSCSAD = 0x37  # Vertical scrolling start address
+
+# MADCTL bits that decide how the scroll direction maps onto the image
+_MADCTL_MY = 0x80  # Row address order
+_MADCTL_MV = 0x20  # Row/column exchange
+
+
+class BaseSPIDisplay:
+    """
+    Command/data plumbing shared by the SPI panel drivers.
+
+    Every write is one SPI call for a whole command or parameter block, and the DC
+    pin is only driven when it actually has to change. Setting up an address
+    window is encoded once per distinct window; a window that is already set is
+    not sent again, so a repeated partial update costs a single RAMWR.
+    `fill_region()` paints solid rectangles without converting any pixels.
+
+    Drivers that set `MEMORY_ROWS` and `_madctl` also get hardware scrolling:
+    `scroll()` moves a band of the image with the controller's vertical scrolling
+    registers, and `_scroll_windows()` maps later writes to where their pixels
+    now live in display memory.
+    """
+
+    # Number of encoded windows to keep; partial updates tend to repeat a few
+    WINDOW_CACHE_SIZE = 64
+
+    # Lines of display memory in the controller's scroll direction, which may be
+    # more than the panel shows; None if hardware scrolling is not supported.
+    MEMORY_ROWS = None
+
+    def __init__(self, spi, dc: int, gpio):
+        self._spi = spi
+        self._dc = dc
+        self._gpio = gpio
+        self._dc_state = None
+        self._window = None
+        self._window_cache = {}
+        self._ramwr = None
+        self._madctl = 0
+
+        # Backlight pin, if the driver controls one
+        self._backlight = None
+
+        # (start, end, offset) of the scrolled band in image coordinates
+        self._scroll = None
+        self._scroll_top = 0
+
+    def _encode(self, values: bytes) -> bytes:
+        """
+        Encode command or parameter bytes for the bus. Drivers whose bus differs
+        from plain 8-bit SPI override this.
+        """
+        return values
+
+    def _set_dc(self, state):
+        if state != self._dc_state:
+            self._gpio.output(self._dc, state)
+            self._dc_state = state
+
+    def write_command(self, cmd: int, params: bytes = None):
+        """
+        Send a command byte, followed by its parameter bytes if any.
+        """
+        self._set_dc(self._gpio.LOW)
+        self._spi.writebytes2(self._encode(bytes((cmd,))))
+        if params:
+            self._set_dc(self._gpio.HIGH)
+            self._spi.writebytes2(self._encode(bytes(params)))
+
+    def write_data(self, data):
+        """
+        Send already encoded display data in a single transfer.
+        """
+        self._set_dc(self._gpio.HIGH)
+        self._spi.writebytes2(data)
+
+    def sleep_mode(self, value: bool):
+        """
+        Put the panel to sleep with its backlight off, or wake it up again. Display
+        memory is kept, so the panel shows the same image after waking up.
+        """
+        if value:
+            self.write_command(MIPI_DCS_DISPOFF)
+            self.write_command(MIPI_DCS_SLPIN)
+            if self._backlight is not None:
+                self._gpio.output(self._backlight, self._gpio.LOW)
+        else:
+            self.write_command(MIPI_DCS_SLPOUT)
+            # The supply and clocks take up to 120ms to come back
+            time.sleep(0.120)
+            self.write_command(MIPI_DCS_DISPON)
+            if self._backlight is not None:
+                self._gpio.output(self._backlight, self._gpio.HIGH)
+
+    def invalidate_window(self):
+        """
+        Forget the current address window, e.g. after a reset or a change of
+        MADCTL, so that the next `start_write()` sets it again.
+        """
+        self._window = None
+
+    def start_write(self, x0: int, y0: int, x1: int, y1: int):
+        """
+        Address the window from (x0, y0) to (x1, y1), inclusive, and start a
+        memory write; follow with `write_data()`.
+        """
+        window = (x0, y0, x1, y1)
+        if window != self._window:
+            encoded = self._window_cache.get(window)
+            if encoded is None:
+                if len(self._window_cache) >= self.WINDOW_CACHE_SIZE:
+                    self._window_cache.clear()
+                encoded = (
+                    self._encode(bytes((MIPI_DCS_CASET,))),
+                    self._encode(struct.pack(">HH", x0, x1)),
+                    self._encode(bytes((MIPI_DCS_RASET,))),
+                    self._encode(struct.pack(">HH", y0, y1)),
+                )
+                self._window_cache[window] = encoded
+
+            caset, columns, raset, rows = encoded
+            self._set_dc(self._gpio.LOW)
+            self._spi.writebytes2(caset)
+            self._set_dc(self._gpio.HIGH)
+            self._spi.writebytes2(columns)
+            self._set_dc(self._gpio.LOW)
+            self._spi.writebytes2(raset)
+            self._set_dc(self._gpio.HIGH)
+            self._spi.writebytes2(rows)
+            self._window = window
+
+        if self._ramwr is None:
+            self._ramwr = self._encode(bytes((MIPI_DCS_RAMWR,)))
+        self._set_dc(self._gpio.LOW)
+        self._spi.writebytes2(self._ramwr)
+
+    def _address_window(self, x0: int, y0: int, x1: int, y1: int):
+        """
+        Start a memory write to the window from (x0, y0) to (x1, y1), inclusive, in
+        image coordinates. Drivers that show only part of display memory override
+        this to add their offset.
+        """
+        self.start_write(x0, y0, x1, y1)
+
+    def _window_box(self, region):
+        """
+        Map an (x0, y0, x1, y1) box of the image to the address window it is
+        written to; the same unless the driver rotates images in software.
+        """
+        return region
+
+    def _encode_pixel(self, color) -> bytes:
+        """
+        Encode an (r, g, b) color as one pixel of display data.
+        """
+        return struct.pack(">H", rgb565(color))
+
+    def fill_region(self, region, color, x_start: int = 0, y_start: int = 0):
+        """
+        Fill the (x0, y0, x1, y1) `region` of the image with the solid (r, g, b)
+        `color` straight in display memory: nothing is converted and the data is a
+        single pixel repeated. A driver's `framebuffer`, if it has one, is kept in
+        step, so it still matches what the panel shows.
+        """
+        box = self._window_box(region)
+        framebuffer = getattr(self, "framebuffer", None)
+        if framebuffer is not None:
+            framebuffer.fill(box, color)
+
+        pixel = self._encode_pixel(color)
+        for (x0, y0, x1, y1), (x, y) in self._scroll_windows(box):
+            self._address_window(
+                x_start + x,
+                y_start + y,
+                x_start + x + x1 - x0 - 1,
+                y_start + y + y1 - y0 - 1,
+            )
+            self.write_data(pixel * ((x1 - x0) * (y1 - y0)))
+
+    @property
+    def scroll_axis(self):
+        """
+        Image axis ("x" or "y") that `scroll()` moves along, or None if hardware
+        scrolling is not supported. The controller always scrolls along its memory
+        rows, which is the image's x axis when MADCTL exchanges rows and columns.
+        """
+        if not self.MEMORY_ROWS:
+            return None
+        return "x" if self._madctl & _MADCTL_MV else "y"
+
+    def _scroll_origin(self) -> int:
+        """
+        Memory line of image coordinate 0 along the scroll axis, before MADCTL
+        mirroring.
+        """
+        return 0
+
+    def reset_scroll(self):
+        """
+        Forget the scroll state; the controller is back at its defaults after a
+        reset.
+        """
+        self._scroll = None
+
+    def scroll(self, delta: int, start: int, end: int) -> bool:
+        """
+        Move the image between `start` and `end` (exclusive) along `scroll_axis` by
+        `delta` lines towards `start`, without sending any pixels. The lines that
+        move out at `start` come back in at `end`; the rest of the image stays put.
+
+        Returns False if a band scrolled earlier had to be reset first, in which
+        case the display no longer shows the last image and must be redrawn.
+        """
+        length = end - start
+        intact = True
+        if self._scroll is None or self._scroll[:2] != (start, end):
+            if self._scroll is not None and self._scroll[2]:
+                intact = False
+
+            if self._madctl & _MADCTL_MY:
+                top = self.MEMORY_ROWS - (end + self._scroll_origin())
+            else:
+                top = start + self._scroll_origin()
+            self.vscrdef(top, length, self.MEMORY_ROWS - top - length)
+            self._scroll = (start, end, 0)
+            self._scroll_top = top
+
+        offset = (self._scroll[2] + delta) % length
+        self._scroll = (start, end, offset)
+
+        # A mirrored row order scrolls the memory the other way round
+        if self._madctl & _MADCTL_MY:
+            line = -offset % length
+        else:
+            line = offset
+        self.vscsad(self._scroll_top + line)
+        return intact
+
+    def vscrdef(self, tfa: int, vsa: int, bfa: int):
+        """
+        Set the vertical scrolling definition: a top fixed area of `tfa` lines, a
+        scrolling area of `vsa` lines and a bottom fixed area of `bfa` lines, which
+        add up to `MEMORY_ROWS`.
+        """
+        self.write_command(MIPI_DCS_VSCRDEF, struct.pack(">HHH", tfa, vsa, bfa))
+
+    def vscsad(self, vssa: int):
+        """
+        Set the memory line shown first in the scrolling area.
+        """
+        self.write_command(MIPI_DCS_VSCSAD, struct.pack(">H", vssa))
+
+    def _scroll_windows(self, box):
+        """
+        Split the (x0, y0, x1, y1) `box` of the image into parts that are contiguous
+        in display memory once scrolled. Yields each part with the (x, y) address
+        its top left corner has to be written to.
+        """
+        x0, y0, x1, y1 = box
+        if self._scroll is None or not self._scroll[2]:
+            yield box, (x0, y0)
+            return
+
+        start, end, offset = self._scroll
+        c0, c1 = (x0, x1) if self.scroll_axis == "x" else (y0, y1)
+
+        # A band's lines are in order in memory except where they wrap around
+        cuts = [c0] + [c for c in (start, end - offset, end) if c0 < c < c1] + [c1]
+        for a, b in zip(cuts, cuts[1:]):
+            address = a
+            if start <= a < end:
+                address = start + (a - start + offset) % (end - start)
+
+            if self.scroll_axis == "x":
+                yield (a, y0, b, y1), (address, y0)
+            else:
+                yield (x0, a, x1, b), (x0, address)
@@ -1,8 +1,9 @@
 DISPLAY_TYPE__ST7789 = "st7789"
 DISPLAY_TYPE__ILI9341 = "ili9341"
 DISPLAY_TYPE__ILI9486 = "ili9486"
+DISPLAY_TYPE__VIRTUAL = "virtual"  # in-memory, for running headless
 
-ALL_DISPLAY_TYPES = [DISPLAY_TYPE__ST7789, DISPLAY_TYPE__ILI9341, DISPLAY_TYPE__ILI9486]
+ALL_DISPLAY_TYPES = [DISPLAY_TYPE__ST7789, DISPLAY_TYPE__ILI9341, DISPLAY_TYPE__ILI9486, DISPLAY_TYPE__VIRTUAL]
 
 
 class DisplayDriver:
@@ -33,8 +34,13 @@ class DisplayDriver:
             self.display.begin()
         
         elif self.display_type == DISPLAY_TYPE__ILI9486:
-            # TODO: improve performance of ili9486 driver
-            raise Exception("ILI9486 display not implemented yet")
+            from seedcash.hardware.displays.ili9486 import ILI9486
+            self.display = ILI9486()
+            self.display.begin()
+
+        elif self.display_type == DISPLAY_TYPE__VIRTUAL:
+            from seedcash.hardware.displays.virtual import VirtualDisplay
+            self.display = VirtualDisplay(width=width, height=height)
     
 
     def __str__(self):
@@ -56,5 +62,47 @@ class DisplayDriver:
         self.display.invert(enabled)
 
 
-    def show_image(self, image, x_start: int = 0, y_start: int = 0):
-        self.display.show_image(image, x_start, y_start)
\ No newline at end of file
+    def sleep_mode(self, enabled: bool):
+        """Put the display to sleep with its backlight off, or wake it up"""
+        self.display.sleep_mode(enabled)
+
+
+    @property
+    def scroll_axis(self):
+        """Image axis ("x" or "y") the display can scroll in hardware, if any"""
+        return getattr(self.display, "scroll_axis", None)
+
+
+    def scroll(self, delta: int, start: int, end: int) -> bool:
+        """
+        Move the image between `start` and `end` along `scroll_axis` by `delta` lines
+        towards `start` without resending it. Returns False if the display had to
+        drop an earlier scroll and must be redrawn.
+        """
+        return self.display.scroll(delta, start, end)
+
+
+    def show_image(self, image, x_start: int = 0, y_start: int = 0, region: tuple = None):
+        """
+        Write `image` to the display at (x_start, y_start). If `region` is given as
+        an (x0, y0, x1, y1) box of the image, only that part is converted and sent.
+        """
+        self.display.show_image(image, x_start, y_start, region=region)
+
+
+    def fill_region(self, region: tuple, color: tuple):
+        """
+        Fill the (x0, y0, x1, y1) `region` of the display with the solid (r, g, b)
+        `color` without converting or sending an image.
+        """
+        self.display.fill_region(region, color)
+
+
+    def end_frame(self):
+        """
+        Mark the end of a frame, however many regions it was sent in. Only the
+        virtual display, which can save each frame, does anything with it.
+        """
+        end_frame = getattr(self.display, "end_frame", None)
+        if end_frame:
+            end_frame()
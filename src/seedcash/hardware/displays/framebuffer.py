@@ -0,0 +1,121 @@
+import numpy as np
+
+from PIL import Image
+
+
+def rotate_region(region, size, rotation):
+    """Map an (x0, y0, x1, y1) box of an image of the given size to where it
+    lands after `image.rotate(rotation, expand=True)` (counter-clockwise).
+    """
+    x0, y0, x1, y1 = region
+    width, height = size
+    rotation %= 360
+    if rotation == 0:
+        return x0, y0, x1, y1
+    elif rotation == 90:
+        return y0, width - x1, y1, width - x0
+    elif rotation == 180:
+        return width - x1, height - y1, width - x0, height - y0
+    elif rotation == 270:
+        return height - y1, x0, height - y0, x1
+    raise ValueError("Partial updates need a rotation of 0, 90, 180 or 270")
+
+
+def region_area(region) -> int:
+    """Number of pixels in an (x0, y0, x1, y1) box, exclusive of x1 and y1."""
+    x0, y0, x1, y1 = region
+    return (x1 - x0) * (y1 - y0)
+
+
+def rgb565(color) -> int:
+    """Convert an (r, g, b) color to a 16-bit RGB-5:6:5 value, the same way
+    `RGB565Framebuffer.update()` converts pixels.
+    """
+    red, green, blue = color[:3]
+    return (red & 0xF8) << 8 | (green & 0xFC) << 3 | blue >> 3
+
+
+class RGB565Framebuffer:
+    """
+    Preallocated copy of the panel contents in the panel's native 16-bit RGB-5:6:5,
+    big-endian pixel format.
+
+    Only the regions passed to `update()` are converted, straight into the buffer,
+    and `window_data()` hands out slices of it for the SPI write, so a frame costs
+    no full-size intermediate copies.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.buffer = bytearray(width * height * 2)
+        self._view = memoryview(self.buffer)
+        self._pixels = np.frombuffer(self.buffer, dtype=">u2").reshape(height, width)
+
+    def update(self, image: Image.Image, region=None, rotation: int = 0):
+        """
+        Convert the (x0, y0, x1, y1) `region` of `image` (default: all of it) into
+        the buffer, after rotating it counter-clockwise by `rotation` degrees.
+
+        Returns the updated box in buffer coordinates.
+        """
+        box = region or (0, 0, image.width, image.height)
+        if rotation % 360:
+            box = rotate_region(box, image.size, rotation)
+        if region is not None:
+            image = image.crop(region)
+
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGB")
+        rgb = np.asarray(image)
+        if rotation % 360:
+            rgb = np.rot90(rgb, (rotation % 360) // 90)
+
+        # 24-bit RGB-8:8:8 to 16-bit RGB-5:6:5, reusing the red plane as the output
+        pixel = rgb[..., 0].astype(np.uint16)
+        pixel &= 0xF8
+        pixel <<= 8
+        green = rgb[..., 1].astype(np.uint16)
+        green &= 0xFC
+        green <<= 3
+        pixel |= green
+        pixel |= rgb[..., 2] >> 3
+
+        x0, y0, x1, y1 = box
+        self._pixels[y0:y1, x0:x1] = pixel
+        return box
+
+    def fill(self, box, color):
+        """
+        Set the (x0, y0, x1, y1) `box` of the buffer to the solid RGB `color`.
+        """
+        x0, y0, x1, y1 = box
+        self._pixels[y0:y1, x0:x1] = rgb565(color)
+
+    def window_data(self, box=None):
+        """
+        Return the pixel data of the (x0, y0, x1, y1) `box` (default: the whole
+        buffer) in the order the panel expects it for that address window.
+
+        Full-width boxes are contiguous and returned as a memoryview slice of the
+        buffer; narrower ones are copied out row by row.
+        """
+        if box is None:
+            return self._view
+
+        x0, y0, x1, y1 = box
+        if x0 == 0 and x1 == self.width:
+            row_bytes = self.width * 2
+            return self._view[y0 * row_bytes : y1 * row_bytes]
+        return self._pixels[y0:y1, x0:x1].tobytes()
+
+    def to_image(self) -> Image.Image:
+        """
+        Return the buffer contents as an RGB image, e.g. to inspect what was sent.
+        """
+        pixels = self._pixels.astype(np.uint16)
+        rgb = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        rgb[..., 0] = (pixels >> 8) & 0xF8
+        rgb[..., 1] = (pixels >> 3) & 0xFC
+        rgb[..., 2] = (pixels << 3) & 0xF8
+        return Image.fromarray(rgb, "RGB")
@@ -27,7 +27,6 @@ Tested with a 320x240 IPS display (https://a.co/d/2Q9wDLo)
 import numbers
 import time
 # import numpy as np
-import array
 
 from PIL import Image
 from PIL import ImageDraw
@@ -35,6 +34,9 @@ from PIL import ImageDraw
 import RPi.GPIO as GPIO
 from spidev import SpiDev
 
+from seedcash.hardware.displays.base import BaseSPIDisplay
+from seedcash.hardware.displays.framebuffer import RGB565Framebuffer, rotate_region
+
 
 # Constants for interacting with display registers.
 ILI9341_TFTWIDTH    = 240
@@ -77,6 +79,21 @@ ILI9341_FRMCTR3     = 0xB3
 ILI9341_INVCTR      = 0xB4
 ILI9341_DFUNCTR     = 0xB6
 
+# MADCTL (Memory Access Control) bits
+ILI9341_MADCTL_MY   = 0x80  # Row address order
+ILI9341_MADCTL_MX   = 0x40  # Column address order
+ILI9341_MADCTL_MV   = 0x20  # Row/column exchange
+ILI9341_MADCTL_BGR  = 0x08
+
+# MADCTL for each counter-clockwise image rotation, equivalent to sending
+# `image.rotate(rotation, expand=True)` to the panel in its portrait orientation.
+ILI9341_ROTATION_MADCTL = {
+    0: ILI9341_MADCTL_MX | ILI9341_MADCTL_BGR,
+    90: ILI9341_MADCTL_MY | ILI9341_MADCTL_MX | ILI9341_MADCTL_MV | ILI9341_MADCTL_BGR,
+    180: ILI9341_MADCTL_MY | ILI9341_MADCTL_BGR,
+    270: ILI9341_MADCTL_MV | ILI9341_MADCTL_BGR,
+}
+
 ILI9341_PWCTR1      = 0xC0
 ILI9341_PWCTR2      = 0xC1
 ILI9341_PWCTR3      = 0xC2
@@ -111,27 +128,12 @@ def color565(r, g, b):
     """
     return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
 
-def image_to_data(image):
-    """Generator function to convert a PIL image to 16-bit 565 RGB bytes."""
-    #NumPy is much faster at doing this. NumPy code provided by:
-    #Keith (https://www.blogger.com/profile/02555547344016007163)
-    # pb = np.array(image.convert('RGB')).astype('uint16')
-    # color = ((pb[:,:,0] & 0xF8) << 8) | ((pb[:,:,1] & 0xFC) << 3) | (pb[:,:,2] >> 3)
-    # return np.dstack(((color >> 8) & 0xFF, color & 0xFF)).flatten().tolist()
-
-    # convert 24-bit RGB-8:8:8 to gBRG-3:5:5:3 ("BGR;16"):
-    #   3 highest bits of green + 5 highest bits of blue in the first byte and
-    #   5 highest bits of red + the next 3 highest bits of green (not yet expressed) in the second byte.
-    # Then per-pixel byteswap to 16-bit RGB-5:6:5
-    # This approach was measured to be ~3.4x faster than the numpy code above.
-    arr = array.array("H", image.convert("BGR;16").tobytes())
-    arr.byteswap()
-    return arr.tobytes()
-
-
-class ILI9341(object):
+
+class ILI9341(BaseSPIDisplay):
     """Representation of an ILI9341 TFT LCD."""
 
+    MEMORY_ROWS = ILI9341_TFTHEIGHT
+
     def __init__(self, dc=22, rst=13, led=12, width=ILI9341_TFTWIDTH,
         height=ILI9341_TFTHEIGHT, rotation=90):
         """Create an instance of the display using SPI communication.  Must
@@ -143,13 +145,28 @@ class ILI9341(object):
         # spi.mode = 0b10  # [CPOL|CPHA] -> polarity 1, phase 0
         spi.max_speed_hz = 64_000_000
 
-        self._dc = dc
+        super().__init__(spi, dc, GPIO)
         self._rst = rst
-        self._spi = spi
         self.width = width
         self.height = height
         self.rotation = rotation
         self.inverted = False
+
+        # Let the panel rotate in hardware so images are streamed as they are; only
+        # other angles are rotated in software, on top of the portrait orientation.
+        if rotation % 360 in ILI9341_ROTATION_MADCTL:
+            self._madctl = ILI9341_ROTATION_MADCTL[rotation % 360]
+            self._software_rotation = 0
+        else:
+            self._madctl = ILI9341_ROTATION_MADCTL[0]
+            self._software_rotation = rotation
+
+        # Size of the address window: the panel's, or swapped when the hardware
+        # exchanges rows and columns.
+        if self._madctl & ILI9341_MADCTL_MV:
+            self._window_size = (height, width)
+        else:
+            self._window_size = (width, height)
         # if self._gpio is None:
         #     self._gpio = GPIO.get_platform_gpio()
         # Set DC as output.
@@ -157,15 +174,19 @@ class ILI9341(object):
         GPIO.setmode(GPIO.BOARD)  # Use physical pin nums, not gpio labels
         GPIO.setwarnings(False)
         GPIO.setup(self._dc, GPIO.OUT)
-        GPIO.output(self._dc, GPIO.HIGH)
+        self._set_dc(GPIO.HIGH)
         GPIO.setup(led, GPIO.OUT)
         GPIO.output(led, GPIO.HIGH)
+        self._backlight = led
         if self._rst is not None:
             GPIO.setup(self._rst, GPIO.OUT)
             GPIO.output(self._rst, GPIO.HIGH)
 
         # Create an image buffer.
-        self.buffer = Image.new('RGB', (width, height))
+        self.buffer = Image.new('RGB', self._window_size)
+
+        # Copy of what was last sent, in 16-bit 565 RGB and window orientation
+        self.framebuffer = RGB565Framebuffer(*self._window_size)
 
     # @property
     # def width(self):
@@ -183,15 +204,10 @@ class ILI9341(object):
         single SPI transaction, with a default of 4096.
         """
         # Set DC low for command, high for data.
-        GPIO.output(self._dc, is_data)
+        self._set_dc(GPIO.HIGH if is_data else GPIO.LOW)
         # Convert scalar argument to list so either can be passed as parameter.
         if isinstance(data, numbers.Number):
             data = [data & 0xFF]
-        # Write data a chunk at a time.
-        # for start in range(0, len(data), chunk_size):
-        #     end = min(start+chunk_size, len(data))
-        #     self._spi.writebytes2(data[start:end])
-
         self._spi.writebytes2(data)
 
     def command(self, data):
@@ -211,6 +227,25 @@ class ILI9341(object):
             time.sleep(0.02)
             GPIO.output(self._rst, GPIO.HIGH)
             time.sleep(0.150)
+        self.invalidate_window()
+        self.reset_scroll()
+
+    @property
+    def scroll_axis(self):
+        """Hardware scrolling works in image coordinates, so it is not available
+        when the image is rotated in software."""
+        if self._software_rotation:
+            return None
+        return super().scroll_axis
+
+    def _window_box(self, region):
+        """Images rotated in software land rotated in the framebuffer."""
+        if not self._software_rotation:
+            return region
+        width, height = self._window_size
+        if self._software_rotation % 180:
+            width, height = height, width
+        return rotate_region(region, (width, height), self._software_rotation)
 
     def _init(self):
         # Initialize the display.  Broken out as a separate function so it can
@@ -253,7 +288,7 @@ class ILI9341(object):
         self.command(ILI9341_VMCTR2)    # VCM control2
         self.data(0x86)                    # --
         self.command(ILI9341_MADCTL)    #  Memory Access Control
-        self.data(0x48)
+        self.data(self._madctl)
         self.command(ILI9341_PIXFMT)
         self.data(0x55)
         self.command(ILI9341_FRMCTR1)
@@ -325,46 +360,37 @@ class ILI9341(object):
         """Set the pixel address window for proceeding drawing commands. x0 and
         x1 should define the minimum and maximum x pixel bounds.  y0 and y1
         should define the minimum and maximum y pixel bound.  If no parameters
-        are specified the default will be to update the entire display from 0,0
-        to 239,319.
+        are specified the default will be to update the entire display, e.g.
+        from 0,0 to 319,239 when rotated by 90 degrees.
         """
         if x1 is None:
-            x1 = self.width-1
+            x1 = self._window_size[0]-1
         if y1 is None:
-            y1 = self.height-1
-        self.command(ILI9341_CASET)        # Column addr set
-        self.data(x0 >> 8)
-        self.data(x0)                    # XSTART
-        self.data(x1 >> 8)
-        self.data(x1)                    # XEND
-        self.command(ILI9341_PASET)        # Row addr set
-        self.data(y0 >> 8)
-        self.data(y0)                    # YSTART
-        self.data(y1 >> 8)
-        self.data(y1)                    # YEND
-        self.command(ILI9341_RAMWR)        # write to RAM
-
-    def show_image(self, image=None, x_start: int = 0, y_start: int = 0):
+            y1 = self._window_size[1]-1
+        self.start_write(x0, y0, x1, y1)
+
+    def show_image(self, image=None, x_start: int = 0, y_start: int = 0, region=None):
         """Write the display buffer or provided image to the hardware.  If no
         image parameter is provided the display buffer will be written to the
         hardware.  If an image is provided, it should be RGB format and the
-        same dimensions as the display hardware.
+        same dimensions as the display hardware.  If region is provided as an
+        (x0, y0, x1, y1) box of the image, only that part of it is sent.
         """
         # By default write the internal buffer to the display.
         if image is None:
             image = self.buffer
-        
-        output_image = image.rotate(self.rotation, expand=True)
-        self.set_window(x_start, y_start, x_start + output_image.width - 1, y_start + output_image.height - 1)
-
-        # Convert image to array of 16bit 565 RGB data bytes.
-        # Unfortunate that this copy has to occur, but the SPI byte writing
-        # function needs to take an array of bytes and PIL doesn't natively
-        # store images in 16-bit 565 RGB format.
-        pixelbytes = image_to_data(output_image)
-
-        # Write data to hardware.
-        self.data(pixelbytes)
+
+        # Convert (only the region of) the image to 16-bit 565 RGB straight into
+        # the framebuffer; the panel itself takes care of the rotation.
+        x0, y0, x1, y1 = self.framebuffer.update(
+            image, region, self._software_rotation
+        )
+
+        # Write data to hardware, following any hardware scrolling.
+        for box, (x, y) in self._scroll_windows((x0, y0, x1, y1)):
+            self.set_window(x_start + x, y_start + y,
+                x_start + x + box[2] - box[0] - 1, y_start + y + box[3] - box[1] - 1)
+            self.data(self.framebuffer.window_data(box))
 
     def clear(self, color=(0,0,0)):
         """Clear the image buffer to the specified RGB color (default black)."""
@@ -0,0 +1,228 @@
+"""
+Driver for ILI9486 320x480 panels, usually sold as 3.5" 480x320 displays.
+
+Most of these modules put a 16-bit shift register in front of the controller's
+parallel bus: every command and parameter is clocked in as a 16-bit word and each
+pixel goes out as one 16-bit RGB-5:6:5 word. Panels wired to the controller's own
+SPI interface only accept 18-bit color (three bytes per pixel) and 8-bit commands;
+pass `shift_register=False` for those.
+
+Either way the canvas is converted through a precomputed path, only the updated
+window is addressed and its pixels go out in a single bulk transfer.
+"""
+
+import time
+
+import RPi.GPIO as GPIO
+from spidev import SpiDev
+
+from seedcash.hardware.displays.base import BaseSPIDisplay
+from seedcash.hardware.displays.framebuffer import RGB565Framebuffer
+
+ILI9486_TFTWIDTH = 320
+ILI9486_TFTHEIGHT = 480
+
+ILI9486_SLPOUT = 0x11
+ILI9486_INVOFF = 0x20
+ILI9486_INVON = 0x21
+ILI9486_DISPON = 0x29
+ILI9486_CASET = 0x2A
+ILI9486_PASET = 0x2B
+ILI9486_RAMWR = 0x2C
+ILI9486_MADCTL = 0x36
+ILI9486_PIXFMT = 0x3A
+ILI9486_IFMODE = 0xB0
+ILI9486_PWCTR3 = 0xC2
+ILI9486_VMCTR1 = 0xC5
+ILI9486_GMCTRP1 = 0xE0
+ILI9486_GMCTRN1 = 0xE1
+ILI9486_DGMCTR1 = 0xE2
+
+ILI9486_PIXFMT_16BIT = 0x55
+ILI9486_PIXFMT_18BIT = 0x66
+
+# MADCTL (Memory Access Control) bits
+ILI9486_MADCTL_MY = 0x80  # Row address order
+ILI9486_MADCTL_MX = 0x40  # Column address order
+ILI9486_MADCTL_MV = 0x20  # Row/column exchange
+ILI9486_MADCTL_BGR = 0x08
+
+# MADCTL for each counter-clockwise image rotation, relative to the panel's
+# portrait orientation.
+ILI9486_ROTATION_MADCTL = {
+    0: ILI9486_MADCTL_MY | ILI9486_MADCTL_BGR,
+    90: ILI9486_MADCTL_MY | ILI9486_MADCTL_MX | ILI9486_MADCTL_MV | ILI9486_MADCTL_BGR,
+    180: ILI9486_MADCTL_MX | ILI9486_MADCTL_BGR,
+    270: ILI9486_MADCTL_MV | ILI9486_MADCTL_BGR,
+}
+
+# (command, parameters, delay in seconds); MADCTL and PIXFMT are added by _init()
+_ILI9486_INIT_CMDS = (
+    (ILI9486_IFMODE, bytes.fromhex("00"), 0),
+    (ILI9486_SLPOUT, b"", 0.250),
+    (ILI9486_PWCTR3, bytes.fromhex("44"), 0),
+    (ILI9486_VMCTR1, bytes.fromhex("00 00 00 00"), 0),
+    (ILI9486_GMCTRP1, bytes.fromhex("0F 1F 1C 0C 0F 08 48 98 37 0A 13 04 11 0D 00"), 0),
+    (ILI9486_GMCTRN1, bytes.fromhex("0F 32 2E 0B 0D 05 47 75 37 06 10 03 24 20 00"), 0),
+    (ILI9486_DGMCTR1, bytes.fromhex("0F 32 2E 0B 0D 05 47 75 37 06 10 03 24 20 00"), 0),
+)
+
+# 24-bit RGB-8:8:8 to 18-bit RGB-6:6:6 is a per-byte mask; the panel ignores the
+# two lowest bits of each byte.
+_RGB666_TABLE = bytes(value & 0xFC for value in range(256))
+
+
+class ILI9486(BaseSPIDisplay):
+    """Representation of an ILI9486 TFT LCD."""
+
+    MEMORY_ROWS = ILI9486_TFTHEIGHT
+
+    def __init__(
+        self,
+        dc=22,
+        rst=13,
+        led=12,
+        width=ILI9486_TFTWIDTH,
+        height=ILI9486_TFTHEIGHT,
+        rotation=270,
+        shift_register=True,
+        spi_speed_hz=32_000_000,
+    ):
+        """Create an instance of the display using SPI communication. The
+        default rotation gives the landscape orientation of the usual 3.5"
+        modules. Set shift_register to False for panels connected directly to
+        the controller's SPI interface.
+        """
+        if rotation % 360 not in ILI9486_ROTATION_MADCTL:
+            raise ValueError("ILI9486 rotation must be 0, 90, 180 or 270")
+
+        spi = SpiDev(0, 0)
+        spi.max_speed_hz = spi_speed_hz
+
+        super().__init__(spi, dc, GPIO)
+        self._rst = rst
+        self.width = width
+        self.height = height
+        self.rotation = rotation
+        self.shift_register = shift_register
+        self.inverted = False
+
+        # The panel rotates in hardware, so images are streamed as they are
+        self._madctl = ILI9486_ROTATION_MADCTL[rotation % 360]
+        if self._madctl & ILI9486_MADCTL_MV:
+            self._window_size = (height, width)
+        else:
+            self._window_size = (width, height)
+
+        GPIO.setmode(GPIO.BOARD)  # Use physical pin nums, not gpio labels
+        GPIO.setwarnings(False)
+        GPIO.setup(self._dc, GPIO.OUT)
+        self._set_dc(GPIO.HIGH)
+        if led is not None:
+            GPIO.setup(led, GPIO.OUT)
+            GPIO.output(led, GPIO.HIGH)
+        self._backlight = led
+        if self._rst is not None:
+            GPIO.setup(self._rst, GPIO.OUT)
+            GPIO.output(self._rst, GPIO.HIGH)
+
+        if self.shift_register:
+            self.framebuffer = RGB565Framebuffer(*self._window_size)
+
+    def _encode(self, values: bytes) -> bytes:
+        """Behind a shift register each command or parameter byte becomes a
+        big-endian 16-bit word.
+        """
+        if self.shift_register:
+            return bytes(byte for value in values for byte in (0x00, value))
+        return values
+
+    def _encode_pixel(self, color) -> bytes:
+        if self.shift_register:
+            return super()._encode_pixel(color)
+        return bytes(color[:3]).translate(_RGB666_TABLE)
+
+    def command(self, cmd, *params):
+        """Send a command followed by its parameters, if any."""
+        self.write_command(cmd, bytes(value & 0xFF for value in params))
+
+    def data(self, data):
+        """Write already encoded display data in a single bulk transfer."""
+        self.write_data(data)
+
+    def reset(self):
+        """Reset the display, if reset pin is connected."""
+        if self._rst is not None:
+            GPIO.output(self._rst, GPIO.HIGH)
+            time.sleep(0.005)
+            GPIO.output(self._rst, GPIO.LOW)
+            time.sleep(0.020)
+            GPIO.output(self._rst, GPIO.HIGH)
+            time.sleep(0.150)
+        self.invalidate_window()
+        self.reset_scroll()
+
+    def _init(self):
+        for cmd, params, delay in _ILI9486_INIT_CMDS:
+            self.command(cmd, *params)
+            if delay:
+                time.sleep(delay)
+
+        if self.shift_register:
+            self.command(ILI9486_PIXFMT, ILI9486_PIXFMT_16BIT)
+        else:
+            # The native SPI interface only supports 18-bit color
+            self.command(ILI9486_PIXFMT, ILI9486_PIXFMT_18BIT)
+        self.command(ILI9486_MADCTL, self._madctl)
+        self.command(ILI9486_DISPON)
+
+    def begin(self):
+        """Initialize the display. Should be called once before other calls that
+        interact with the display are called.
+        """
+        self.reset()
+        self._init()
+
+    def invert(self, state: bool = True):
+        """Sets display inversion to the specified state."""
+        self.command(ILI9486_INVON if state else ILI9486_INVOFF)
+        self.inverted = state
+        return self
+
+    def set_window(self, x0, y0, x1, y1):
+        """Set the pixel address window, inclusive of x1 and y1, and start a
+        memory write.
+        """
+        self.start_write(x0, y0, x1, y1)
+
+    def show_image(self, image, x_start: int = 0, y_start: int = 0, region=None):
+        """Write the provided RGB image to the hardware. The image should be the
+        size of the rotated display. If region is provided as an (x0, y0, x1, y1)
+        box of the image, only that part of it is sent.
+        """
+        if image.size != self._window_size:
+            raise ValueError(
+                f"Image must be same dimensions as display ({self._window_size[0]}x{self._window_size[1]})."
+            )
+
+        if self.shift_register:
+            box = self.framebuffer.update(image, region)
+        else:
+            box = region or (0, 0, image.width, image.height)
+
+        for (x0, y0, x1, y1), (x, y) in self._scroll_windows(box):
+            if self.shift_register:
+                pixelbytes = self.framebuffer.window_data((x0, y0, x1, y1))
+            else:
+                part = image.crop((x0, y0, x1, y1))
+                if part.mode != "RGB":
+                    part = part.convert("RGB")
+                pixelbytes = part.tobytes().translate(_RGB666_TABLE)
+
+            self.set_window(
+                x_start + x,
+                y_start + y,
+                x_start + x + x1 - x0 - 1,
+                y_start + y + y1 - y0 - 1,
+            )
+            self.data(pixelbytes)
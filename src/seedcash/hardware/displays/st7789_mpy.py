@@ -50,10 +50,12 @@ This driver supports:
 
 """
 
-import array
 import spidev
 import RPi.GPIO as GPIO
 
+from seedcash.hardware.displays.base import BaseSPIDisplay
+from seedcash.hardware.displays.framebuffer import RGB565Framebuffer
+
 from math import sin, cos
 
 #
@@ -228,7 +230,7 @@ def color565(red, green=0, blue=0):
     return (red & 0xF8) << 8 | (green & 0xFC) << 3 | blue >> 3
 
 
-class ST7789:
+class ST7789(BaseSPIDisplay):
     """
     ST7789 driver class
 
@@ -262,6 +264,9 @@ class ST7789:
 
     """
 
+    # Display memory is 240x320 whatever part of it the panel shows
+    MEMORY_ROWS = 320
+
     def __init__(
         self,
         # spi,
@@ -306,11 +311,13 @@ class ST7789:
         self.physical_height = self.height = height
         self.xstart = 0
         self.ystart = 0
+        super().__init__(spi, dc, GPIO)
         self.spi = spi
         self.reset = reset
         self.dc = dc
         self.cs = cs
         self.backlight = backlight
+        self._backlight = backlight
         self._rotation = rotation % 4
         self.color_order = color_order
         self.init_cmds = custom_init or _ST7789_INIT_CMDS
@@ -344,7 +351,7 @@ class ST7789:
     def invert(self, enabled: bool = True):
         self.inversion_mode(enabled)
 
-    def show_image(self, image, x_start: int = 0, y_start: int = 0):
+    def show_image(self, image, x_start: int = 0, y_start: int = 0, region=None):
         """Set buffer to value of Python Imaging Library image."""
         """Write display buffer to physical display"""
 
@@ -355,24 +362,29 @@ class ST7789:
             raise ValueError('Image must be same dimensions as display \
                 ({0}x{1}).' .format(self.width, self.height))
 
-        # convert 24-bit RGB-8:8:8 to gBRG-3:5:5:3; then per-pixel byteswap to 16-bit RGB-5:6:5
-        arr = array.array("H", image.convert("BGR;16").tobytes())
-        arr.byteswap()
-        pix = arr.tobytes()
-
-        self._set_window(x_start, y_start, self.width, self.height)
-        GPIO.output(self.dc,GPIO.HIGH)
-        self._write(data=pix)
+        # Only convert and send the (x0, y0, x1, y1) region, if one was given
+        x0, y0, x1, y1 = self.framebuffer.update(image, region)
+
+        # Parts of the image that were moved by scroll() are written where they
+        # now are in display memory
+        for box, (x, y) in self._scroll_windows((x0, y0, x1, y1)):
+            self._set_window(
+                x_start + x,
+                y_start + y,
+                x_start + x + box[2] - box[0] - 1,
+                y_start + y + box[3] - box[1] - 1,
+            )
+            self._write(data=self.framebuffer.window_data(box))
 
     def _write(self, command=None, data=None):
         """SPI write to the device: commands and data."""
         if self.cs:
             GPIO.output(self.cs, GPIO.LOW)
         if command is not None:
-            GPIO.output(self.dc, GPIO.LOW)
+            self._set_dc(GPIO.LOW)
             self.spi.writebytes2(command)
         if data is not None:
-            GPIO.output(self.dc,GPIO.HIGH)
+            self._set_dc(GPIO.HIGH)
             self.spi.writebytes2(data)
             if self.cs:
                 GPIO.output(self.cs,GPIO.HIGH)
@@ -394,6 +406,8 @@ class ST7789:
         sleep_ms(120)
         if self.cs:
             GPIO.output(self.cs, GPIO.HIGH)
+        self.invalidate_window()
+        self.reset_scroll()
 
     def soft_reset(self):
         """
@@ -401,19 +415,8 @@ class ST7789:
         """
         self._write(_ST7789_SWRESET)
         sleep_ms(150)
-
-    def sleep_mode(self, value):
-        """
-        Enable or disable display sleep mode.
-
-        Args:
-            value (bool): if True enable sleep mode. if False disable sleep
-            mode
-        """
-        if value:
-            self._write(_ST7789_SLPIN)
-        else:
-            self._write(_ST7789_SLPOUT)
+        self.invalidate_window()
+        self.reset_scroll()
 
     def inversion_mode(self, value):
         """
@@ -458,6 +461,11 @@ class ST7789:
             madctl &= ~_ST7789_MADCTL_BGR
 
         self._write(_ST7789_MADCTL, bytes([madctl]))
+        self._madctl = madctl
+        self.invalidate_window()
+
+        # Width and height may have swapped
+        self.framebuffer = RGB565Framebuffer(self.width, self.height)
 
     def _set_window(self, x0, y0, x1, y1):
         """
@@ -470,15 +478,14 @@ class ST7789:
             y1 (int): row end address
         """
         if x0 <= x1 <= self.width and y0 <= y1 <= self.height:
-            self._write(
-                _ST7789_CASET,
-                struct.pack(_ENCODE_POS, x0 + self.xstart, x1 + self.xstart),
-            )
-            self._write(
-                _ST7789_RASET,
-                struct.pack(_ENCODE_POS, y0 + self.ystart, y1 + self.ystart),
+            if self.cs:
+                GPIO.output(self.cs, GPIO.LOW)
+            self.start_write(
+                x0 + self.xstart, y0 + self.ystart, x1 + self.xstart, y1 + self.ystart
             )
-            self._write(_ST7789_RAMWR)
+
+    def _address_window(self, x0, y0, x1, y1):
+        self._set_window(x0, y0, x1, y1)
 
     def vline(self, x, y, length, color):
         """
@@ -567,7 +574,6 @@ class ST7789:
         pixel = struct.pack(
             _ENCODE_PIXEL_SWAPPED if self.needs_swap else _ENCODE_PIXEL, color
         )
-        GPIO.output(self.dc,GPIO.HIGH)
         if chunks:
             data = pixel * _BUFFER_SIZE
             for _ in range(chunks):
@@ -617,6 +623,10 @@ class ST7789:
                 err += dx
             x0 += 1
 
+    def _scroll_origin(self):
+        # Rows of the panel start this far into display memory
+        return self.xstart if self.scroll_axis == "x" else self.ystart
+
     def vscrdef(self, tfa, vsa, bfa):
         """
         Set Vertical Scrolling Definition.
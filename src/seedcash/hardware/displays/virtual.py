@@ -0,0 +1,344 @@
+"""
+In-memory display and SPI/GPIO stand-ins for running the display stack headless.
+
+`VirtualDisplay` is the driver behind the "virtual" display type: frames go
+through the same RGB565 framebuffer and SPI write pattern as a real panel, but
+end up in memory (and optionally as PNGs or a raw RGB565 stream) instead.
+
+`install_mock_hardware()` puts `MockSpiDev` and `MockGPIO` in place of the
+`spidev` and `RPi.GPIO` modules, so the real drivers can be exercised on an
+ordinary Linux box:
+
+    from seedcash.hardware.displays.virtual import install_mock_hardware
+    install_mock_hardware(simulate_timing=True)
+
+    from seedcash.hardware.displays.ili9341 import ILI9341
+    display = ILI9341()
+    display._spi.bytes_written, display._spi.bus_time
+"""
+
+import math
+import os
+import struct
+import sys
+import time
+import types
+
+import numpy as np
+from PIL import Image
+
+from seedcash.hardware.displays.base import (
+    MIPI_DCS_VSCRDEF,
+    MIPI_DCS_VSCSAD,
+    BaseSPIDisplay,
+)
+from seedcash.hardware.displays.framebuffer import RGB565Framebuffer
+
+# MIPI DCS commands used for the simulated bus traffic
+_INVOFF = 0x20
+_INVON = 0x21
+
+
+class MockSpiDev:
+    """
+    Stand-in for `spidev.SpiDev` that counts what would be written and how long it
+    would occupy the bus at `max_speed_hz`.
+
+    With `simulate_timing`, each write also sleeps for that long, so timings
+    measured around a driver include a realistic transfer time.
+    """
+
+    # Defaults for new instances; set by install_mock_hardware()
+    simulate_timing = False
+    transfer_overhead = 0.0
+
+    def __init__(self, bus: int = None, device: int = None):
+        self.bus = bus
+        self.device = device
+        self.max_speed_hz = 8_000_000
+        self.mode = 0
+        self.bufsiz = 4096
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.bytes_written = 0
+
+        # One transfer per bufsiz chunk, as the kernel driver splits them
+        self.transfers = 0
+
+        # Simulated seconds the bus was busy
+        self.bus_time = 0.0
+
+    def open(self, bus: int, device: int):
+        self.bus = bus
+        self.device = device
+
+    def close(self):
+        pass
+
+    def writebytes(self, data):
+        self._write(len(data))
+
+    def writebytes2(self, data):
+        self._write(len(data))
+
+    def xfer2(self, data, *args):
+        self._write(len(data))
+        return [0] * len(data)
+
+    def _write(self, length: int):
+        transfers = max(1, math.ceil(length / self.bufsiz))
+        duration = length * 8 / self.max_speed_hz + transfers * self.transfer_overhead
+
+        self.bytes_written += length
+        self.transfers += transfers
+        self.bus_time += duration
+        if self.simulate_timing:
+            time.sleep(duration)
+
+
+class MockGPIO:
+    """
+    Stand-in for the `RPi.GPIO` module. Inputs read as HIGH, i.e. no button is
+    pressed; `output_count` counts pin writes (e.g. DC toggles).
+    """
+
+    BOARD = 10
+    BCM = 11
+    OUT = 0
+    IN = 1
+    LOW = 0
+    HIGH = 1
+    PUD_OFF = 20
+    PUD_DOWN = 21
+    PUD_UP = 22
+    RISING = 31
+    FALLING = 32
+    BOTH = 33
+
+    RPI_INFO = {"P1_REVISION": 3, "TYPE": "Virtual"}
+
+    output_count = 0
+
+    @classmethod
+    def setmode(cls, mode):
+        pass
+
+    @classmethod
+    def setwarnings(cls, enabled):
+        pass
+
+    @classmethod
+    def setup(cls, channel, direction, pull_up_down=None, initial=None):
+        pass
+
+    @classmethod
+    def output(cls, channel, state):
+        cls.output_count += 1
+
+    @classmethod
+    def input(cls, channel):
+        return cls.HIGH
+
+    @classmethod
+    def add_event_detect(cls, channel, edge, callback=None, bouncetime=None):
+        pass
+
+    @classmethod
+    def remove_event_detect(cls, channel):
+        pass
+
+    @classmethod
+    def cleanup(cls, channel=None):
+        pass
+
+
+def install_mock_hardware(
+    simulate_timing: bool = False, transfer_overhead: float = 0.0, force: bool = False
+):
+    """
+    Register `MockSpiDev` and `MockGPIO` as the `spidev` and `RPi.GPIO` modules.
+
+    Real modules that are importable are left alone unless `force` is set. Must be
+    called before the display drivers are imported.
+    """
+    MockSpiDev.simulate_timing = simulate_timing
+    MockSpiDev.transfer_overhead = transfer_overhead
+
+    def is_available(name):
+        if force:
+            return False
+        try:
+            __import__(name)
+            return True
+        except (ImportError, RuntimeError):
+            # RPi.GPIO raises RuntimeError when not running on a Raspberry Pi
+            return False
+
+    if not is_available("spidev"):
+        spidev = types.ModuleType("spidev")
+        spidev.SpiDev = MockSpiDev
+        sys.modules["spidev"] = spidev
+
+    if not is_available("RPi.GPIO"):
+        rpi = types.ModuleType("RPi")
+        rpi.GPIO = MockGPIO
+        sys.modules["RPi"] = rpi
+        sys.modules["RPi.GPIO"] = MockGPIO
+
+
+class VirtualDisplay(BaseSPIDisplay):
+    """
+    Display that keeps its frames in memory instead of on a panel.
+
+    Every update is converted into an RGB565 framebuffer and written, with the
+    usual window commands, to a `MockSpiDev` clocked at `spi_speed_hz`, so
+    conversion cost and bus traffic match a real SPI display of that size.
+
+    The data written lands in an emulated display memory at the addressed window,
+    and `to_image()` reads it back through the vertical scrolling registers the way
+    the panel scans it out. Wrong window addresses or scroll offsets therefore show
+    up in what the display shows, just as on a real panel.
+
+    If `png_dir` is set, each frame is saved there as a PNG; if `raw_stream` is
+    set, each frame is appended to that file as raw big-endian RGB565, e.g. for
+    `ffmpeg -f rawvideo -pixel_format rgb565be -video_size 240x240 -i <file>`. A
+    frame ends with `end_frame()`, however many windows it was written in.
+    """
+
+    def __init__(
+        self,
+        width: int = 240,
+        height: int = 240,
+        spi_speed_hz: int = 40_000_000,
+        simulate_timing: bool = None,
+        png_dir: str = None,
+        raw_stream: str = None,
+    ):
+        self.width = width
+        self.height = height
+        self.inverted = False
+        self.frame_count = 0
+
+        # Conversion buffer in image coordinates, as the real drivers have
+        self.framebuffer = RGB565Framebuffer(width, height)
+
+        self.spi = MockSpiDev(0, 0)
+        self.spi.max_speed_hz = spi_speed_hz
+        if simulate_timing is not None:
+            self.spi.simulate_timing = simulate_timing
+        super().__init__(self.spi, None, MockGPIO)
+        self.MEMORY_ROWS = height
+
+        # Display memory, the addressed window with the next pixel to write in it
+        # and the vertical scrolling registers (tfa, vsa, bfa, vssa) at their reset
+        # values.
+        self.memory = np.zeros((height, width), dtype=">u2")
+        self._ram_window = None
+        self._ram_position = 0
+        self._vertical_scroll = (0, height, 0, 0)
+
+        self.png_dir = png_dir
+        if png_dir:
+            os.makedirs(png_dir, exist_ok=True)
+
+        self._raw_stream = open(raw_stream, "wb") if raw_stream else None
+
+    def command(self, cmd: int, data: bytes = None):
+        self.write_command(cmd, data)
+
+    def write_command(self, cmd: int, params: bytes = None):
+        super().write_command(cmd, params)
+        tfa, vsa, bfa, vssa = self._vertical_scroll
+        if cmd == MIPI_DCS_VSCRDEF:
+            tfa, vsa, bfa = struct.unpack(">HHH", params)
+        elif cmd == MIPI_DCS_VSCSAD:
+            (vssa,) = struct.unpack(">H", params)
+        self._vertical_scroll = (tfa, vsa, bfa, vssa)
+
+    def start_write(self, x0: int, y0: int, x1: int, y1: int):
+        super().start_write(x0, y0, x1, y1)
+        self._ram_window = (x0, y0, x1, y1)
+        self._ram_position = 0
+
+    def write_data(self, data):
+        super().write_data(data)
+        if self._ram_window is None:
+            return
+
+        # Pixels fill the window row by row, continuing where the last write ended
+        x0, y0, x1, y1 = self._ram_window
+        width = x1 - x0 + 1
+        pixels = np.frombuffer(data, dtype=">u2")
+        if self._ram_position == 0 and len(pixels) == width * (y1 - y0 + 1):
+            self.memory[y0 : y1 + 1, x0 : x1 + 1] = pixels.reshape(-1, width)
+        else:
+            index = np.arange(self._ram_position, self._ram_position + len(pixels))
+            self.memory[y0 + index // width, x0 + index % width] = pixels
+        self._ram_position += len(pixels)
+
+    def invert(self, enabled: bool = True):
+        self.command(_INVON if enabled else _INVOFF)
+        self.inverted = enabled
+
+    def set_window(self, x0: int, y0: int, x1: int, y1: int):
+        """
+        Address the window from (x0, y0) to (x1, y1), inclusive.
+        """
+        self.start_write(x0, y0, x1, y1)
+
+    def show_image(self, image, x_start: int = 0, y_start: int = 0, region=None):
+        if image.size != (self.width, self.height):
+            raise ValueError(
+                f"Image must be same dimensions as display ({self.width}x{self.height})."
+            )
+
+        # Converted in image coordinates; the windows follow the scrolled layout
+        # of display memory.
+        box = self.framebuffer.update(image, region)
+        for (x0, y0, x1, y1), (x, y) in self._scroll_windows(box):
+            self.set_window(
+                x_start + x,
+                y_start + y,
+                x_start + x + x1 - x0 - 1,
+                y_start + y + y1 - y0 - 1,
+            )
+            self.write_data(self.framebuffer.window_data((x0, y0, x1, y1)))
+
+    def end_frame(self):
+        """
+        Count a finished frame and save it, if frames are being saved.
+        """
+        self.frame_count += 1
+        if self.png_dir:
+            self.to_image().save(
+                os.path.join(self.png_dir, f"frame_{self.frame_count:05d}.png")
+            )
+        if self._raw_stream:
+            self._raw_stream.write(self.shown_framebuffer().buffer)
+
+    def shown_framebuffer(self) -> RGB565Framebuffer:
+        """
+        Return what the display currently shows, in RGB565: display memory read
+        out line by line through the vertical scrolling area.
+        """
+        tfa, vsa, bfa, vssa = self._vertical_scroll
+        lines = np.arange(self.height)
+        if vsa:
+            scrolled = (lines >= tfa) & (lines < tfa + vsa)
+            lines[scrolled] = tfa + (vssa - tfa + lines[scrolled] - tfa) % vsa
+
+        shown = RGB565Framebuffer(self.width, self.height)
+        shown._pixels[...] = self.memory[lines]
+        return shown
+
+    def to_image(self) -> Image.Image:
+        """
+        Return what the display currently shows.
+        """
+        return self.shown_framebuffer().to_image()
+
+    def close(self):
+        if self._raw_stream:
+            self._raw_stream.close()
+            self._raw_stream = None
@@ -3,6 +3,7 @@
 from .cipher import decrypt, encrypt
 from .shamir import (
     EncryptedMasterSecret,
+    extend_group,
     recover_ems,
     split_ems,
 )
@@ -14,6 +15,7 @@ __all__ = [
     "decrypt",
     "generate_mnemonics",
     "split_ems",
+    "extend_group",
     "recover_ems",
     "EncryptedMasterSecret",
     "MnemonicError",
@@ -1,9 +1,12 @@
 import hashlib
+import time
+from typing import Tuple
 
 from .constants import (
     BASE_ITERATION_COUNT,
     CUSTOMIZATION_STRING_ORIG,
     ID_LENGTH_BITS,
+    ITERATION_EXP_LENGTH_BITS,
     ROUND_COUNT,
 )
 from .utils import bits_to_bytes
@@ -71,3 +74,32 @@ def decrypt(
         f = _round_function(i, passphrase, iteration_exponent, salt, r)
         l, r = r, _xor(l, f)
     return r + l
+
+
+def calibrate_iteration_exponent(
+    time_budget: float, sample_count: int = 2
+) -> Tuple[int, float]:
+    """
+    Pick the largest iteration exponent whose encryption, and therefore also
+    recovery on this device, fits in `time_budget` seconds.
+
+    Only `sample_count` round function calls at exponent 0 are timed. Each step of
+    the exponent doubles the PBKDF2 iterations, so the full cipher time is
+    extrapolated from that sample.
+
+    :return: The iteration exponent and the estimated cipher time in seconds.
+    """
+    start = time.perf_counter()
+    for i in range(sample_count):
+        _round_function(i, b"", 0, b"", bytes(16))
+    cipher_time = ROUND_COUNT * (time.perf_counter() - start) / sample_count
+
+    iteration_exponent = 0
+    max_iteration_exponent = (1 << ITERATION_EXP_LENGTH_BITS) - 1
+    while (
+        iteration_exponent < max_iteration_exponent and cipher_time * 2 <= time_budget
+    ):
+        iteration_exponent += 1
+        cipher_time *= 2
+
+    return iteration_exponent, cipher_time
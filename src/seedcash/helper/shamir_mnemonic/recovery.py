@@ -1,9 +1,13 @@
-from collections import defaultdict
-from dataclasses import dataclass, field, replace
 from typing import Any, Dict, Optional, Tuple
 
 from .constants import GROUP_PREFIX_LENGTH_WORDS
-from .shamir import ShareGroup, recover_ems
+from .shamir import (
+    EncryptedMasterSecret,
+    RawShare,
+    ShareGroup,
+    combine_group_shares,
+    recover_group_share,
+)
 from .share import Share, ShareCommonParameters
 from .utils import MnemonicError
 
@@ -11,20 +15,33 @@ UNDETERMINED = -1
 
 
 class RecoveryState:
-    """Object for keeping track of running Shamir recovery."""
+    """Object for keeping track of running Shamir recovery.
+
+    Completion is tracked as shares are added and removed, so every status query is
+    O(1). The secret of a group is interpolated as soon as the group completes, and
+    group prefixes are computed once per set of shares.
+    """
 
     def __init__(self) -> None:
         self.last_share: Optional[Share] = None
-        self.groups: Dict[int, ShareGroup] = defaultdict(ShareGroup)
+        self.groups: Dict[int, ShareGroup] = {}
         self.parameters: Optional[ShareCommonParameters] = None
 
+        # Secrets of the complete groups; None until interpolated
+        self._group_shares: Dict[int, Optional[RawShare]] = {}
+        self._group_prefixes: Dict[int, str] = {}
+
     def group_prefix(self, group_index: int) -> str:
         """Return three starting words of a given group."""
         if not self.last_share:
             raise RuntimeError("Add at least one share first")
 
-        fake_share = replace(self.last_share, group_index=group_index)
-        return " ".join(fake_share.words()[:GROUP_PREFIX_LENGTH_WORDS])
+        if group_index not in self._group_prefixes:
+            fake_share = self.last_share.replace(group_index=group_index)
+            self._group_prefixes[group_index] = " ".join(
+                fake_share.words()[:GROUP_PREFIX_LENGTH_WORDS]
+            )
+        return self._group_prefixes[group_index]
 
     def group_status(self, group_index: int) -> Tuple[int, int]:
         """Return completion status of given group.
@@ -32,7 +49,7 @@ class RecoveryState:
         Result consists of the number of shares already entered, and the threshold
         for recovering the group.
         """
-        group = self.groups[group_index]
+        group = self.groups.get(group_index)
         if not group:
             return 0, UNDETERMINED
 
@@ -40,16 +57,11 @@ class RecoveryState:
 
     def group_is_complete(self, group_index: int) -> bool:
         """Check whether a given group is already complete."""
-        return self.groups[group_index].is_complete()
+        return group_index in self._group_shares
 
     def groups_complete(self) -> int:
         """Return the number of groups that are already complete."""
-        if self.parameters is None:
-            return 0
-
-        return sum(
-            self.group_is_complete(i) for i in range(self.parameters.group_count)
-        )
+        return len(self._group_shares)
 
     def is_complete(self) -> bool:
         """Check whether the recovery set is complete.
@@ -74,12 +86,68 @@ class RecoveryState:
             raise MnemonicError(
                 "This mnemonic is not part of the current set. Please try again."
             )
-        self.groups[share.group_index].add(share)
+        group = self.groups.setdefault(share.group_index, ShareGroup())
+        group.add(share)
         self.last_share = share
         if self.parameters is None:
             self.parameters = share.common_parameters()
+
+        if group.is_complete() and share.group_index not in self._group_shares:
+            self._group_shares[share.group_index] = None
+            try:
+                self.group_share(share.group_index)
+            except MnemonicError:
+                # Reported again by recover_ems(), once the user asks for it
+                pass
         return True
 
+    def remove_share(self, group_index: int, member_index: int) -> Optional[Share]:
+        """Remove a share from the recovery set and return it, if it was there."""
+        group = self.groups.get(group_index)
+        if group is None:
+            return None
+
+        share = group.remove(member_index)
+        if share is None:
+            return None
+
+        if not group:
+            self.remove_group(group_index)
+        elif group.is_complete():
+            # Interpolated again from the remaining shares when needed
+            self._group_shares[group_index] = None
+        else:
+            self._group_shares.pop(group_index, None)
+        return share
+
+    def remove_group(self, group_index: int) -> None:
+        """Remove all shares of a group from the recovery set.
+
+        The common parameters, and the share that group prefixes are derived from,
+        are kept even when no group is left; only `clear()` forgets them.
+        """
+        self.groups.pop(group_index, None)
+        self._group_shares.pop(group_index, None)
+
+    def clear(self) -> None:
+        """Start over with an empty recovery set."""
+        self.last_share = None
+        self.groups.clear()
+        self.parameters = None
+        self._group_shares.clear()
+        self._group_prefixes.clear()
+
+    def group_share(self, group_index: int) -> RawShare:
+        """Return the interpolated secret of a complete group."""
+        if not self.group_is_complete(group_index):
+            raise MnemonicError(f"Group {group_index} is not complete.")
+
+        if self._group_shares[group_index] is None:
+            self._group_shares[group_index] = recover_group_share(
+                group_index, self.groups[group_index]
+            )
+        return self._group_shares[group_index]
+
     def __contains__(self, obj: Any) -> bool:
         if not isinstance(obj, Share):
             return False
@@ -87,23 +155,23 @@ class RecoveryState:
         if not self.matches(obj):
             return False
 
-        if not self.groups:
-            return False
+        group = self.groups.get(obj.group_index)
+        return group is not None and obj in group
+
+    def recover_ems(self) -> EncryptedMasterSecret:
+        """Recover the Encrypted Master Secret from the complete groups."""
+        if self.parameters is None:
+            raise MnemonicError("The set of shares is empty.")
 
-        return obj in self.groups[obj.group_index]
+        # Select a subset of groups which meets the group threshold.
+        group_shares = [
+            self.group_share(group_index)
+            for group_index in sorted(self._group_shares)[
+                : self.parameters.group_threshold
+            ]
+        ]
+        return combine_group_shares(self.parameters, group_shares)
 
     def recover(self, passphrase: bytes) -> bytes:
         """Recover the master secret, given a passphrase."""
-        # Select a subset of shares which meets the thresholds.
-        reduced_groups: Dict[int, ShareGroup] = {}
-        for group_index, group in self.groups.items():
-            if group.is_complete():
-                reduced_groups[group_index] = group.get_minimal_group()
-
-            # some groups have been added so parameters must be known
-            assert self.parameters is not None
-            if len(reduced_groups) >= self.parameters.group_threshold:
-                break
-
-        encrypted_master_secret = recover_ems(reduced_groups)
-        return encrypted_master_secret.decrypt(passphrase)
+        return self.recover_ems().decrypt(passphrase)
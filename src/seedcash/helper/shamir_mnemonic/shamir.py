@@ -22,7 +22,17 @@
 import hmac
 import secrets
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, List, NamedTuple, Sequence, Set, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from . import cipher
 from .constants import (
@@ -46,6 +56,7 @@ class RawShare(NamedTuple):
 class ShareGroup:
     def __init__(self) -> None:
         self.shares: Set[Share] = set()
+        self.members: Dict[int, Share] = {}
 
     def __iter__(self) -> Iterator[Share]:
         return iter(self.shares)
@@ -71,16 +82,29 @@ class ShareGroup:
                 f"Invalid set of mnemonics. The {mismatch} parameters don't match."
             )
 
+        existing = self.members.get(share.index)
+        if existing is not None and existing != share:
+            raise MnemonicError("Invalid set of shares. Share indices must be unique.")
+
         self.shares.add(share)
+        self.members[share.index] = share
+
+    def get(self, member_index: int) -> Optional[Share]:
+        return self.members.get(member_index)
+
+    def remove(self, member_index: int) -> Optional[Share]:
+        share = self.members.pop(member_index, None)
+        if share is not None:
+            self.shares.discard(share)
+        return share
 
     def to_raw_shares(self) -> List[RawShare]:
         return [RawShare(s.index, s.value) for s in self.shares]
 
     def get_minimal_group(self) -> "ShareGroup":
         group = ShareGroup()
-        group.shares = set(
-            share for _, share in zip(range(self.member_threshold()), self.shares)
-        )
+        for _, share in zip(range(self.member_threshold()), self.shares):
+            group.add(share)
         return group
 
     def common_parameters(self) -> ShareCommonParameters:
@@ -336,6 +360,62 @@ def split_ems(
     ]
 
 
+def extend_group(group: ShareGroup, member_indices: Sequence[int]) -> List[Share]:
+    """
+    Create additional member shares for an existing group.
+
+    The group polynomial is fully determined by any `member_threshold` shares of the
+    group, so new members are obtained by evaluating it at the new indices. Neither
+    the Encrypted Master Secret nor the group secret is reconstructed, and no PBKDF2
+    rounds are run.
+
+    :param group: A complete group of shares.
+    :param member_indices: The member indices of the shares to create.
+    :return: List of the new shares, in the order of `member_indices`.
+    """
+    if not group.is_complete():
+        raise MnemonicError(
+            "Insufficient number of mnemonics. "
+            f"The required number of shares is {group.member_threshold()}."
+        )
+
+    if group.member_threshold() == 1:
+        raise ValueError(
+            "Creating multiple member shares with member threshold 1 is not allowed. "
+            "Use 1-of-1 member sharing instead."
+        )
+
+    existing_indices = set(share.index for share in group)
+    if len(set(member_indices)) != len(member_indices):
+        raise ValueError("The requested member indices must be unique.")
+
+    for member_index in member_indices:
+        if not 0 <= member_index < MAX_SHARE_COUNT:
+            raise ValueError(
+                f"The member index must be between 0 and {MAX_SHARE_COUNT - 1}."
+            )
+        if member_index in existing_indices:
+            raise ValueError(f"Share with member index {member_index} already exists.")
+
+    template = next(iter(group))
+    raw_shares = group.get_minimal_group().to_raw_shares()
+
+    return [
+        Share(
+            template.identifier,
+            template.extendable,
+            template.iteration_exponent,
+            template.group_index,
+            template.group_threshold,
+            template.group_count,
+            member_index,
+            template.member_threshold,
+            _interpolate(raw_shares, member_index),
+        )
+        for member_index in member_indices
+    ]
+
+
 def _random_identifier() -> int:
     """Returns a random identifier with the given bit length."""
     identifier = int.from_bytes(RANDOM_BYTES(bits_to_bytes(ID_LENGTH_BITS)), "big")
@@ -370,20 +450,44 @@ def recover_ems(groups: Dict[int, ShareGroup]) -> EncryptedMasterSecret:
 
     params = next(iter(groups.values())).common_parameters()
 
-    if len(groups) < params.group_threshold:
+    group_shares = [
+        recover_group_share(group_index, group) for group_index, group in groups.items()
+    ]
+
+    return combine_group_shares(params, group_shares)
+
+
+def recover_group_share(group_index: int, group: ShareGroup) -> RawShare:
+    """
+    Interpolate the secret of a single complete group, i.e. its share of the EMS.
+
+    :param group_index: The index of the group.
+    :param group: The shares of the group, at least `member_threshold` of them.
+    :return: The group's share of the Encrypted Master Secret.
+    """
+    return RawShare(
+        group_index,
+        _recover_secret(group.member_threshold(), group.to_raw_shares()),
+    )
+
+
+def combine_group_shares(
+    params: ShareCommonParameters, group_shares: Sequence[RawShare]
+) -> EncryptedMasterSecret:
+    """
+    Combine the secrets of complete groups, as returned by `recover_group_share`,
+    into the Encrypted Master Secret.
+
+    :param params: The common parameters of the shares.
+    :param group_shares: At least `params.group_threshold` group secrets.
+    :return: Encrypted Master Secret
+    """
+    if len(group_shares) < params.group_threshold:
         raise MnemonicError(
             "Insufficient number of mnemonic groups. "
             f"The required number of complete groups is {params.group_threshold}."
         )
 
-    group_shares = [
-        RawShare(
-            group_index,
-            _recover_secret(group.member_threshold(), group.to_raw_shares()),
-        )
-        for group_index, group in groups.items()
-    ]
-
     ciphertext = _recover_secret(params.group_threshold, group_shares)
     return EncryptedMasterSecret(
         params.identifier, params.extendable, params.iteration_exponent, ciphertext
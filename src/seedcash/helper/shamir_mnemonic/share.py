@@ -1,5 +1,4 @@
-from dataclasses import dataclass
-from typing import Iterable, List, NamedTuple
+from typing import Any, Iterable, List, NamedTuple, Tuple
 
 from . import rs1024, wordlist
 from .constants import (
@@ -17,6 +16,10 @@ from .utils import MnemonicError, bits_to_bytes, bits_to_words, int_to_indices
 
 WordIndex = int
 
+# Identifier, extendable flag and iteration exponent, followed by the share params
+METADATA_PREFIX_LENGTH_WORDS = ID_EXP_LENGTH_WORDS + 2
+_SHARE_PARAMS_LENGTH_BITS = 2 * RADIX_BITS
+
 
 def _int_to_word_indices(value: int, length: int) -> List[WordIndex]:
     """Converts an integer value to a list of base 1024 indices in big endian order."""
@@ -60,19 +63,140 @@ class ShareGroupParameters(NamedTuple):
     member_threshold: int
 
 
-@dataclass(frozen=True)
 class Share:
-    """Represents a single mnemonic share and its metadata"""
+    """Represents a single mnemonic share and its metadata
+
+    The metadata is packed into one integer laid out exactly like the first
+    ID_EXP_LENGTH_WORDS + 2 words of the mnemonic (identifier, extendable flag,
+    iteration exponent, then five 4-bit share parameters), so a share costs one
+    int and one bytes object. Shares are immutable.
+    """
+
+    __slots__ = ("_metadata", "value", "_words")
+
+    def __init__(
+        self,
+        identifier: int,
+        extendable: bool,
+        iteration_exponent: int,
+        group_index: int,
+        group_threshold: int,
+        group_count: int,
+        index: int,
+        member_threshold: int,
+        value: bytes,
+    ):
+        id_exp = identifier << (ITERATION_EXP_LENGTH_BITS + EXTENDABLE_FLAG_LENGTH_BITS)
+        id_exp |= int(extendable) << ITERATION_EXP_LENGTH_BITS
+        id_exp |= iteration_exponent
+
+        share_params = 0
+        for param in (
+            group_index,
+            group_threshold - 1,
+            group_count - 1,
+            index,
+            member_threshold - 1,
+        ):
+            if not 0 <= param < 16:
+                raise ValueError("Share parameters must fit in 4 bits.")
+            share_params = (share_params << 4) | param
 
-    identifier: int
-    extendable: bool
-    iteration_exponent: int
-    group_index: int
-    group_threshold: int
-    group_count: int
-    index: int
-    member_threshold: int
-    value: bytes
+        self._init((id_exp << _SHARE_PARAMS_LENGTH_BITS) | share_params, bytes(value))
+
+    def _init(self, metadata: int, value: bytes) -> None:
+        object.__setattr__(self, "_metadata", metadata)
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "_words", None)
+
+    @classmethod
+    def _from_metadata(cls, metadata: int, value: bytes) -> "Share":
+        share = cls.__new__(cls)
+        share._init(metadata, value)
+        return share
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Share):
+            return NotImplemented
+        return self._metadata == other._metadata and self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash((self._metadata, self.value))
+
+    def __repr__(self) -> str:
+        return (
+            f"Share(identifier={self.identifier}, extendable={self.extendable}, "
+            f"iteration_exponent={self.iteration_exponent}, "
+            f"group_index={self.group_index}, group_threshold={self.group_threshold}, "
+            f"group_count={self.group_count}, index={self.index}, "
+            f"member_threshold={self.member_threshold}, value={self.value!r})"
+        )
+
+    def __reduce__(self):
+        return Share._from_metadata, (self._metadata, self.value)
+
+    def _param(self, shift: int) -> int:
+        return (self._metadata >> shift) & 0xF
+
+    @property
+    def identifier(self) -> int:
+        return self._metadata >> (
+            _SHARE_PARAMS_LENGTH_BITS
+            + ITERATION_EXP_LENGTH_BITS
+            + EXTENDABLE_FLAG_LENGTH_BITS
+        )
+
+    @property
+    def extendable(self) -> bool:
+        return bool(
+            (self._metadata >> (_SHARE_PARAMS_LENGTH_BITS + ITERATION_EXP_LENGTH_BITS))
+            & 1
+        )
+
+    @property
+    def iteration_exponent(self) -> int:
+        return (self._metadata >> _SHARE_PARAMS_LENGTH_BITS) & (
+            (1 << ITERATION_EXP_LENGTH_BITS) - 1
+        )
+
+    @property
+    def group_index(self) -> int:
+        return self._param(16)
+
+    @property
+    def group_threshold(self) -> int:
+        return self._param(12) + 1
+
+    @property
+    def group_count(self) -> int:
+        return self._param(8) + 1
+
+    @property
+    def index(self) -> int:
+        return self._param(4)
+
+    @property
+    def member_threshold(self) -> int:
+        return self._param(0) + 1
+
+    def replace(self, **changes: Any) -> "Share":
+        """Return a copy of the share with the given fields replaced."""
+        fields = {
+            "identifier": self.identifier,
+            "extendable": self.extendable,
+            "iteration_exponent": self.iteration_exponent,
+            "group_index": self.group_index,
+            "group_threshold": self.group_threshold,
+            "group_count": self.group_count,
+            "index": self.index,
+            "member_threshold": self.member_threshold,
+            "value": self.value,
+        }
+        fields.update(changes)
+        return Share(**fields)
 
     def common_parameters(self) -> ShareCommonParameters:
         """Return values that uniquely identify a matching set of shares."""
@@ -96,45 +220,36 @@ class Share:
             self.member_threshold,
         )
 
-    def _encode_id_exp(self) -> List[WordIndex]:
-        id_exp_int = self.identifier << (
-            ITERATION_EXP_LENGTH_BITS + EXTENDABLE_FLAG_LENGTH_BITS
-        )
-        id_exp_int += self.extendable << ITERATION_EXP_LENGTH_BITS
-        id_exp_int += self.iteration_exponent
-        return _int_to_word_indices(id_exp_int, ID_EXP_LENGTH_WORDS)
-
-    def _encode_share_params(self) -> List[WordIndex]:
-        # each value is 4 bits, for 20 bits total
-        val = self.group_index
-        val <<= 4
-        val += self.group_threshold - 1
-        val <<= 4
-        val += self.group_count - 1
-        val <<= 4
-        val += self.index
-        val <<= 4
-        val += self.member_threshold - 1
-        # group parameters are 2 words
-        return _int_to_word_indices(val, 2)
-
     def words(self) -> List[str]:
         """Convert share data to a share mnemonic."""
+        return list(self._encode_words())
+
+    def _encode_words(self) -> Tuple[str, ...]:
+        # Encoding runs the RS1024 checksum, so it is done once per share. Shares
+        # are immutable, so the cached words can never go stale.
+        if self._words is None:
+            value_word_count = bits_to_words(len(self.value) * 8)
+            value_int = int.from_bytes(self.value, "big")
+            value_data = _int_to_word_indices(value_int, value_word_count)
+
+            share_data = (
+                _int_to_word_indices(self._metadata, METADATA_PREFIX_LENGTH_WORDS)
+                + value_data
+            )
+            checksum = rs1024.create_checksum(
+                share_data, _customization_string(self.extendable)
+            )
+            object.__setattr__(
+                self,
+                "_words",
+                tuple(wordlist.words_from_indices(share_data + checksum)),
+            )
 
-        value_word_count = bits_to_words(len(self.value) * 8)
-        value_int = int.from_bytes(self.value, "big")
-        value_data = _int_to_word_indices(value_int, value_word_count)
-
-        share_data = self._encode_id_exp() + self._encode_share_params() + value_data
-        checksum = rs1024.create_checksum(
-            share_data, _customization_string(self.extendable)
-        )
-
-        return list(wordlist.words_from_indices(share_data + checksum))
+        return self._words
 
     def mnemonic(self) -> str:
         """Convert share data to a share mnemonic."""
-        return " ".join(self.words())
+        return " ".join(self._encode_words())
 
     @classmethod
     def from_mnemonic(cls, mnemonic: str) -> "Share":
@@ -152,28 +267,16 @@ class Share:
         if padding_len > 8:
             raise MnemonicError("Invalid mnemonic length.")
 
-        id_exp_data = mnemonic_data[:ID_EXP_LENGTH_WORDS]
-        id_exp_int = _int_from_word_indices(id_exp_data)
-
-        identifier = id_exp_int >> (
-            EXTENDABLE_FLAG_LENGTH_BITS + ITERATION_EXP_LENGTH_BITS
+        # The packed metadata of a Share is the integer value of these words
+        metadata = _int_from_word_indices(mnemonic_data[:METADATA_PREFIX_LENGTH_WORDS])
+        extendable = bool(
+            (metadata >> (_SHARE_PARAMS_LENGTH_BITS + ITERATION_EXP_LENGTH_BITS)) & 1
         )
-        extendable = bool((id_exp_int >> ITERATION_EXP_LENGTH_BITS) & 1)
-        iteration_exponent = id_exp_int & ((1 << ITERATION_EXP_LENGTH_BITS) - 1)
 
         if not rs1024.verify_checksum(mnemonic_data, _customization_string(extendable)):
             raise MnemonicError("Invalid mnemonic checksum")
 
-        share_params_data = mnemonic_data[ID_EXP_LENGTH_WORDS : ID_EXP_LENGTH_WORDS + 2]
-        share_params_int = _int_from_word_indices(share_params_data)
-        share_params = int_to_indices(share_params_int, 5, 4)
-        (
-            group_index,
-            group_threshold,
-            group_count,
-            index,
-            member_threshold,
-        ) = share_params
+        _, group_threshold, group_count, _, _ = int_to_indices(metadata, 5, 4)
 
         if group_count < group_threshold:
             raise MnemonicError(
@@ -196,14 +299,4 @@ class Share:
                 )
             ) from None
 
-        return cls(
-            identifier,
-            extendable,
-            iteration_exponent,
-            group_index,
-            group_threshold + 1,
-            group_count + 1,
-            index,
-            member_threshold + 1,
-            value,
-        )
+        return cls._from_metadata(metadata, value)
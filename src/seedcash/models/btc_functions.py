@@ -513,13 +513,25 @@ class BitcoinFunctions:
 
         return random_bits_binary
 
+    # Wallets were first derived from bytes.fromhex() of the master secret's
+    # '0101...' bit string, i.e. every pair of bits became one byte (0x00, 0x01,
+    # 0x10 or 0x11). This table expands each byte the same way without building
+    # the string, so existing shares keep deriving the same wallet.
+    _SLIP39_SEED_EXPANSION = [
+        bytes(
+            ((byte >> shift) & 2) << 3 | ((byte >> shift) & 1) for shift in (6, 4, 2, 0)
+        )
+        for byte in range(256)
+    ]
+
     @staticmethod
-    def slip39_protocol(master_secret: str):
+    def slip39_protocol(master_secret: bytes):
         # getting private master key and chain code using the master secret
+        seed = b"".join(
+            BitcoinFunctions._SLIP39_SEED_EXPANSION[byte] for byte in master_secret
+        )
 
-        hmac_hash = hmac.new(
-            b"Bitcoin seed", bytes.fromhex(master_secret), hashlib.sha512
-        ).digest()
+        hmac_hash = hmac.new(b"Bitcoin seed", seed, hashlib.sha512).digest()
 
         private_master_key = hmac_hash[:32]
         private_master_code = hmac_hash[32:]
@@ -1,15 +1,19 @@
-from typing import Dict, List, Tuple
+from threading import Event, Lock
+from typing import Dict, List, Tuple, Union
 
+from seedcash.helper.shamir_mnemonic.constants import MAX_SHARE_COUNT
+from seedcash.helper.shamir_mnemonic.recovery import RecoveryState
 from seedcash.helper.shamir_mnemonic.share import Share, ShareCommonParameters
 from seedcash.helper.shamir_mnemonic.shamir import (
     EncryptedMasterSecret,
     ShareGroup,
     _random_identifier,
-    recover_ems,
+    extend_group,
     split_ems,
 )
 from seedcash.models.wallet import Wallet
 from seedcash.models.btc_functions import BitcoinFunctions as bf
+from seedcash.models.threads import BaseThread
 
 import logging
 
@@ -33,7 +37,7 @@ class SchemeParameters:
     Represents the parameters of a Shamir Secret Sharing scheme.
     """
 
-    def __init__(self, bits: str = None):
+    def __init__(self, bits: Union[str, bytes] = None):
         if bits is None:
             raise InvalidSchemeException(
                 "Either bits or groups must be provided to initialize the scheme."
@@ -64,14 +68,22 @@ class SchemeParameters:
     def _groups_length(self) -> int:
         return len(self.groups)
 
-    def set_bits(self, bits: str):
+    def set_bits(self, bits: Union[str, bytes]):
+        """
+        Set the master secret, either as raw bytes or as a '0101...' string of bits
+        entered by the user.
+        """
         if not bits:
             raise ValueError("Bits cannot be empty.")
 
-        if len(bits) not in [128, 256]:
+        bit_length = len(bits) * 8 if isinstance(bits, bytes) else len(bits)
+        if bit_length not in [128, 256]:
             raise ValueError("Scheme Parameters must initialize with 128 or 256.")
-        # Convert str to bytes
-        self.bits = int(bits, 2).to_bytes((len(bits) + 7) // 8, byteorder="big")
+
+        if isinstance(bits, bytes):
+            self.bits = bits
+        else:
+            self.bits = int(bits, 2).to_bytes(bit_length // 8, byteorder="big")
 
     def set_groups_length(self, length: int):
         """
@@ -127,9 +139,36 @@ class SchemeParameters:
         return self.bits, self.group_threshold, self.groups
 
 
+class DecryptMasterSecretThread(BaseThread):
+    """
+    Runs the PBKDF2 Feistel decryption of a complete scheme ahead of time, so the
+    result is usually already cached when the wallet is generated.
+    """
+
+    def __init__(self, scheme: "Scheme", passphrase: bytes):
+        super().__init__()
+        self.scheme = scheme
+        self.passphrase = passphrase
+
+    def run(self):
+        try:
+            self.scheme.decrypt_master_secret(self.passphrase)
+        except Exception as e:
+            # The foreground recovery will surface the same error to the user
+            logger.info(f"Speculative master secret decryption failed: {e}")
+
+
 class Scheme:
     """
     Manages Shamir Secret Sharing scheme with progressive share entry and analysis.
+
+    Shares are tracked by a RecoveryState, which keeps the completion status up to
+    date as shares are added or discarded and interpolates each group's secret as
+    soon as the group completes.
+
+    The Encrypted Master Secret interpolated from the current share set and every
+    master secret decrypted from it are cached (per passphrase) until the share set
+    changes, so repeated wallet generation does not re-run the PBKDF2 rounds.
     """
 
     def __init__(
@@ -142,17 +181,37 @@ class Scheme:
             )
         # variables for loading the scheme
         self.scheme_parameters: SchemeParameters = scheme_parameters
-        self.groups: Dict[int, ShareGroup] = {}
+        self.recovery_state = RecoveryState()
         self.passphrase: bytes = b""
-        self.common_params: List[ShareCommonParameters] = []
         self.wallet: Wallet = None
-        self.master_secret: str = None
+        self.master_secret: bytes = None
+
+        # Set when the iteration exponent was calibrated to this device
+        self.iteration_exponent: int = None
+        self.cipher_time_estimate: float = None
+
+        # Recovery caches; only valid for the current share set
+        self._decrypt_lock = Lock()
+        self._share_set_version = 0
+        self._encrypted_master_secret: EncryptedMasterSecret = None
+        self._decrypted_master_secrets: Dict[bytes, bytes] = {}
+        self._pending_decryptions: Dict[bytes, Event] = {}
 
         if mnemonics:
             self.add_share(mnemonics)
 
         if scheme_parameters:
-            self.master_secret = self.scheme_parameters._bits
+            self.master_secret = self.scheme_parameters.bits
+
+    @property
+    def groups(self) -> Dict[int, ShareGroup]:
+        return self.recovery_state.groups
+
+    @property
+    def common_params(self) -> List[ShareCommonParameters]:
+        if self.recovery_state.parameters is None:
+            return []
+        return [self.recovery_state.parameters]
 
     @property
     def _wallet(self):
@@ -169,9 +228,7 @@ class Scheme:
         if not master_secret:
             raise InvalidSchemeException("Master secret cannot be empty.")
 
-        self.master_secret = bin(int.from_bytes(master_secret, byteorder="big"))[
-            2:
-        ].zfill(len(master_secret) * 8)
+        self.master_secret = master_secret
 
     def get_group_indices(self) -> List[int]:
         """
@@ -186,7 +243,17 @@ class Scheme:
         if group_index not in self.groups:
             return None
 
-        return sorted([share.index for share in self.groups[group_index].shares])
+        return sorted(self.groups[group_index].members)
+
+    def get_share(self, share_index: int, group_index: int) -> Share:
+        """
+        Returns a specific share in a group, or None if it is not in the scheme.
+        """
+        group = self.groups.get(group_index)
+        if group is None:
+            return None
+
+        return group.get(share_index)
 
     def get_mnemonics_share_of_group(
         self, share_index: int, group_index: int
@@ -194,15 +261,11 @@ class Scheme:
         """
         Returns the mnemonic of a specific share in a group.
         """
-        if group_index not in self.groups:
+        share = self.get_share(share_index, group_index)
+        if share is None:
             return None
 
-        group = self.groups[group_index]
-        for share in group.shares:
-            if share.index == share_index:
-                return share.mnemonic().split()
-
-        return None
+        return share.words()
 
     def get_scheme_info(self):
         """
@@ -211,12 +274,8 @@ class Scheme:
         """
         total_groups = self.common_params[0].group_count
         group_threshold = self.common_params[0].group_threshold
-        processed_groups = self.groups.__len__()
-
-        # completed_groups
-        self.completed_groups = len(
-            [group for group in self.groups.values() if group.is_complete()]
-        )
+        processed_groups = len(self.groups)
+        self.completed_groups = self.recovery_state.groups_complete()
 
         # processed, threshold, total
         return processed_groups, group_threshold, total_groups, self.completed_groups
@@ -229,20 +288,22 @@ class Scheme:
         if group_index not in self.groups:
             return None
 
-        group = self.groups[group_index]
-        shares_count = group.__len__()
-        member_threshold = group.member_threshold()
-
         # processed, threshold
-        return shares_count, member_threshold
+        return self.recovery_state.group_status(group_index)
+
+    def get_group_prefix(self, group_index: int) -> str:
+        """
+        Returns the first words that every share of a group starts with.
+        """
+        return self.recovery_state.group_prefix(group_index)
 
     def discard_scheme(self):
         """
         Discards the current scheme and resets the manager.
         """
-        self.groups.clear()
-        self.common_params.clear()
+        self.recovery_state.clear()
         self.master_secret = None
+        self._invalidate_recovery_cache()
         print("Scheme discarded. All data reset.")
 
     def discard_group(self, group_id: int):
@@ -250,7 +311,8 @@ class Scheme:
         Discards a specific group by its ID.
         """
         if group_id in self.groups:
-            del self.groups[group_id]
+            self.recovery_state.remove_group(group_id)
+            self._invalidate_recovery_cache()
             print(f"Group {group_id} discarded.")
         else:
             print(f"Group {group_id} does not exist.")
@@ -259,46 +321,128 @@ class Scheme:
         """
         Discards a specific share in a group.
         """
-        if group_id in self.groups:
-            group = self.groups[group_id]
-            if group.__len__() == 1:
-                del self.groups[group_id]
-
-            for share in group.shares:
-                if share.index == share_index:
-                    group.shares.remove(share)
-                    print(f"Share {share_index} in Group {group_id} discarded.")
-                    return
-            print(f"Share {share_index} not found in Group {group_id}.")
-        else:
+        if group_id not in self.groups:
             print(f"Group {group_id} does not exist.")
+            return
+
+        if self.recovery_state.remove_share(group_id, share_index) is None:
+            print(f"Share {share_index} not found in Group {group_id}.")
+            return
+
+        self._invalidate_recovery_cache()
+        print(f"Share {share_index} in Group {group_id} discarded.")
 
     def add_share(self, share_list: List[str]) -> Dict[str, str]:
 
         share_str = " ".join(share_list)  # Normalize spaces
         share = Share.from_mnemonic(share_str)
 
-        if len(self.groups) == 0:
-            # if no groups yet, initialize a group with the share
-            self.common_params.append(share.common_parameters())
-            group = self.groups.setdefault(share.group_index, ShareGroup())
-            group.add(share)
+        if not self.recovery_state.matches(share):
+            raise InvalidShareException("Share does not match scheme")
 
-        else:
-            if share.common_parameters() not in self.common_params:
-                raise InvalidShareException("Share does not match scheme")
-            else:
-                # Add to existing group
-                group = self.groups.setdefault(share.group_index, ShareGroup())
-                group.add(share)
-                print(f"Share {share.index} added to Group {share.group_index}.")
+        self.recovery_state.add_share(share)
+        print(f"Share {share.index} added to Group {share.group_index}.")
+
+        self._invalidate_recovery_cache()
+        if self.is_complete():
+            DecryptMasterSecretThread(self, self.passphrase).start()
 
         return {"status": "added", "message": "Mnemonic added successfully"}
 
+    def add_shares_to_group(self, group_index: int, count: int) -> List[int]:
+        """
+        Adds `count` new shares to an existing, complete group.
+
+        The new shares are interpolated from the group's existing shares, so the
+        master secret is never decrypted and the passphrase is not needed.
+        Returns the indices of the new shares.
+        """
+        if group_index not in self.groups:
+            raise InvalidGroupException(f"Group {group_index} does not exist.")
+
+        group = self.groups[group_index]
+        if not group.is_complete():
+            raise InvalidGroupException(
+                f"Group {group_index} needs {group.member_threshold()} shares to be extended."
+            )
+
+        new_indices = [i for i in range(MAX_SHARE_COUNT) if i not in group.members][
+            :count
+        ]
+        if len(new_indices) < count:
+            raise InvalidGroupException(
+                f"A group cannot have more than {MAX_SHARE_COUNT} shares."
+            )
+
+        for share in extend_group(group, new_indices):
+            self.recovery_state.add_share(share)
+
+        if self.scheme_parameters:
+            member_threshold, member_count = self.scheme_parameters.get_group_at(
+                group_index
+            )
+            self.scheme_parameters.update_groups(
+                group_index, (member_threshold, member_count + count)
+            )
+
+        logger.info("Added shares %s to Group %d.", new_indices, group_index)
+        return new_indices
+
+    def _invalidate_recovery_cache(self):
+        """
+        Must be called whenever the share set changes.
+        """
+        with self._decrypt_lock:
+            self._share_set_version += 1
+            self._encrypted_master_secret = None
+            self._decrypted_master_secrets.clear()
+            self._pending_decryptions.clear()
+
+    def get_encrypted_master_secret(self) -> EncryptedMasterSecret:
+        """
+        Returns the Encrypted Master Secret of the current share set, interpolating
+        the groups only on first use.
+        """
+        with self._decrypt_lock:
+            if not self._encrypted_master_secret:
+                self._encrypted_master_secret = self.recovery_state.recover_ems()
+            return self._encrypted_master_secret
+
+    def decrypt_master_secret(self, passphrase: bytes) -> bytes:
+        """
+        Returns the master secret for `passphrase`, running the PBKDF2 Feistel
+        decryption only once per passphrase for the current share set.
+        """
+        with self._decrypt_lock:
+            if passphrase in self._decrypted_master_secrets:
+                return self._decrypted_master_secrets[passphrase]
+
+            in_progress = self._pending_decryptions.get(passphrase)
+            if not in_progress:
+                done = self._pending_decryptions[passphrase] = Event()
+            share_set_version = self._share_set_version
+
+        if in_progress:
+            # Another thread (usually the speculative one) is already on it
+            in_progress.wait()
+            return self.decrypt_master_secret(passphrase)
+
+        master_secret = None
+        try:
+            master_secret = self.get_encrypted_master_secret().decrypt(passphrase)
+        finally:
+            with self._decrypt_lock:
+                if share_set_version == self._share_set_version:
+                    if master_secret is not None:
+                        self._decrypted_master_secrets[passphrase] = master_secret
+                    del self._pending_decryptions[passphrase]
+                done.set()
+
+        return master_secret
+
     def recover_secret(self) -> bytes:
         try:
-            encrypted_master_secret = recover_ems(self.groups)
-            self.set_master_secret(encrypted_master_secret.decrypt(self.passphrase))
+            self.set_master_secret(self.decrypt_master_secret(self.passphrase))
         except Exception as e:
             logger.error("Failed to recover master secret:", e)
             return None
@@ -342,7 +486,6 @@ class Scheme:
         if not group_threshold:
             raise InvalidSchemeException("Group threshold is not set.")
 
-        logger.info("Passphrase in generate scheme:", self.passphrase)
         if not all(32 <= c <= 126 for c in self.passphrase):
             raise ValueError(
                 "The passphrase must contain only printable ASCII characters (code points 32-126)."
@@ -357,14 +500,17 @@ class Scheme:
             iteration_exponent,
         )
         grouped_shares = split_ems(group_threshold, groups, encrypted_master_secret)
-        groups_dict = {}
-
-        for group_index, group_list in enumerate(grouped_shares):
-            group = groups_dict.setdefault(group_index, ShareGroup())
+        self.recovery_state.clear()
+        for group_list in grouped_shares:
             for share in group_list:
-                group.add(share)
+                self.recovery_state.add_share(share)
+        self.iteration_exponent = iteration_exponent
 
-        self.groups = groups_dict
+        # Both halves of the cipher are already known; no need to decrypt again
+        self._invalidate_recovery_cache()
+        with self._decrypt_lock:
+            self._encrypted_master_secret = encrypted_master_secret
+            self._decrypted_master_secrets[self.passphrase] = master_secret
 
     def set_passphrase(self, passphrase: str):
         """
@@ -414,11 +560,4 @@ class Scheme:
         """
         Checks if the scheme is complete, i.e., threshold number of groups are completed
         """
-        complete_groups = [
-            group for group in self.groups.values() if group.is_complete()
-        ]
-
-        if len(complete_groups) == self.common_params[0].group_threshold:
-            return True
-
-        return False
+        return self.recovery_state.is_complete()
@@ -116,6 +116,16 @@ class SettingsConstants:
         (CAMERA_ROTATION__270, ("Rotation 270°")),
     ]
 
+    # SLIP39 encryption time budget, in seconds; 0 keeps the fixed iteration exponent
+    SLIP39_ENCRYPTION_TIME__FIXED = 0
+    ALL_SLIP39_ENCRYPTION_TIMES = [
+        (SLIP39_ENCRYPTION_TIME__FIXED, ("Fixed")),
+        (2, ("2 Seconds")),
+        (5, ("5 Seconds")),
+        (10, ("10 Seconds")),
+        (30, ("30 Seconds")),
+    ]
+
     # Seed protocols
     SEED_PROTOCOL__BIP39 = "BIP39"
     SEED_PROTOCOL__SLIP39 = "SLIP39"
@@ -163,6 +173,7 @@ class SettingsConstants:
     SETTING__CAMERA_ROTATION = "camera_rotation"
     SETTING__SEED_PROTOCOL = "seed_protocol"
     SETTING__CHOOSE_WORDS = "choose_words"
+    SETTING__SLIP39_ENCRYPTION_TIME = "slip39_encryption_time"
 
     SETTING__DEBUG = "debug"
 
@@ -183,7 +194,7 @@ class SettingsConstants:
         (DISPLAY_CONFIGURATION__ST7789__240x240, "st7789 240x240"),
         (DISPLAY_CONFIGURATION__ST7789__320x240, "st7789 320x240"),
         (DISPLAY_CONFIGURATION__ILI9341__320x240, "ili9341 320x240 (beta)"),
-        # (DISPLAY_CONFIGURATION__ILI9486__320x480, "ili9486 480x320"),  # TODO: Enable when ili9486 driver performance is improved
+        (DISPLAY_CONFIGURATION__ILI9486__480x320, "ili9486 480x320 (beta)"),
     ]
 
     # Hidden settings
@@ -389,6 +400,13 @@ class SettingsDefinition:
             type=SettingsConstants.TYPE__SELECT_1,
             default_value=SettingsConstants.CHOOSE_BIP39_WORDS,
         ),
+        # SLIP39 Encryption Settings
+        SettingsEntry(
+            attr_name=SettingsConstants.SETTING__SLIP39_ENCRYPTION_TIME,
+            type=SettingsConstants.TYPE__SELECT_1,
+            selection_options=SettingsConstants.ALL_SLIP39_ENCRYPTION_TIMES,
+            default_value=SettingsConstants.SLIP39_ENCRYPTION_TIME__FIXED,
+        ),
         # Hardware config
         SettingsEntry(
             attr_name=SettingsConstants.SETTING__COORDINATORS,
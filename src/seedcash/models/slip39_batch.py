@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+"""
+Headless bulk generation of SLIP39 schemes.
+
+Reads scheme definitions, one JSON object per line, and appends the share
+mnemonics of every scheme to one file per recipient on the microSD card:
+
+    python -m seedcash.models.slip39_batch definitions.jsonl
+
+A definition looks like:
+
+    {"label": "vault-1", "group_threshold": 2, "groups": [[2, 3], [1, 1]],
+     "recipients": [["alice", "bob", "carol"], ["escrow"]]}
+
+"recipients" is optional (members are then named "group<g>-share<m>"), as are
+"strength" (128 or 256 bits, default 128), "passphrase" and
+"iteration_exponent". A fresh random master secret is generated for each scheme.
+
+Definitions are read lazily and only a few schemes per worker are in flight at a
+time, so the batch is never held in memory as a whole. The whole file is checked
+before anything is written, and the "schemes.txt" manifest only appears once
+every scheme has been written.
+"""
+
+import argparse
+import json
+import logging
+import os
+import secrets
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Tuple
+
+from seedcash.hardware.microsd import MicroSD
+from seedcash.helper.shamir_mnemonic.constants import MAX_SHARE_COUNT
+from seedcash.models.scheme import InvalidSchemeException, Scheme, SchemeParameters
+
+logger = logging.getLogger(__name__)
+
+
+MANIFEST_FILENAME = "schemes.txt"
+
+
+class SchemeDefinition:
+    """
+    One validated line of the batch input.
+    """
+
+    def __init__(self, definition: dict, line_number: int):
+        self.line_number = line_number
+        self.label: str = str(definition.get("label", f"scheme-{line_number}"))
+        self.group_threshold: int = definition.get("group_threshold", 1)
+        self.groups: List[Tuple[int, int]] = [
+            tuple(group) for group in definition.get("groups", [])
+        ]
+        self.strength: int = definition.get("strength", 128)
+        self.passphrase: str = definition.get("passphrase", "")
+        self.iteration_exponent: int = definition.get("iteration_exponent", 1)
+        self.recipients: List[List[str]] = definition.get("recipients") or [
+            [f"group{g}-share{m}" for m in range(group[1])]
+            for g, group in enumerate(self.groups)
+        ]
+
+        self.validate()
+
+    def validate(self):
+        if not self.groups or not all(len(group) == 2 for group in self.groups):
+            raise InvalidSchemeException(
+                f"Line {self.line_number}: groups must be a list of [threshold, count]"
+            )
+
+        if self.strength not in (128, 256):
+            raise InvalidSchemeException(
+                f"Line {self.line_number}: strength must be 128 or 256"
+            )
+
+        # The same limits the shares are split with, so that a definition can't
+        # fail halfway through a batch
+        if not 1 <= self.group_threshold <= len(self.groups) <= MAX_SHARE_COUNT:
+            raise InvalidSchemeException(
+                f"Line {self.line_number}: group_threshold must be between 1 and "
+                f"the number of groups, of which there can be at most "
+                f"{MAX_SHARE_COUNT}"
+            )
+
+        for threshold, count in self.groups:
+            if not 1 <= threshold <= count <= MAX_SHARE_COUNT or (
+                threshold == 1 and count > 1
+            ):
+                raise InvalidSchemeException(
+                    f"Line {self.line_number}: invalid group [{threshold}, {count}]"
+                )
+
+        if not all(32 <= ord(c) <= 126 for c in self.passphrase):
+            raise InvalidSchemeException(
+                f"Line {self.line_number}: the passphrase must contain only "
+                "printable ASCII characters"
+            )
+
+        if len(self.recipients) != len(self.groups) or any(
+            len(names) != group[1] for names, group in zip(self.recipients, self.groups)
+        ):
+            raise InvalidSchemeException(
+                f"Line {self.line_number}: recipients must match the group sizes"
+            )
+
+        for name in (name for names in self.recipients for name in names):
+            # The microSD card's FAT filesystem ignores case, so e.g. "Schemes" would
+            # also append secret shares to the manifest
+            if (
+                not name
+                or name.startswith(".")
+                or os.sep in name
+                or f"{name}.txt".lower() == MANIFEST_FILENAME.lower()
+            ):
+                raise InvalidSchemeException(
+                    f"Line {self.line_number}: invalid recipient name {name!r}"
+                )
+
+
+def read_definitions(path: str) -> Iterator[SchemeDefinition]:
+    """
+    Yields the scheme definitions of `path` one line at a time.
+    """
+    with open(path) as definitions_file:
+        for line_number, line in enumerate(definitions_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                definition = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise InvalidSchemeException(f"Line {line_number}: {e}")
+            yield SchemeDefinition(definition, line_number)
+
+
+def validate_definitions(path: str) -> int:
+    """
+    Reads all of `path` once, without keeping it, so that a bad line is reported
+    before anything is written.
+
+    :return: The number of definitions.
+    """
+    return sum(1 for _ in read_definitions(path))
+
+
+def generate_scheme(
+    definition: SchemeDefinition,
+) -> Tuple[str, str, List[Tuple[str, int, int, str]]]:
+    """
+    Runs in a worker process: splits a random master secret according to
+    `definition`.
+
+    :return: The label, the wallet fingerprint and a (recipient, group index,
+        member index, mnemonic) entry for every share.
+    """
+    scheme_params = SchemeParameters(secrets.token_bytes(definition.strength // 8))
+    scheme_params.set_groups_length(len(definition.groups))
+    scheme_params.set_group_threshold(definition.group_threshold)
+    for group_index, group in enumerate(definition.groups):
+        scheme_params.update_groups(group_index, group)
+
+    scheme = Scheme(scheme_parameters=scheme_params)
+    scheme.set_passphrase(definition.passphrase)
+    scheme.generate_mnemonics(iteration_exponent=definition.iteration_exponent)
+    scheme.generate_wallet()
+
+    entries = []
+    for group_index, names in enumerate(definition.recipients):
+        for member_index, name in zip(
+            scheme.get_shares_indices_of_group(group_index), names
+        ):
+            mnemonic = " ".join(
+                scheme.get_mnemonics_share_of_group(member_index, group_index)
+            )
+            entries.append((name, group_index, member_index, mnemonic))
+
+    return definition.label, scheme.wallet.fingerprint, entries
+
+
+def _append(path: str, text: str):
+    # Share files are only ever readable by the owner
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    with os.fdopen(fd, "a") as output_file:
+        output_file.write(text)
+
+
+def run_batch(
+    definitions: Iterator[SchemeDefinition], output_dir: str, workers: int = None
+) -> int:
+    """
+    Generates every scheme of `definitions` in a process pool and streams the
+    shares, in input order, to one file per recipient in `output_dir`.
+
+    The manifest is only put in place once every scheme was written, so a batch
+    that failed partway leaves no manifest behind.
+
+    :return: The number of schemes written.
+    """
+    os.makedirs(output_dir, mode=0o700)
+    workers = workers or os.cpu_count() or 1
+    max_pending = 2 * workers
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    partial_manifest_path = manifest_path + ".partial"
+
+    count = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+
+        def write_next():
+            label, fingerprint, entries = pending.popleft().result()
+            for name, group_index, member_index, mnemonic in entries:
+                _append(
+                    os.path.join(output_dir, f"{name}.txt"),
+                    f"{label} ({fingerprint}) group {group_index} share "
+                    f"{member_index}\n{mnemonic}\n\n",
+                )
+            _append(
+                partial_manifest_path,
+                f"{label}\t{fingerprint}\t{len(entries)} shares\n",
+            )
+            logger.info(f"Wrote {len(entries)} shares of {label}")
+
+        for definition in definitions:
+            pending.append(executor.submit(generate_scheme, definition))
+            if len(pending) >= max_pending:
+                write_next()
+                count += 1
+
+        while pending:
+            write_next()
+            count += 1
+
+    if count:
+        os.rename(partial_manifest_path, manifest_path)
+    return count
+
+
+def main(sys_argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate SLIP39 schemes in bulk to the microSD card"
+    )
+    parser.add_argument("definitions", help="JSON Lines file of scheme definitions")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=os.path.join(
+            MicroSD.MOUNT_POINT, time.strftime("slip39_batch_%Y%m%d-%H%M%S")
+        ),
+        help="Directory to create for the recipient files (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: one per CPU)",
+    )
+
+    args = parser.parse_args(sys_argv)
+    logging.basicConfig(level=logging.INFO)
+
+    if not os.path.isdir(os.path.dirname(os.path.abspath(args.output))):
+        raise FileNotFoundError(
+            f"Unable to write to {args.output}. "
+            "Please ensure the SD card is inserted and mounted."
+        )
+
+    try:
+        validate_definitions(args.definitions)
+    except InvalidSchemeException as e:
+        logger.error(f"{args.definitions}: {e}")
+        sys.exit(1)
+
+    count = run_batch(read_definitions(args.definitions), args.output, args.workers)
+    logger.info(f"Generated {count} schemes in {args.output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,4 +1,5 @@
 from typing import List
+from seedcash.helper.shamir_mnemonic.cipher import calibrate_iteration_exponent
 from seedcash.models.wallet import Wallet
 from seedcash.models.seed import Seed, InvalidSeedException
 from seedcash.models.scheme import Scheme, SchemeParameters
@@ -178,7 +179,23 @@ class SeedStorage:
             scheme_parameters=self.scheme_params,
         )
         self.scheme.set_passphrase(self.passphrase)
-        self.scheme.generate_mnemonics()
+
+        time_budget = Settings.get_instance().get_value(
+            SettingsConstants.SETTING__SLIP39_ENCRYPTION_TIME
+        )
+        if time_budget:
+            iteration_exponent, cipher_time = calibrate_iteration_exponent(time_budget)
+            logger.info(
+                "Calibrated iteration exponent %d (~%.1fs) for a %ds budget",
+                iteration_exponent,
+                cipher_time,
+                time_budget,
+            )
+            self.scheme.generate_mnemonics(iteration_exponent=iteration_exponent)
+            self.scheme.cipher_time_estimate = cipher_time
+        else:
+            self.scheme.generate_mnemonics()
+
         self.scheme.generate_wallet()
         logger.info("Scheme generated with parameters: %s", self.scheme_params)
 
@@ -253,19 +253,71 @@ class VisualSharesView(View):
         if result[0] == "PASSPHRASE":
             return Destination(SchemeAddPassphraseView)
 
-        if self.is_single_level:
+        if self.is_single_level or (
+            self.controller.storage.scheme_params.scheme_is_complete()
+        ):
             self.controller.storage.generate_scheme_with_params()
-            return Destination(
-                ListOfSharesView, view_args={"group_index": 0, "is_single_level": True}
-            )
-
-        if self.controller.storage.scheme_params.scheme_is_complete():
-            self.controller.storage.generate_scheme_with_params()
-            return Destination(ListOfGroupsView, view_args={"is_view_mode": True})
+            if self.controller.storage._scheme.cipher_time_estimate is not None:
+                return Destination(
+                    SchemeEncryptionInfoView,
+                    view_args={"is_single_level": self.is_single_level},
+                )
+            return shares_destination(self.is_single_level)
 
         return Destination(ListOfGroupsView, view_args={"is_view_mode": False})
 
 
+def shares_destination(
+    is_single_level: bool, skip_current_view: bool = False
+) -> Destination:
+    """
+    Where to go once a scheme has been generated from its parameters.
+    """
+    if is_single_level:
+        return Destination(
+            ListOfSharesView,
+            view_args={"group_index": 0, "is_single_level": True},
+            skip_current_view=skip_current_view,
+        )
+    return Destination(
+        ListOfGroupsView,
+        view_args={"is_view_mode": True},
+        skip_current_view=skip_current_view,
+    )
+
+
+class SchemeEncryptionInfoView(View):
+    """
+    Shows the iteration exponent calibrated for this device and how long recovering
+    the shares is expected to take.
+    """
+
+    def __init__(self, is_single_level: bool = False):
+        super().__init__()
+        self.is_single_level = is_single_level
+
+    def run(self):
+        from seedcash.gui.components import GUIConstants, SeedCashIconsConstants
+        from seedcash.gui.screens.screen import LargeIconStatusScreen
+
+        scheme = self.controller.storage._scheme
+        self.run_screen(
+            LargeIconStatusScreen,
+            title="Encryption",
+            show_back_button=False,
+            status_icon_name=SeedCashIconsConstants.INFO,
+            status_color=GUIConstants.INFO_COLOR,
+            status_headline=f"Iteration exponent {scheme.iteration_exponent}",
+            text=(
+                "Recovering these shares takes about "
+                f"{scheme.cipher_time_estimate:.1f}s on this device."
+            ),
+            button_data=[ButtonOption("Continue")],
+        )
+
+        return shares_destination(self.is_single_level, skip_current_view=True)
+
+
 class ListOfSharesView(View):
     """
     View to display the list of shares.
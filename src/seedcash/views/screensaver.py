@@ -1,8 +1,10 @@
 import logging
+import threading
 import time
 
 from dataclasses import dataclass
 from gettext import gettext as _
+from typing import List
 
 from seedcash.gui.components import load_image
 from seedcash.gui.screens.screen import BaseScreen
@@ -75,6 +77,13 @@ class OpeningSplashScreen(LogoScreen):
 
 
 class ScreensaverScreen(LogoScreen):
+    # Frame rate cap; the logo drifts slowly enough for this to look smooth
+    FRAME_RATE = 15
+
+    # How far the logo moves per frame, in pixels
+    STEP_X = 2
+    STEP_Y = 1
+
     def __init__(self, buttons):
         from PIL import Image
 
@@ -82,43 +91,59 @@ class ScreensaverScreen(LogoScreen):
 
         self.buttons = buttons
 
-        # Paste the logo in a bigger image that is the canvas + the logo dims (half the
-        # logo will render off the canvas at each edge).
-        self.logo_image = Image.new(
+        # Only the logo's visible part is drawn each frame, with a black margin as
+        # wide as one step around it that erases where it was in the last frame.
+        bbox = self.logo.getbbox() or (0, 0, self.logo.width, self.logo.height)
+        margin = max(self.STEP_X, self.STEP_Y)
+        self.sprite = Image.new(
             "RGB",
-            (
-                self.renderer.canvas_width + self.logo.width,
-                self.renderer.canvas_height + self.logo.height,
-            ),
+            (bbox[2] - bbox[0] + 2 * margin, bbox[3] - bbox[1] + 2 * margin),
             (0, 0, 0),
         )
-
-        # paste image
-        self.image = self.logo_image
-
-        # Place the logo centered on the larger image
-        self.logo_x = int((self.image.width - self.logo.width) / 2)
-        self.logo_y = int((self.image.height - self.logo.height) / 2)
-        self.image.paste(self.logo, (self.logo_x, self.logo_y))
-
-        # Update our first rendering position so we're centered
-        self.cur_x = int(self.logo.width / 2)
-        self.cur_y = int(self.logo.height / 2)
+        self.sprite.paste(self.logo.crop(bbox), (margin, margin))
+
+        # Precompute the motion: the logo bounces around until up to half of it is
+        # off the canvas at each edge. x and y have periods of their own.
+        left = int(self.renderer.canvas_width / 2) - self.logo.width + bbox[0] - margin
+        top = int(self.renderer.canvas_height / 2) - self.logo.height + bbox[1] - margin
+        self.path_x = self._bounce(left, left + self.logo.width, self.STEP_X)
+        self.path_y = self._bounce(top, top + self.logo.height, self.STEP_Y)
+
+        # Start with the logo centered on the canvas, like the splash screen
+        self.start_frame = (
+            int(self.logo.width / 2) // self.STEP_X,
+            int(self.logo.height / 2) // self.STEP_Y,
+        )
 
         self._is_running = False
+        self._wake = threading.Event()
         self.last_screen = None
 
+    @staticmethod
+    def _bounce(low: int, high: int, step: int) -> List[int]:
+        """
+        Positions for one cycle of moving from `low` to `high` and back by `step`.
+        """
+        forward = list(range(low, high, step))
+        return forward + [low + high - x for x in forward]
+
     @property
     def is_running(self):
         return self._is_running
 
     def start(self):
+        from seedcash.controller import Controller
+
         if self.is_running:
             return
 
         self.start_time = time.time()
+        sleep_time = (
+            self.start_time + Controller.get_instance().screensaver_sleep_ms / 1000
+        )
 
         self._is_running = True
+        self._wake.clear()
 
         # Store the current screen in order to restore it later
         self.last_screen = self.renderer.canvas.copy()
@@ -127,21 +152,39 @@ class ScreensaverScreen(LogoScreen):
         # never gives up the lock until it returns.
         with self.renderer.lock:
             try:
+                canvas = self.renderer.canvas
+                canvas.paste((0, 0, 0), (0, 0, canvas.width, canvas.height))
+                self.renderer.show_image()
+
+                frame_x, frame_y = self.start_frame
+                frame_interval = 1 / self.FRAME_RATE
+                next_frame = time.monotonic()
                 while self._is_running:
                     if self.buttons.has_any_input() or self.buttons.override_ind:
                         break
 
-                    self.image = self.logo_image
-                    # Must crop the image to the exact display size
-                    crop = self.image.crop(
-                        (
-                            self.cur_x,
-                            self.cur_y,
-                            self.cur_x + self.renderer.canvas_width,
-                            self.cur_y + self.renderer.canvas_height,
-                        )
+                    if time.time() >= sleep_time:
+                        self._sleep_display()
+                        break
+
+                    x = self.path_x[frame_x % len(self.path_x)]
+                    y = self.path_y[frame_y % len(self.path_y)]
+                    frame_x += 1
+                    frame_y += 1
+
+                    canvas.paste(self.sprite, (x, y))
+                    self.renderer.show_image(
+                        region=(x, y, x + self.sprite.width, y + self.sprite.height)
                     )
-                    self.renderer.disp.show_image(crop, 0, 0)
+
+                    # Sleep until the next frame is due; stop() cuts that short
+                    next_frame += frame_interval
+                    delay = next_frame - time.monotonic()
+                    if delay <= 0:
+                        # Running behind; carry on from now rather than catch up
+                        next_frame = time.monotonic()
+                    elif self._wake.wait(delay):
+                        break
 
             except KeyboardInterrupt as e:
                 # Exit triggered; close gracefully
@@ -154,5 +197,19 @@ class ScreensaverScreen(LogoScreen):
                 self._is_running = False
                 self.renderer.show_image(self.last_screen)
 
+    def _sleep_display(self):
+        """
+        Turn the display and backlight off until the next button press (or `stop()`).
+        """
+        logger.info("Screensaver: putting the display to sleep")
+        self.renderer.writer.flush()
+        self.renderer.disp.sleep_mode(True)
+        try:
+            self.buttons.wait_for_any_input(self._wake)
+        finally:
+            self.renderer.disp.sleep_mode(False)
+            logger.info("Screensaver: display woken up")
+
     def stop(self):
         self._is_running = False
+        self._wake.set()
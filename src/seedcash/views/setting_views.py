@@ -27,6 +27,7 @@ class SettingOptionsView(View):
     TEST_BUTTONS = ButtonOption("Test Buttons")
     TEST_CAMERA = ButtonOption("Test Camera")
     CAMERA_ROTATION = ButtonOption("Camera Rotation")
+    SLIP39_ENCRYPTION_TIME = ButtonOption("SLIP39 Encryption Time")
 
     def __init__(self):
         super().__init__()
@@ -40,6 +41,7 @@ class SettingOptionsView(View):
             self.TEST_BUTTONS,
             self.TEST_CAMERA,
             self.CAMERA_ROTATION,
+            self.SLIP39_ENCRYPTION_TIME,
         ]
 
         selected_menu_num = self.run_screen(
@@ -63,6 +65,8 @@ class SettingOptionsView(View):
             return Destination(ScanView)
         elif button_data[selected_menu_num] == self.CAMERA_ROTATION:
             return Destination(CameraRotationOptionsView)
+        elif button_data[selected_menu_num] == self.SLIP39_ENCRYPTION_TIME:
+            return Destination(Slip39EncryptionTimeOptionsView)
 
 
 class SettingLanguageView(View):
@@ -223,3 +227,43 @@ class CameraRotationOptionsView(View):
                 SettingsConstants.SETTING__CAMERA_ROTATION, selected_rotation
             )
             return Destination(BackStackView)
+
+
+class Slip39EncryptionTimeOptionsView(View):
+    def __init__(self):
+        super().__init__()
+
+        # Get Button Options for the SLIP39 encryption time budget
+        self.encryption_times = [
+            ButtonOption(encryption_time[1])
+            for encryption_time in SettingsConstants.ALL_SLIP39_ENCRYPTION_TIMES
+        ]
+
+    def run(self):
+
+        button_data = self.encryption_times
+        selected_btn = [
+            encryption_time[0]
+            for encryption_time in SettingsConstants.ALL_SLIP39_ENCRYPTION_TIMES
+        ].index(
+            self.controller.settings.get_value(
+                SettingsConstants.SETTING__SLIP39_ENCRYPTION_TIME
+            )
+        )
+
+        selected_menu_num = self.run_screen(
+            SeedCashButtonListWithNav,
+            title="Encryption Time",
+            button_data=button_data,
+            selected_button=selected_btn,
+        )
+        if selected_menu_num == RET_CODE__BACK_BUTTON:
+            return Destination(BackStackView)
+        elif button_data[selected_menu_num] in self.encryption_times:
+            selected_time = SettingsConstants.ALL_SLIP39_ENCRYPTION_TIMES[
+                selected_menu_num
+            ][0]
+            self.controller.settings.set_value(
+                SettingsConstants.SETTING__SLIP39_ENCRYPTION_TIME, selected_time
+            )
+            return Destination(BackStackView)